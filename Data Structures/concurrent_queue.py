@@ -0,0 +1,421 @@
+"""
+Bounded thread-safe queue with blocking, timeouts and batch operations,
+plus an asyncio version with the same methods.
+
+Queue in queue.py is not safe to share between threads: one thread can see
+is_empty() return False, then another thread takes the last item before
+the first one calls dequeue(). A concurrent queue does the check and the
+removal while holding a lock, so no other thread can run in between.
+
+A bounded queue also gives backpressure: when consumers fall behind, the
+queue fills up and put() makes producers wait instead of letting the
+queue grow without limit.
+
+Locking costs time on every call. put_many and get_many move a whole batch
+while holding the lock once, which is what makes high-throughput
+producer/consumer pipelines fast in Python.
+
+This lives in its own file rather than in queue.py: standard modules such
+as concurrent.futures import Python's own queue module, and a script run
+from this folder would find queue.py first.
+
+Time Complexity: O(1) per item, plus one lock round trip per call
+Space Complexity: O(capacity)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class Empty(Exception):
+    """Raised by get when no item arrives before the timeout (or block=False)."""
+
+
+class Full(Exception):
+    """Raised by put when no room frees up before the timeout (or block=False)."""
+
+
+class ConcurrentQueue:
+    """
+    A bounded FIFO queue that many threads can use at once.
+
+    One lock protects the items. Two condition variables let threads sleep
+    until there is something to do: consumers wait on not_empty, producers
+    wait on not_full.
+
+    Time Complexity:
+        - put / get: O(1)
+        - put_many / get_many: O(k) for k items, one lock round trip per batch
+
+    Space Complexity: O(capacity)
+    """
+
+    def __init__(self, capacity):
+        """
+        Initialize an empty queue.
+
+        Args:
+            capacity (int): Maximum number of items held at once
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.capacity = capacity
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)  # Signalled after items are added
+        self._not_full = threading.Condition(self._lock)  # Signalled after items are removed
+
+    def __len__(self):
+        """Return the number of items (may change right after). Time Complexity: O(1)"""
+        return len(self._items)
+
+    def _wait(self, condition, ready, block, timeout, error):
+        """
+        Wait on condition until ready() is true. Call with the lock held.
+
+        Raises error if block is False or the timeout runs out first.
+        """
+        if ready():
+            return
+        if not block:
+            raise error
+        # wait_for re-checks ready() after every wake-up, so spurious
+        # wake-ups and other threads getting there first are handled
+        if not condition.wait_for(ready, timeout):
+            raise error
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Add an item to the back of the queue, waiting for room if it is full.
+
+        Args:
+            item: The item to add
+            block (bool): Wait for room (default: True); if False, fail at once
+            timeout (float): Longest wait in seconds (default: None, wait forever)
+
+        Raises:
+            Full: If there is still no room after the wait
+
+        Time Complexity: O(1)
+        """
+        with self._lock:
+            self._wait(self._not_full, lambda: len(self._items) < self.capacity,
+                       block, timeout, Full("Queue is full"))
+            self._items.append(item)
+            self._not_empty.notify()  # Wake one waiting consumer
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front, waiting if the queue is empty.
+
+        Args:
+            block (bool): Wait for an item (default: True); if False, fail at once
+            timeout (float): Longest wait in seconds (default: None, wait forever)
+
+        Returns:
+            The front item
+
+        Raises:
+            Empty: If there is still no item after the wait
+
+        Time Complexity: O(1)
+        """
+        with self._lock:
+            self._wait(self._not_empty, lambda: len(self._items) > 0,
+                       block, timeout, Empty("Queue is empty"))
+            item = self._items.popleft()
+            self._not_full.notify()  # Wake one waiting producer
+            return item
+
+    def put_many(self, items, timeout=None):
+        """
+        Add many items, taking the lock once for every batch that fits.
+
+        If the queue is full, waits for consumers to make room and then adds
+        as many items as fit, until all are added or the timeout runs out.
+
+        Args:
+            items (iterable): The items to add, in order
+            timeout (float): Longest total wait in seconds (default: None, wait forever)
+
+        Returns:
+            int: Number of items added (fewer than given only if the timeout ran out)
+
+        Time Complexity: O(k) for k items
+        """
+        items = items if isinstance(items, list) else list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        added = 0
+
+        with self._lock:
+            while added < len(items):
+                room = self.capacity - len(self._items)
+                if room == 0:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._not_full.wait(remaining)
+                    continue
+
+                batch = items[added:added + room]
+                self._items.extend(batch)
+                added += len(batch)
+                self._not_empty.notify(len(batch))  # Enough wake-ups for every new item
+
+        return added
+
+    def get_many(self, max_items, timeout=None):
+        """
+        Remove up to max_items items at once, waiting only for the first one.
+
+        Args:
+            max_items (int): Most items to return
+            timeout (float): Longest wait for the first item (default: None, wait forever)
+
+        Returns:
+            list: Between 1 and max_items items, or [] if the timeout ran out
+
+        Raises:
+            ValueError: If max_items is less than 1
+
+        Time Complexity: O(k) for k items returned
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be at least 1")
+
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: len(self._items) > 0, timeout):
+                return []
+            count = min(max_items, len(self._items))
+            popleft = self._items.popleft
+            batch = [popleft() for _ in range(count)]
+            self._not_full.notify(count)  # Room for count more items
+            return batch
+
+
+class AsyncQueue:
+    """
+    The asyncio version of ConcurrentQueue, for coroutines in one event loop.
+
+    Methods have the same names and arguments but must be awaited. Waiting
+    suspends only the coroutine, so the event loop keeps running other tasks.
+
+    Time Complexity:
+        - put / get: O(1)
+        - put_many / get_many: O(k) for k items
+
+    Space Complexity: O(capacity)
+    """
+
+    def __init__(self, capacity):
+        """
+        Initialize an empty queue.
+
+        Args:
+            capacity (int): Maximum number of items held at once
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.capacity = capacity
+        self._items = deque()
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    def __len__(self):
+        """Return the number of items. Time Complexity: O(1)"""
+        return len(self._items)
+
+    async def _wait(self, condition, ready, block, timeout, error):
+        """Wait on condition until ready() is true. Call with the lock held."""
+        if ready():
+            return
+        if not block:
+            raise error
+        try:
+            await asyncio.wait_for(condition.wait_for(ready), timeout)
+        except asyncio.TimeoutError:
+            raise error from None
+
+    async def put(self, item, block=True, timeout=None):
+        """
+        Add an item to the back of the queue, waiting for room if it is full.
+
+        Raises:
+            Full: If there is still no room after the wait
+
+        Time Complexity: O(1)
+        """
+        async with self._lock:
+            await self._wait(self._not_full, lambda: len(self._items) < self.capacity,
+                             block, timeout, Full("Queue is full"))
+            self._items.append(item)
+            self._not_empty.notify()
+
+    async def get(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front, waiting if the queue is empty.
+
+        Raises:
+            Empty: If there is still no item after the wait
+
+        Time Complexity: O(1)
+        """
+        async with self._lock:
+            await self._wait(self._not_empty, lambda: len(self._items) > 0,
+                             block, timeout, Empty("Queue is empty"))
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    async def put_many(self, items, timeout=None):
+        """
+        Add many items, filling the queue a batch at a time.
+
+        Returns:
+            int: Number of items added (fewer than given only if the timeout ran out)
+
+        Time Complexity: O(k) for k items
+        """
+        items = items if isinstance(items, list) else list(items)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        added = 0
+
+        async with self._lock:
+            while added < len(items):
+                room = self.capacity - len(self._items)
+                if room == 0:
+                    remaining = None if deadline is None else deadline - loop.time()
+                    try:
+                        await asyncio.wait_for(
+                            self._not_full.wait_for(lambda: len(self._items) < self.capacity),
+                            remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    continue
+
+                batch = items[added:added + room]
+                self._items.extend(batch)
+                added += len(batch)
+                self._not_empty.notify(len(batch))
+
+        return added
+
+    async def get_many(self, max_items, timeout=None):
+        """
+        Remove up to max_items items at once, waiting only for the first one.
+
+        Returns:
+            list: Between 1 and max_items items, or [] if the timeout ran out
+
+        Raises:
+            ValueError: If max_items is less than 1
+
+        Time Complexity: O(k) for k items returned
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be at least 1")
+
+        async with self._lock:
+            try:
+                await self._wait(self._not_empty, lambda: len(self._items) > 0,
+                                 True, timeout, Empty("Queue is empty"))
+            except Empty:
+                return []
+            count = min(max_items, len(self._items))
+            popleft = self._items.popleft
+            batch = [popleft() for _ in range(count)]
+            self._not_full.notify(count)
+            return batch
+
+
+# Test
+if __name__ == "__main__":
+    q = ConcurrentQueue(capacity=2)
+    q.put("a")
+    q.put("b")
+    try:
+        q.put("c", timeout=0.05)  # Full: waits 50 ms, then gives up
+    except Full as e:
+        print("put timed out:", e)
+    print("get_many(10):", q.get_many(10))
+    try:
+        q.get(block=False)
+    except Empty as e:
+        print("get on empty queue:", e)
+
+    # Producer/consumer throughput: one item per lock round trip vs batches
+    n = 200000
+    done = object()  # Sentinel telling the consumer to stop
+
+    def run(batch_size):
+        q = ConcurrentQueue(capacity=1024)
+        received = []
+
+        def producer():
+            if batch_size == 1:
+                for i in range(n):
+                    q.put(i)
+            else:
+                for start in range(0, n, batch_size):
+                    q.put_many(range(start, min(start + batch_size, n)))
+            q.put(done)
+
+        def consumer():
+            while True:
+                batch = [q.get()] if batch_size == 1 else q.get_many(batch_size)
+                if batch[-1] is done:
+                    received.extend(batch[:-1])
+                    return
+                received.extend(batch)
+
+        threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"  batch size {batch_size:>4}: {n / elapsed:>12,.0f} items/s  "
+              f"in order: {received == list(range(n))}")
+
+    print(f"\nMoving {n:,} items between two threads:")
+    for batch_size in (1, 64, 512):
+        run(batch_size)
+
+    # The asyncio version
+    async def pipeline():
+        aq = AsyncQueue(capacity=100)
+
+        async def producer():
+            for start in range(0, 1000, 50):
+                await aq.put_many(range(start, start + 50))
+            await aq.put(None)
+
+        async def consumer():
+            total = 0
+            while True:
+                batch = await aq.get_many(64)
+                if batch[-1] is None:
+                    return total + sum(batch[:-1])
+                total += sum(batch)
+
+        _, total = await asyncio.gather(producer(), consumer())
+        print(f"\nAsyncQueue pipeline sum: {total} (expected {sum(range(1000))})")
+        try:
+            await aq.get(timeout=0.01)
+        except Empty as e:
+            print("AsyncQueue get timed out:", e)
+
+    asyncio.run(pipeline())
@@ -105,6 +105,113 @@ def safe_dict_set(dictionary, key, value):
         raise TypeError(f"Key must be hashable, got {type(key).__name__}")
 
 
+def _describe_unhashable(keys):
+    """Return 'index i (type)' for every key in keys that cannot be hashed."""
+    failures = []
+    for index, key in enumerate(keys):
+        try:
+            hash(key)
+        except TypeError:
+            failures.append(f"index {index} ({type(key).__name__})")
+    return failures
+
+
+def safe_dict_get_many(dictionary, keys, default=None):
+    """
+    Safely retrieve the values of many keys at once.
+
+    safe_dict_get checks its arguments on every call, which can cost more
+    than the lookup itself. This version checks the dictionary once and
+    runs all lookups in a single try block. Only if a lookup fails are the
+    keys scanned again, to report every unhashable key in one error.
+
+    Args:
+        dictionary (dict): The dictionary to read
+        keys (iterable): The keys to look up
+        default: Value used for keys that are not found (default: None)
+
+    Returns:
+        list: The value (or default) for each key, in the same order
+
+    Raises:
+        TypeError: If dictionary is not a dict, or any keys are unhashable
+            (the message lists all of them)
+
+    Time Complexity: O(k) for k keys
+    Space Complexity: O(k)
+
+    Examples:
+        >>> safe_dict_get_many({"x": 1, "y": 2}, ["y", "z", "x"], default=0)
+        [2, 0, 1]
+    """
+    if not isinstance(dictionary, dict):
+        raise TypeError("First argument must be a dictionary")
+
+    keys = keys if isinstance(keys, list) else list(keys)
+    get = dictionary.get
+    try:
+        return [get(key, default) for key in keys]
+    except TypeError:
+        failures = _describe_unhashable(keys)
+        if not failures:
+            raise  # Every key hashes, so the error came from elsewhere (e.g. __eq__)
+        raise TypeError(f"{len(failures)} key(s) are not hashable: {', '.join(failures)}") from None
+
+
+def safe_dict_update_many(dictionary, pairs):
+    """
+    Safely set many key-value pairs at once, all or nothing.
+
+    The pairs are first collected into a new dict in one step. If that
+    fails, every bad pair is reported in a single error and dictionary is
+    left unchanged; otherwise it is updated in one call.
+
+    Args:
+        dictionary (dict): The dictionary to modify
+        pairs: A dict, or an iterable of (key, value) pairs
+
+    Raises:
+        TypeError: If dictionary is not a dict, or any pair is not a
+            (key, value) pair with a hashable key (the message lists all of them)
+
+    Time Complexity: O(k) for k pairs
+    Space Complexity: O(k)
+
+    Examples:
+        >>> d = {"x": 1}
+        >>> safe_dict_update_many(d, [("y", 2), ("x", 3)])
+        >>> d
+        {'x': 3, 'y': 2}
+    """
+    if not isinstance(dictionary, dict):
+        raise TypeError("First argument must be a dictionary")
+
+    if isinstance(pairs, dict):
+        dictionary.update(pairs)  # Keys of a dict are already hashable
+        return
+
+    pairs = pairs if isinstance(pairs, list) else list(pairs)
+    try:
+        updates = dict(pairs)
+    except (TypeError, ValueError):
+        failures = []
+        for index, pair in enumerate(pairs):
+            try:
+                key, _ = pair
+            except (TypeError, ValueError):
+                failures.append(f"index {index} (not a key-value pair)")
+                continue
+            try:
+                hash(key)
+            except TypeError:
+                failures.append(f"index {index} ({type(key).__name__})")
+        if not failures:
+            raise  # Every pair is fine, so the error came from elsewhere (e.g. __eq__)
+        raise TypeError(f"{len(failures)} pair(s) could not be set: {', '.join(failures)}") from None
+
+    dictionary.update(updates)
+
+
 # Demonstrate dictionary operations
 if __name__ == "__main__":
     demonstrate_dictionary_operations()
@@ -113,3 +220,42 @@ if __name__ == "__main__":
     test_dict = {"x": 10, "y": 20}
     print("Value for 'x':", safe_dict_get(test_dict, "x"))
     print("Value for 'z' (not exists):", safe_dict_get(test_dict, "z", default="Not Found"))
+
+    print("\n=== Batch Dictionary Operations ===")
+    print("get_many:", safe_dict_get_many(test_dict, ["x", "z", "y"], default=0))
+    safe_dict_update_many(test_dict, [("z", 30), ("w", 40)])
+    print("After update_many:", test_dict)
+    try:
+        safe_dict_update_many(test_dict, [("ok", 1), (["bad"], 2), "oops", ({}, 3)])
+    except TypeError as e:
+        print("All failures at once:", e)
+    print("Unchanged after the failed batch:", test_dict)
+
+    # Micro-benchmark: per-key cost of the scalar helpers vs the batch helpers
+    import time
+
+    n = 200000
+    data = {i: i * i for i in range(n)}
+    keys = list(range(0, 2 * n, 2))  # Half of them are missing
+    pairs = [(i, i) for i in range(n)]
+
+    start = time.perf_counter()
+    one_by_one = [safe_dict_get(data, key) for key in keys]
+    scalar_get = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = safe_dict_get_many(data, keys)
+    batch_get = time.perf_counter() - start
+
+    target = {}
+    start = time.perf_counter()
+    for key, value in pairs:
+        safe_dict_set(target, key, value)
+    scalar_set = time.perf_counter() - start
+    target = {}
+    start = time.perf_counter()
+    safe_dict_update_many(target, pairs)
+    batch_set = time.perf_counter() - start
+
+    print(f"\nPer key over {n:,} keys (same results: {one_by_one == batched}):")
+    print(f"  safe_dict_get {scalar_get / n * 1e9:6.1f} ns   safe_dict_get_many    {batch_get / n * 1e9:6.1f} ns")
+    print(f"  safe_dict_set {scalar_set / n * 1e9:6.1f} ns   safe_dict_update_many {batch_set / n * 1e9:6.1f} ns")
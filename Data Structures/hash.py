@@ -1,3 +1,13 @@
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; hash_many falls back to pure Python
+    np = None
+
+
 def simple_hash(key, table_size=100):
     """
     A simple hash function that computes hash value based on character values.
@@ -67,18 +77,489 @@ def simple_hash_alternative(key, table_size=100):
     return sum(ord(char) for char in key) % table_size
 
 
+# Hashes are stored modulo 2^64 so a table can resize without rehashing keys
+HASH_MODULUS = 2 ** 64
+_MASK64 = HASH_MODULUS - 1
+
+
+# Largest table size for which h * 31 + ord(char) still fits in an unsigned
+# 64-bit NumPy integer (the biggest code point is 0x10FFFF)
+_NUMPY_MAX_TABLE_SIZE = (2 ** 64 - 0x110000) // 31
+
+
+def hash_many(keys, table_size=100):
+    """
+    Compute simple_hash for many keys at once and return their bucket ids.
+
+    simple_hash walks one key at a time, one character at a time, in Python.
+    hash_many validates the whole batch once, then (when NumPy is installed)
+    encodes every key into one shared buffer of character codes and runs
+    the same polynomial rolling hash on many keys in parallel. Keys are
+    grouped by length; each group becomes a 2D array with one key per row,
+    and Horner's rule is applied one column at a time, so the Python loop
+    runs once per character position instead of once per character.
+
+    Since (a * 31 + c) % m only depends on a % m, the modulo can be skipped
+    for as many steps as the values still fit in 64 bits, and the result is
+    still identical to reducing after every character.
+
+    Args:
+        keys (iterable of str): The string keys to hash
+        table_size (int): The size of the hash table (default: 100)
+
+    Returns:
+        numpy.ndarray or array.array: Unsigned 64-bit bucket ids, one per key,
+        equal to [simple_hash(key, table_size) for key in keys]. A NumPy
+        uint64 array is returned when NumPy is available (and table_size
+        is below about 2**59), otherwise an array.array('Q').
+
+    Raises:
+        TypeError: If any key is not a string
+        ValueError: If any key is empty, or table_size is not in [1, 2**64]
+
+    Time Complexity: O(total characters)
+    Space Complexity: O(total characters) for the encoded buffer
+
+    Examples:
+        >>> hash_many(["Alice", "James"]).tolist()
+        [68, 76]
+    """
+    keys = keys if isinstance(keys, list) else list(keys)
+
+    # join() checks every element is a string in C, far faster than isinstance per key
+    try:
+        joined = "".join(keys)
+    except TypeError:
+        raise TypeError("Keys must be strings")
+
+    if table_size <= 0:
+        raise ValueError("Table size must be positive")
+
+    if table_size > HASH_MODULUS:
+        raise ValueError("Table size must be at most 2**64")  # Bucket ids must fit in 64 bits
+
+    if np is None or table_size > _NUMPY_MAX_TABLE_SIZE:
+        # Pure Python fallback: same loop as simple_hash, validated only once
+        buckets = []
+        for key in keys:
+            if not key:
+                raise ValueError("Keys cannot be empty")
+            hash_value = 0
+            for char in key:
+                hash_value = (hash_value * 31 + ord(char)) % table_size
+            buckets.append(hash_value)
+        return array("Q", buckets)
+
+    count = len(keys)
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=count)
+    if count == 0:
+        return np.zeros(0, dtype=np.uint64)
+    if lengths.min() == 0:
+        raise ValueError("Keys cannot be empty")
+
+    # One byte per character when possible, otherwise UTF-32 (4 bytes, exactly ord(char))
+    try:
+        codes = np.frombuffer(joined.encode("latin-1"), dtype=np.uint8)
+        largest_code = 0xFF
+    except UnicodeEncodeError:
+        codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        largest_code = 0x10FFFF
+    starts = np.cumsum(lengths) - lengths
+
+    # How many Horner steps can run before the value might overflow 64 bits
+    steps_per_mod = 1
+    while (table_size - 1) * 31 ** (steps_per_mod + 1) + largest_code * 31 ** (steps_per_mod + 1) < 2 ** 64:
+        steps_per_mod += 1
+
+    modulus = np.uint64(table_size)
+    multiplier = np.uint64(31)
+    buckets = np.empty(count, dtype=np.uint64)
+
+    # Group key indices by length (a stable sort of small integers is a radix sort)
+    longest = int(lengths.max())
+    order = np.argsort(lengths.astype(np.uint16) if longest < 2 ** 16 else lengths, kind="stable")
+    group_ends = np.cumsum(np.bincount(lengths, minlength=longest + 1))
+
+    group_start = 0
+    for length in range(1, longest + 1):
+        group_end = int(group_ends[length])
+        if group_end == group_start:
+            continue
+        if group_end - group_start == count:
+            rows = codes.reshape(count, length)  # Every key has this length: no copying
+            members = None
+        else:
+            members = order[group_start:group_end]
+            rows = codes[starts[members][:, None] + np.arange(length)]
+
+        hashes = np.zeros(len(rows), dtype=np.uint64)
+        for position in range(length):
+            hashes *= multiplier
+            hashes += rows[:, position]
+            if (position + 1) % steps_per_mod == 0 or position == length - 1:
+                hashes %= modulus
+
+        if members is None:
+            buckets = hashes
+        else:
+            buckets[members] = hashes
+        group_start = group_end
+
+    return buckets
+
+
+def polynomial_hash64(key):
+    """
+    Polynomial rolling hash of a string, kept as a full 64-bit value.
+
+    This is simple_hash with a table size of 2^64. Keeping the whole value
+    (instead of reducing it to one table size) lets a hash table grow and
+    shrink by masking off different numbers of low bits.
+
+    Args:
+        key (str): The string key to hash
+
+    Returns:
+        int: Hash value in range [0, 2^64 - 1]
+
+    Time Complexity: O(n) where n is the length of the key
+    Space Complexity: O(1)
+    """
+    return simple_hash(key, HASH_MODULUS)
+
+
+# Sentinels marking never-used slots and deleted slots (tombstones)
+_EMPTY = object()
+_DELETED = object()
+
+
+class HashTable:
+    """
+    A hash table using open addressing with linear probing.
+
+    Every entry lives directly in one of three parallel, preallocated arrays:
+    keys, values, and the full 64-bit hash of each key. When two keys want
+    the same slot, the second one walks forward ("probes") to the next free
+    slot. Deleted slots are marked with a tombstone so that later lookups
+    keep probing past them instead of stopping early.
+
+    The table doubles when it gets too full (counting tombstones) and halves
+    when it gets too empty, so memory stays proportional to the entries held.
+
+    Time Complexity (Average Case):
+        - insert / lookup / delete: O(1)
+        - resize: O(capacity), amortised O(1) per insert
+
+    Time Complexity (Worst Case):
+        - insert / lookup / delete: O(n) - when many keys share one probe run
+
+    Space Complexity: O(capacity), with capacity <= 2 * n / min_load
+    """
+
+    def __init__(self, capacity=8, hash_function=polynomial_hash64,
+                 max_load=0.7, min_load=0.2):
+        """
+        Initialize an empty hash table.
+
+        Args:
+            capacity (int): Initial number of slots, rounded up to a power of two (default: 8)
+            hash_function (callable): Maps a key to an int. The default only accepts
+                strings; pass the built-in hash for any hashable key.
+            max_load (float): Grow once (entries + tombstones) / capacity exceeds this (default: 0.7)
+            min_load (float): Shrink once entries / capacity falls below this (default: 0.2)
+
+        Raises:
+            TypeError: If capacity is not an integer or hash_function is not callable
+            ValueError: If capacity is not positive or the load factors are invalid
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("Capacity must be an integer")
+
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        if not callable(hash_function):
+            raise TypeError("Hash function must be callable")
+
+        # Shrinking halves the capacity and doubles the load, so min_load must
+        # stay below max_load / 2 or the table would shrink and grow forever
+        if not 0 < max_load < 1 or not 0 <= min_load < max_load / 2:
+            raise ValueError("Load factors must satisfy 0 <= min_load < max_load / 2 < 0.5")
+
+        self._hash_function = hash_function
+        self._max_load = max_load
+        self._min_load = min_load
+
+        # Round up to a power of two so "hash % capacity" becomes "hash & mask"
+        self._min_capacity = 1 << max(capacity - 1, 1).bit_length()
+        self._allocate(self._min_capacity)
+
+    def _allocate(self, capacity):
+        """Replace the slot arrays with empty ones of the given capacity."""
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._hashes = array("Q", bytes(8 * capacity))  # Unboxed 8 bytes per slot
+        self._mask = capacity - 1
+        self._size = 0
+        self._tombstones = 0
+
+    def _hash(self, key):
+        """
+        Return the key's hash as a well-mixed unsigned 64-bit value.
+
+        The slot index is taken from the low bits of the hash. Polynomial
+        hashes of similar keys ("key1", "key2", ...) differ mostly in those
+        low bits by small steps, which makes linear probing build long runs.
+        Mixing (the MurmurHash3 finaliser) spreads every input bit across
+        the whole value so neighbouring keys land far apart.
+        """
+        h = self._hash_function(key) & _MASK64
+        h ^= h >> 33
+        h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+        h ^= h >> 33
+        return h
+
+    def _find_slot(self, key, key_hash):
+        """
+        Probe for key and return (slot index, found).
+
+        When the key is missing, the index is where it should be inserted:
+        the first tombstone passed on the way, or else the empty slot that
+        ended the probe run.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        index = key_hash & mask
+        first_deleted = -1
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                return (first_deleted if first_deleted >= 0 else index), False
+            if slot_key is _DELETED:
+                if first_deleted < 0:
+                    first_deleted = index
+            # Compare the stored hashes first; they are cheap and rule out almost every mismatch
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index, True
+            index = (index + 1) & mask
+
+    def _resize(self, new_capacity):
+        """
+        Move every entry into fresh arrays of new_capacity slots.
+
+        Stored hashes are reused, so the hash function is never called again
+        for existing keys. Tombstones are dropped along the way.
+
+        Time Complexity: O(old capacity + new capacity)
+        """
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        self._allocate(new_capacity)
+
+        keys, values, hashes, mask = self._keys, self._values, self._hashes, self._mask
+        for slot_key, value, key_hash in zip(old_keys, old_values, old_hashes):
+            if slot_key is _EMPTY or slot_key is _DELETED:
+                continue
+            index = key_hash & mask
+            while keys[index] is not _EMPTY:  # Fresh arrays hold no tombstones
+                index = (index + 1) & mask
+            keys[index] = slot_key
+            values[index] = value
+            hashes[index] = key_hash
+            self._size += 1
+
+    def __setitem__(self, key, value):
+        """
+        Insert a key-value pair, or overwrite the value of an existing key.
+
+        Time Complexity: O(1) average
+        """
+        key_hash = self._hash(key)
+        index, found = self._find_slot(key, key_hash)
+
+        if found:
+            self._values[index] = value
+            return
+
+        if self._keys[index] is _DELETED:
+            self._tombstones -= 1  # Reusing a tombstone
+        self._keys[index] = key
+        self._values[index] = value
+        self._hashes[index] = key_hash
+        self._size += 1
+
+        # Tombstones lengthen probe runs just like live entries, so count both.
+        # Staying below max_load < 1 also guarantees an empty slot always exists.
+        capacity = self._mask + 1
+        if self._size + self._tombstones > capacity * self._max_load:
+            if self._size * 2 > capacity * self._max_load:
+                self._resize(capacity * 2)
+            else:
+                self._resize(capacity)  # Mostly tombstones: clean up in place
+
+    def __getitem__(self, key):
+        """
+        Return the value stored for key.
+
+        Raises:
+            KeyError: If key is not in the table
+
+        Time Complexity: O(1) average
+        """
+        index, found = self._find_slot(key, self._hash(key))
+        if not found:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __delitem__(self, key):
+        """
+        Remove key from the table, leaving a tombstone in its slot.
+
+        Raises:
+            KeyError: If key is not in the table
+
+        Time Complexity: O(1) average
+        """
+        index, found = self._find_slot(key, self._hash(key))
+        if not found:
+            raise KeyError(key)
+
+        self._keys[index] = _DELETED
+        self._values[index] = None  # Drop the reference so the value can be freed
+        self._size -= 1
+        self._tombstones += 1
+
+        capacity = self._mask + 1
+        if capacity > self._min_capacity and self._size < capacity * self._min_load:
+            self._resize(capacity // 2)
+
+    def __contains__(self, key):
+        """Return True if key is in the table. Time Complexity: O(1) average"""
+        return self._find_slot(key, self._hash(key))[1]
+
+    def __len__(self):
+        """Return the number of entries. Time Complexity: O(1)"""
+        return self._size
+
+    def __iter__(self):
+        """Iterate over the keys in slot order. Time Complexity: O(capacity)"""
+        for slot_key in self._keys:
+            if slot_key is not _EMPTY and slot_key is not _DELETED:
+                yield slot_key
+
+    def get(self, key, default=None):
+        """
+        Return the value for key, or default if key is not in the table.
+
+        Time Complexity: O(1) average
+        """
+        index, found = self._find_slot(key, self._hash(key))
+        return self._values[index] if found else default
+
+    def items(self):
+        """Iterate over (key, value) pairs in slot order. Time Complexity: O(capacity)"""
+        for slot_key, value in zip(self._keys, self._values):
+            if slot_key is not _EMPTY and slot_key is not _DELETED:
+                yield slot_key, value
+
+    def probe_stats(self):
+        """
+        Report how far entries sit from the slot their hash points at.
+
+        A probe length of 1 means the key is in its home slot. Long probe
+        runs are what make open addressing slow, so these numbers tell you
+        whether the hash function and load factors suit your keys.
+
+        Returns:
+            dict: size, capacity, tombstones, load_factor,
+                  average_probe_length and max_probe_length
+
+        Time Complexity: O(capacity)
+        """
+        mask = self._mask
+        total = longest = 0
+        for index, (slot_key, key_hash) in enumerate(zip(self._keys, self._hashes)):
+            if slot_key is _EMPTY or slot_key is _DELETED:
+                continue
+            # Distance walked forward (wrapping around) from the home slot
+            probes = ((index - key_hash) & mask) + 1
+            total += probes
+            longest = max(longest, probes)
+
+        return {
+            "size": self._size,
+            "capacity": mask + 1,
+            "tombstones": self._tombstones,
+            "load_factor": self._size / (mask + 1),
+            "average_probe_length": total / self._size if self._size else 0.0,
+            "max_probe_length": longest,
+        }
+
+    def memory_footprint(self):
+        """
+        Return the bytes used by the table's own slot arrays.
+
+        Like sys.getsizeof on a dict, this leaves out the key and value
+        objects themselves, so the two numbers can be compared directly.
+
+        Returns:
+            int: Size in bytes of the keys, values and hashes arrays
+
+        Time Complexity: O(1)
+        """
+        return (sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+                + sys.getsizeof(self._hashes))
+
+
 # Test both hash functions
-print("=== Polynomial Rolling Hash (Recommended) ===")
-test_keys = ["Alice", "James", "Bob", "Charlie", "Dave"]
-for key in test_keys:
-    hash_val = simple_hash(key)
-    print(f"Hash for '{key}': {hash_val}")
-
-print("\n=== Alternative Sum-Based Hash ===")
-for key in test_keys:
-    hash_val = simple_hash_alternative(key)
-    print(f"Hash for '{key}': {hash_val}")
-
-print("\n=== Collision Test ===")
-# Test that different strings produce different hashes (reduced collisions)
-print(f"'Alice' vs 'James': {simple_hash('Alice')} vs {simple_hash('James')} - Different: {simple_hash('Alice') != simple_hash('James')}")
+if __name__ == "__main__":
+    print("=== Polynomial Rolling Hash (Recommended) ===")
+    test_keys = ["Alice", "James", "Bob", "Charlie", "Dave"]
+    for key in test_keys:
+        hash_val = simple_hash(key)
+        print(f"Hash for '{key}': {hash_val}")
+
+    print("\n=== Alternative Sum-Based Hash ===")
+    for key in test_keys:
+        hash_val = simple_hash_alternative(key)
+        print(f"Hash for '{key}': {hash_val}")
+
+    print("\n=== Collision Test ===")
+    # Test that different strings produce different hashes (reduced collisions)
+    print(f"'Alice' vs 'James': {simple_hash('Alice')} vs {simple_hash('James')} - Different: {simple_hash('Alice') != simple_hash('James')}")
+
+    print("\n=== Open-Addressing HashTable ===")
+    table = HashTable()
+    for key in test_keys:
+        table[key] = len(key)
+    print("Value for 'Charlie':", table["Charlie"])
+    print("'Bob' in table:", "Bob" in table)
+    del table["Bob"]
+    print("'Bob' in table after delete:", "Bob" in table)
+    print("Entries:", dict(table.items()))
+
+    # Compare against the built-in dict on the same keys
+    words = [f"key{i}" for i in range(100000)]
+    table = HashTable(hash_function=hash)
+    builtin = {}
+    for i, word in enumerate(words):
+        table[word] = i
+        builtin[word] = i
+    print("Probe stats:", table.probe_stats())
+    print(f"HashTable slot arrays: {table.memory_footprint():,} bytes")
+    print(f"Built-in dict:         {sys.getsizeof(builtin):,} bytes")
+
+    print("\n=== Batch Hashing ===")
+    print("hash_many:", hash_many(test_keys).tolist())
+    print("simple_hash:", [simple_hash(key) for key in test_keys])
+
+    start = time.perf_counter()
+    scalar = [simple_hash(word, 1000003) for word in words]
+    scalar_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = hash_many(words, 1000003)
+    batch_time = time.perf_counter() - start
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"{len(words):,} keys: simple_hash {scalar_time:.3f}s, hash_many ({backend}) {batch_time:.3f}s")
+    print("Same bucket ids:", list(batch) == scalar)
@@ -5,8 +5,15 @@ class Node:
     Attributes:
         data: The value stored in the node
         next: Reference to the next node in the list (None if it's the last node)
+
+    __slots__ stores the two attributes in fixed slots instead of a per-node
+    __dict__: a node takes 48 bytes instead of 88 on Python 3.11, and
+    instances whose __dict__ has been created (or older Pythons) need
+    well over 100 bytes without it.
     """
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         """
         Initialize a new node.
@@ -25,16 +32,30 @@ class LinkedList:
     A linked list is a linear data structure where elements are stored in nodes,
     and each node points to the next node in the sequence.
 
+    The list keeps a pointer to its last node (tail) and a count of its
+    nodes, so appending and len() never need to walk the list.
+
     Time Complexity:
-        - append: O(n) - must traverse to the end
-        - print_list: O(n) - must visit each node
+        - append / prepend / pop_front: O(1)
+        - extend: O(k) for k new elements
+        - len: O(1)
+        - print_list / iteration: O(n) - must visit each node
 
     Space Complexity: O(n) where n is the number of nodes
     """
 
-    def __init__(self):
-        """Initialize an empty linked list."""
+    def __init__(self, iterable=None):
+        """
+        Initialize a linked list, optionally filled from an iterable.
+
+        Args:
+            iterable: Values to append in order (default: None, an empty list)
+        """
         self.head = None  # The head of the list is initially None, indicating an empty list
+        self.tail = None  # The last node, so append does not have to search for it
+        self.size = 0  # Number of nodes in the list
+        if iterable is not None:
+            self.extend(iterable)
 
     def append(self, data):
         """
@@ -43,23 +64,98 @@ class LinkedList:
         Args:
             data: The value to append to the list
 
-        Time Complexity: O(n) where n is the number of nodes
+        Time Complexity: O(1) - the tail pointer gives the last node directly
         """
         # Create a new node with the provided data
         new_node = Node(data)
 
-        # If the list is empty (i.e., head is None), set the new node as the head
-        if not self.head:
+        # If the list is empty (i.e., head is None), the new node is both head and tail
+        if self.head is None:
             self.head = new_node
+        else:
+            self.tail.next = new_node  # Link the old last node to the new node
+
+        self.tail = new_node  # The new node is now the last node
+        self.size += 1
+
+    def prepend(self, data):
+        """
+        Add a new node with the given data to the front of the list.
+
+        Args:
+            data: The value to add
+
+        Time Complexity: O(1)
+        """
+        new_node = Node(data)
+        new_node.next = self.head  # The old head comes after the new node
+        self.head = new_node
+        if self.tail is None:  # The list was empty
+            self.tail = new_node
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Append every value from an iterable to the end of the list.
+
+        Args:
+            iterable: The values to append, in order
+
+        Time Complexity: O(k) where k is the number of new values
+        """
+        # Link the new nodes in a local chain, then attach it to the list once
+        dummy = last = Node(None)
+        count = 0
+        for data in iterable:
+            node = Node(data)
+            last.next = node
+            last = node
+            count += 1
+
+        if not count:
             return
+        if self.head is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.size += count
+
+    def pop_front(self):
+        """
+        Remove and return the first element of the list.
+
+        Returns:
+            The data of the first node
 
-        # Otherwise, traverse the list to find the last node
-        last = self.head
-        while last.next:  # Loop until the last node (which has no 'next')
-            last = last.next  # Move to the next node
+        Raises:
+            IndexError: If the list is empty
 
-        # Set the next pointer of the last node to the new node
-        last.next = new_node
+        Time Complexity: O(1)
+        """
+        if self.head is None:
+            raise IndexError("Cannot pop from an empty list!")
+        node = self.head
+        self.head = node.next  # The second node becomes the head
+        if self.head is None:  # That was the only node
+            self.tail = None
+        self.size -= 1
+        return node.data
+
+    def __len__(self):
+        """Return the number of nodes. Time Complexity: O(1)"""
+        return self.size
+
+    def __iter__(self):
+        """
+        Yield each element from head to tail.
+
+        Time Complexity: O(n) for a full iteration
+        """
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
 
     def print_list(self):
         """
@@ -85,11 +181,523 @@ class LinkedList:
         # After the list traversal, print "None" to indicate the end of the list
         print("None")
 
+
+class Block:
+    """
+    A node of an unrolled linked list: a small Python list of elements.
+
+    Attributes:
+        items: The elements stored in this block, in order
+        next: Reference to the next block (None if it's the last block)
+    """
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items):
+        """
+        Initialize a new block.
+
+        Args:
+            items (list): The elements to store in the block
+        """
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    A linked list whose nodes each hold up to block_size elements.
+
+    A plain linked list follows one pointer per element, and inserting into
+    the middle of a Python list shifts every element after the position.
+    An unrolled list does a little of both: it follows one pointer per
+    block of B elements to find a position, then inserts into that block,
+    shifting at most B elements.
+
+        [1, 2, 3, 4] -> [5, 6, 7] -> [8, 9] -> None
+
+    A full block is split in two on insert, and a block that falls below
+    half full on delete takes elements from (or merges with) the next
+    block, so blocks stay between half full and full.
+
+    Time Complexity:
+        - get / set / insert / delete by index: O(n/B + B)
+        - append: O(1)
+        - iteration: O(n)
+
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, iterable=None, block_size=256):
+        """
+        Initialize an unrolled linked list, optionally filled from an iterable.
+
+        Args:
+            iterable: Values to append in order (default: None, an empty list)
+            block_size (int): Maximum number of elements per block (default: 256)
+
+        Raises:
+            ValueError: If block_size is less than 2
+        """
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+
+        self.block_size = block_size
+        self.head = None  # First block
+        self.tail = None  # Last block, so append is O(1)
+        self.size = 0  # Number of elements (not blocks)
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self):
+        """Return the number of elements. Time Complexity: O(1)"""
+        return self.size
+
+    def _normalize(self, index):
+        """Turn a negative index into a positive one and check it is in range."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        return index
+
+    def _locate(self, index):
+        """
+        Return (previous block, block, offset) for the element at index.
+
+        Skips whole blocks by their length, so it visits O(n/B) blocks.
+        """
+        previous = None
+        block = self.head
+        while index >= len(block.items):
+            index -= len(block.items)
+            previous, block = block, block.next
+        return previous, block, index
+
+    def __getitem__(self, index):
+        """
+        Return the element at index (negative indices count from the end).
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(n/B)
+        """
+        index = self._normalize(index)
+        if index >= self.size - len(self.tail.items):  # In the last block: no walk needed
+            return self.tail.items[index - (self.size - len(self.tail.items))]
+        _, block, offset = self._locate(index)
+        return block.items[offset]
+
+    def __setitem__(self, index, value):
+        """
+        Replace the element at index.
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(n/B)
+        """
+        _, block, offset = self._locate(self._normalize(index))
+        block.items[offset] = value
+
+    def append(self, value):
+        """
+        Add an element to the end of the list.
+
+        Time Complexity: O(1)
+        """
+        if self.tail is None:
+            self.head = self.tail = Block([value])
+        elif len(self.tail.items) < self.block_size:
+            self.tail.items.append(value)
+        else:
+            # The last block is full: start a new one
+            block = Block([value])
+            self.tail.next = block
+            self.tail = block
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Append every value from an iterable to the end of the list.
+
+        Time Complexity: O(k) for k new values
+        """
+        for value in iterable:
+            self.append(value)
+
+    def insert(self, index, value):
+        """
+        Insert value before position index, like list.insert.
+
+        Indices past the end append, and negative indices count from the end.
+
+        Time Complexity: O(n/B + B)
+        """
+        if index < 0:
+            index = max(index + self.size, 0)
+        if index >= self.size:
+            self.append(value)
+            return
+
+        _, block, offset = self._locate(index)
+        block.items.insert(offset, value)
+        self.size += 1
+
+        if len(block.items) > self.block_size:
+            # Split the overfull block: move its second half into a new block after it
+            half = len(block.items) // 2
+            new_block = Block(block.items[half:])
+            del block.items[half:]
+            new_block.next = block.next
+            block.next = new_block
+            if self.tail is block:
+                self.tail = new_block
+
+    def pop(self, index=-1):
+        """
+        Remove and return the element at index (default: the last one).
+
+        Raises:
+            IndexError: If the list is empty or index is out of range
+
+        Time Complexity: O(n/B + B)
+        """
+        if not self.size:
+            raise IndexError("Cannot pop from an empty list!")
+
+        previous, block, offset = self._locate(self._normalize(index))
+        value = block.items.pop(offset)
+        self.size -= 1
+
+        following = block.next
+        if len(block.items) < self.block_size // 2 and following is not None:
+            if len(block.items) + len(following.items) <= self.block_size:
+                # Merge: the next block's elements move into this one
+                block.items.extend(following.items)
+                block.next = following.next
+                if self.tail is following:
+                    self.tail = block
+            else:
+                # Borrow from the next block until this one is half full again
+                moved = self.block_size // 2 - len(block.items)
+                block.items.extend(following.items[:moved])
+                del following.items[:moved]
+
+        if not block.items:
+            # Only the last block can end up empty: unlink it
+            if previous is None:
+                self.head = block.next
+            else:
+                previous.next = block.next
+            if self.tail is block:
+                self.tail = previous
+        return value
+
+    def __delitem__(self, index):
+        """Delete the element at index. Time Complexity: O(n/B + B)"""
+        self.pop(index)
+
+    def __iter__(self):
+        """
+        Yield each element in order, one block at a time.
+
+        Time Complexity: O(n) for a full iteration
+        """
+        block = self.head
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+    def block_count(self):
+        """Return the number of blocks. Time Complexity: O(n/B)"""
+        count = 0
+        block = self.head
+        while block is not None:
+            count += 1
+            block = block.next
+        return count
+
+
+class DoublyNode:
+    """
+    A node in a doubly linked list.
+
+    Attributes:
+        data: The value stored in the node
+        prev: Reference to the previous node
+        next: Reference to the next node
+        owner: The DoublyLinkedList the node is in, or None if it is in none
+    """
+
+    __slots__ = ("data", "prev", "next", "owner")
+
+    def __init__(self, data):
+        """
+        Initialize a new node.
+
+        Args:
+            data: The value to store in the node
+        """
+        self.data = data
+        self.prev = None
+        self.next = None
+        self.owner = None
+
+
+class DoublyLinkedList:
+    """
+    A doubly linked list with sentinel nodes and O(1) removal by handle.
+
+    Every node points to both neighbours, so a node can be removed without
+    searching for the node before it. append and appendleft return the new
+    node as a "handle": keep it (for example in a dict) and pass it to
+    unlink or move_to_end later.
+
+    Two sentinel nodes that hold no data sit at the ends of the list:
+
+        head sentinel <-> node1 <-> node2 <-> tail sentinel
+
+    Every real node therefore has a node on each side, so inserting and
+    unlinking never need special cases for the first or last node.
+
+    Time Complexity:
+        - append / appendleft / pop / popleft: O(1)
+        - unlink / move_to_end / move_to_front: O(1) given the node
+        - iteration: O(n)
+
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, iterable=None):
+        """
+        Initialize a doubly linked list, optionally filled from an iterable.
+
+        Args:
+            iterable: Values to append in order (default: None, an empty list)
+        """
+        self.head = DoublyNode(None)  # Sentinel before the first node
+        self.tail = DoublyNode(None)  # Sentinel after the last node
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.size = 0
+        if iterable is not None:
+            for data in iterable:
+                self.append(data)
+
+    def __len__(self):
+        """Return the number of nodes (sentinels not counted). Time Complexity: O(1)"""
+        return self.size
+
+    def _link_after(self, node, prev):
+        """Insert node between prev and the node after it."""
+        following = prev.next
+        node.prev = prev
+        node.next = following
+        node.owner = self
+        prev.next = node
+        following.prev = node
+        self.size += 1
+        return node
+
+    def append(self, data):
+        """
+        Add data to the end of the list.
+
+        Returns:
+            DoublyNode: The new node, usable as a handle for unlink
+
+        Time Complexity: O(1)
+        """
+        return self._link_after(DoublyNode(data), self.tail.prev)
+
+    def appendleft(self, data):
+        """
+        Add data to the front of the list.
+
+        Returns:
+            DoublyNode: The new node, usable as a handle for unlink
+
+        Time Complexity: O(1)
+        """
+        return self._link_after(DoublyNode(data), self.head)
+
+    def unlink(self, node):
+        """
+        Remove a node from the list and return its data.
+
+        Args:
+            node (DoublyNode): A node returned by append or appendleft
+
+        Raises:
+            ValueError: If the node is not in this list (e.g. already
+                unlinked, or from another list)
+
+        Time Complexity: O(1)
+        """
+        if node.owner is not self:
+            raise ValueError("Node is not in this list")
+        node.prev.next = node.next  # Neighbours now point past the node
+        node.next.prev = node.prev
+        node.prev = node.next = node.owner = None  # Mark as unlinked
+        self.size -= 1
+        return node.data
+
+    def move_to_end(self, node):
+        """
+        Move a node of this list to the end.
+
+        Time Complexity: O(1)
+        """
+        self.unlink(node)
+        self._link_after(node, self.tail.prev)
+
+    def move_to_front(self, node):
+        """
+        Move a node of this list to the front.
+
+        Time Complexity: O(1)
+        """
+        self.unlink(node)
+        self._link_after(node, self.head)
+
+    def first(self):
+        """
+        Return the first node without removing it.
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        if not self.size:
+            raise IndexError("Cannot peek at an empty list!")
+        return self.head.next
+
+    def last(self):
+        """
+        Return the last node without removing it.
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        if not self.size:
+            raise IndexError("Cannot peek at an empty list!")
+        return self.tail.prev
+
+    def pop(self):
+        """
+        Remove and return the data of the last node.
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        return self.unlink(self.last())
+
+    def popleft(self):
+        """
+        Remove and return the data of the first node.
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        return self.unlink(self.first())
+
+    def __iter__(self):
+        """
+        Yield each element from front to back.
+
+        Time Complexity: O(n) for a full iteration
+        """
+        node = self.head.next
+        while node is not self.tail:
+            yield node.data
+            node = node.next
+
+    def __reversed__(self):
+        """
+        Yield each element from back to front.
+
+        Time Complexity: O(n) for a full iteration
+        """
+        node = self.tail.prev
+        while node is not self.head:
+            yield node.data
+            node = node.prev
+
+
 # Test the LinkedList implementation
-ll = LinkedList()  # Create a new linked list
-ll.append(1)  # Append a node with data 1 to the list
-ll.append(2)  # Append a node with data 2 to the list
-ll.append(3)  # Append a node with data 3 to the list
+if __name__ == "__main__":
+    ll = LinkedList()  # Create a new linked list
+    ll.append(1)  # Append a node with data 1 to the list
+    ll.append(2)  # Append a node with data 2 to the list
+    ll.append(3)  # Append a node with data 3 to the list
+
+    # Print the entire linked list
+    ll.print_list()  # Expected Output: 1 -> 2 -> 3 -> None
+
+    ll.prepend(0)  # Add 0 to the front
+    ll.extend([4, 5])  # Append several values at once
+    print("After prepend(0) and extend([4, 5]):", list(ll), " length:", len(ll))
+    print("pop_front():", ll.pop_front(), " remaining:", list(ll))
+
+    import sys
+    import time
+    import tracemalloc
+
+    # Building a long list is linear now that append does not walk the list
+    for n in (250000, 500000, 1000000):
+        start = time.perf_counter()
+        big = LinkedList(range(n))
+        print(f"Built {len(big):,} nodes in {time.perf_counter() - start:.3f}s")
+
+    # Memory per node, slotted Node against the same class without __slots__
+    class DictNode:
+        def __init__(self, data):
+            self.data = data
+            self.next = None
+
+    for node_class in (DictNode, Node):
+        tracemalloc.start()
+        nodes = [node_class(None) for _ in range(100000)]  # None: count only the nodes
+        per_node = (tracemalloc.get_traced_memory()[0] - sys.getsizeof(nodes)) / len(nodes)
+        tracemalloc.stop()
+        print(f"{node_class.__name__}: about {per_node:.0f} bytes per node")
+
+    # Unrolled linked list: positional inserts in the middle of a long sequence
+    unrolled = UnrolledLinkedList(range(10), block_size=4)
+    unrolled.insert(5, "x")
+    del unrolled[0]
+    print("\nUnrolled list:", list(unrolled), " item 4:", unrolled[4], " blocks:", unrolled.block_count())
+
+    import random
+
+    n = 1000000
+    inserts = [(random.randrange(n // 4, 3 * n // 4), i) for i in range(2000)]
+    plain = list(range(n))
+    start = time.perf_counter()
+    for index, value in inserts:
+        plain.insert(index, value)
+    print(f"{len(inserts):,} middle inserts into {n:,} elements: list {time.perf_counter() - start:.3f}s", end="")
+
+    unrolled = UnrolledLinkedList(range(n), block_size=1024)
+    start = time.perf_counter()
+    for index, value in inserts:
+        unrolled.insert(index, value)
+    print(f", UnrolledLinkedList {time.perf_counter() - start:.3f}s, same: {list(unrolled) == plain}")
 
-# Print the entire linked list
-ll.print_list()  # Expected Output: 1 -> 2 -> 3 -> None
+    # Doubly linked list: keep the node handle to remove it in O(1)
+    doubly = DoublyLinkedList(["a", "b"])
+    handle = doubly.append("c")
+    doubly.appendleft("z")
+    print("\nDoubly linked list:", list(doubly), " reversed:", list(reversed(doubly)))
+    doubly.move_to_front(handle)
+    print("After move_to_front(c):", list(doubly))
+    print("unlink(c):", doubly.unlink(handle), " remaining:", list(doubly))
@@ -0,0 +1,214 @@
+"""
+LRU (Least Recently Used) cache built from a hash map and a doubly linked list.
+
+A cache keeps the answers to expensive lookups, but it must stay bounded.
+When it is full, an LRU cache throws out the entry that was used least
+recently, on the bet that it is the least likely to be needed again.
+
+Two structures work together so every operation is O(1):
+
+    - a dict (the hash map from dictionary.py) maps each key to its node
+    - a DoublyLinkedList keeps the nodes in order of use, least recent first
+
+    dict:  {"a": node_a, "b": node_b, "c": node_c}
+    list:  head <-> node_a <-> node_b <-> node_c <-> tail
+           (least recent)                 (most recent)
+
+On a hit, the node is moved to the end of the list. On an insert into a
+full cache, the node at the front is unlinked and its key removed from the
+dict. Both steps only touch a node and its neighbours.
+
+Time Complexity: O(1) for get, put, delete and eviction
+Space Complexity: O(capacity)
+"""
+
+from linked_lists import DoublyLinkedList
+
+
+class LRUCache:
+    """
+    A bounded key-value cache that evicts the least recently used entry.
+
+    Time Complexity:
+        - get / put / delete / in: O(1)
+
+    Space Complexity: O(capacity)
+    """
+
+    def __init__(self, capacity, on_evict=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity (int): Maximum number of entries
+            on_evict (callable): Called as on_evict(key, value) for every entry
+                thrown out to make room (default: None)
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self._nodes = {}  # key -> node whose data is the (key, value) pair
+        self._order = DoublyLinkedList()  # Least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Return the number of cached entries. Time Complexity: O(1)"""
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        """
+        Return True if key is cached, without counting a hit or changing its recency.
+
+        Time Complexity: O(1)
+        """
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for key and mark it as most recently used.
+
+        Args:
+            key: The key to look up
+            default: Value returned when key is not cached (default: None)
+
+        Returns:
+            The cached value, or default on a miss
+
+        Time Complexity: O(1)
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_end(node)
+        return node.data[1]
+
+    def put(self, key, value):
+        """
+        Cache value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: The key (must be hashable)
+            value: The value to cache
+
+        Time Complexity: O(1)
+        """
+        node = self._nodes.get(key)
+        if node is not None:
+            # Already cached: replace the value and mark as most recently used
+            node.data = (key, value)
+            self._order.move_to_end(node)
+            return
+
+        self._nodes[key] = self._order.append((key, value))
+        if len(self._nodes) > self.capacity:
+            old_key, old_value = self._order.popleft()  # Least recently used
+            del self._nodes[old_key]
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+
+    def __getitem__(self, key):
+        """
+        Return the cached value for key (a hit makes it most recently used).
+
+        Raises:
+            KeyError: If key is not cached
+
+        Time Complexity: O(1)
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        self._order.move_to_end(node)
+        return node.data[1]
+
+    def __setitem__(self, key, value):
+        """Same as put(key, value). Time Complexity: O(1)"""
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        """
+        Remove key from the cache (on_evict is not called).
+
+        Raises:
+            KeyError: If key is not cached
+
+        Time Complexity: O(1)
+        """
+        self._order.unlink(self._nodes.pop(key))
+
+    def clear(self):
+        """Remove every entry; the counters are kept. Time Complexity: O(n)"""
+        self._nodes.clear()
+        self._order = DoublyLinkedList()
+
+    def keys(self):
+        """Return the cached keys, least recently used first. Time Complexity: O(n)"""
+        return [key for key, _ in self._order]
+
+    def stats(self):
+        """
+        Report how well the cache is doing.
+
+        Returns:
+            dict: size, capacity, hits, misses, evictions and hit_rate
+                (hits / lookups, 0.0 before any lookup)
+
+        Time Complexity: O(1)
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._nodes),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    evicted = []
+    cache = LRUCache(3, on_evict=lambda key, value: evicted.append(key))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    print("get('a'):", cache.get("a"))  # "a" is now the most recently used
+    cache.put("d", 4)  # Full: evicts "b", the least recently used
+    print("Keys (least recent first):", cache.keys())
+    print("Evicted:", evicted)
+    print("get('b'):", cache.get("b", "miss"))
+    print("Stats:", cache.stats())
+
+    # In front of an "expensive" lookup with a skewed access pattern
+    def slow_square(n):
+        time.sleep(0.0001)  # Pretend this is a database query
+        return n * n
+
+    cache = LRUCache(100)
+    requests = [int(random.paretovariate(1.2)) for _ in range(20000)]  # A few keys are very popular
+    start = time.perf_counter()
+    for n in requests:
+        value = cache.get(n)
+        if value is None:
+            value = slow_square(n)
+            cache.put(n, value)
+    cached_time = time.perf_counter() - start
+    stats = cache.stats()
+    print(f"\n{len(requests):,} requests in {cached_time:.3f}s, hit rate {stats['hit_rate']:.1%}, "
+          f"{stats['evictions']:,} evictions")
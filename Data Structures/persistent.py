@@ -0,0 +1,300 @@
+"""
+Persistent (immutable) linked list and stack with structural sharing.
+
+Undo histories and backtracking searches need to keep old versions of a
+stack or list. Copying a Python list for every snapshot costs O(n) time
+and memory per snapshot.
+
+A persistent structure is never changed in place. Every "change" returns a
+new version, and the new version reuses the old nodes it did not change:
+
+    a = PersistentList([2, 3])        a:       2 -> 3
+    b = a.cons(1)                     b:  1 -> 2 -> 3    (shares a's nodes)
+    c = a.cons(9)                     c:  9 -> 2 -> 3    (shares them too)
+
+a, b and c are all still valid, and together they hold only 4 values. Since
+nothing is ever modified, sharing is always safe, and a snapshot is just a
+reference to the current version: O(1).
+
+Each version is itself the first node of its list, so pushing onto a stack
+allocates exactly one small object.
+
+Time Complexity: O(1) cons/push/pop/first/rest/len, O(i) to change position i
+Space Complexity: O(1) extra per push, O(i) per change at position i
+"""
+
+
+class PersistentList:
+    """
+    An immutable singly linked list whose versions share their tails.
+
+    Time Complexity:
+        - cons / first / rest / len: O(1)
+        - insert / delete / getting item i: O(i)
+        - iteration / reverse: O(n)
+
+    Space Complexity: one node per element, shared between versions
+    """
+
+    __slots__ = ("_value", "_rest", "_size")
+
+    def __init__(self, iterable=None):
+        """
+        Create a list holding the values of an iterable, in order.
+
+        Args:
+            iterable: The values (default: None, an empty list)
+        """
+        values = list(iterable) if iterable is not None else []
+        rest = None
+        if values:
+            # Build from the back so each new node points at the list after it
+            rest = type(self)()
+            for value in reversed(values[1:]):
+                rest = rest.cons(value)
+        object.__setattr__(self, "_value", values[0] if values else None)
+        object.__setattr__(self, "_rest", rest)  # None only for an empty list
+        object.__setattr__(self, "_size", len(values))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def cons(self, value):
+        """
+        Return a new list with value in front of this one (this list is unchanged).
+
+        Time Complexity: O(1) - the new list shares every node of this one
+        """
+        node = object.__new__(type(self))
+        object.__setattr__(node, "_value", value)
+        object.__setattr__(node, "_rest", self)
+        object.__setattr__(node, "_size", self._size + 1)
+        return node
+
+    def first(self):
+        """
+        Return the first value.
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        if not self._size:
+            raise IndexError("Cannot take the first value of an empty list!")
+        return self._value
+
+    def rest(self):
+        """
+        Return the list without its first value (shared, not copied).
+
+        Raises:
+            IndexError: If the list is empty
+
+        Time Complexity: O(1)
+        """
+        if not self._size:
+            raise IndexError("Cannot take the rest of an empty list!")
+        return self._rest
+
+    def __len__(self):
+        """Return the number of values. Time Complexity: O(1)"""
+        return self._size
+
+    def __iter__(self):
+        """Yield the values from front to back. Time Complexity: O(n)"""
+        node = self
+        while node._size:
+            yield node._value
+            node = node._rest
+
+    def __getitem__(self, index):
+        """
+        Return the value at index (negative indices count from the end).
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(i)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
+        node = self
+        for _ in range(index):
+            node = node._rest
+        return node._value
+
+    def _rebuild(self, prefix, tail):
+        """Cons the values of prefix (front first) onto tail, keeping their order."""
+        for value in reversed(prefix):
+            tail = tail.cons(value)
+        return tail
+
+    def insert(self, index, value):
+        """
+        Return a new list with value inserted before position index.
+
+        Only the first index nodes are copied; the rest are shared.
+
+        Time Complexity: O(i)
+        """
+        index = max(0, min(index if index >= 0 else index + self._size, self._size))
+        prefix = []
+        node = self
+        for _ in range(index):
+            prefix.append(node._value)
+            node = node._rest
+        return self._rebuild(prefix, node.cons(value))
+
+    def delete(self, index):
+        """
+        Return a new list without the value at index.
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(i)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
+        prefix = []
+        node = self
+        for _ in range(index):
+            prefix.append(node._value)
+            node = node._rest
+        return self._rebuild(prefix, node._rest)
+
+    def reverse(self):
+        """Return a new list with the values in reverse order. Time Complexity: O(n)"""
+        result = type(self)()
+        for value in self:
+            result = result.cons(value)
+        return result
+
+    def __eq__(self, other):
+        """Two lists are equal if they hold equal values in the same order."""
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        if self._size != other._size:
+            return False
+        a, b = self, other
+        while a._size:
+            if a is b:
+                return True  # Shared tail: the rest is identical
+            if a._value != b._value:
+                return False
+            a, b = a._rest, b._rest
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class PersistentStack(PersistentList):
+    """
+    An immutable stack: push and pop return new stacks that share nodes.
+
+    The top of the stack is the front of the underlying list.
+
+    Time Complexity: O(1) for push, pop, peek, len and taking a snapshot
+    Space Complexity: one node per push, shared between versions
+    """
+
+    __slots__ = ()
+
+    def push(self, data):
+        """
+        Return a new stack with data on top (this stack is unchanged).
+
+        Time Complexity: O(1)
+        """
+        return self.cons(data)
+
+    def pop(self):
+        """
+        Return (top value, stack without it); this stack is unchanged.
+
+        Raises:
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        if not self._size:
+            raise IndexError("Cannot pop from an empty stack!")
+        return self._value, self._rest
+
+    def peek(self):
+        """
+        Return the top value.
+
+        Raises:
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        if not self._size:
+            raise IndexError("Cannot peek at an empty stack!")
+        return self._value
+
+    def is_empty(self):
+        """Return True if the stack is empty. Time Complexity: O(1)"""
+        return self._size == 0
+
+
+# Test
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+
+    a = PersistentList([2, 3])
+    b = a.cons(1)
+    c = a.cons(9)
+    print("a:", a, " b:", b, " c:", c)
+    print("b and c share a's nodes:", b.rest() is a and c.rest() is a)
+    print("b.insert(1, 'x'):", b.insert(1, "x"), " b is unchanged:", b)
+
+    # Undo history: every version stays usable
+    history = [PersistentStack()]
+    for action in ["type A", "type B", "bold", "type C"]:
+        history.append(history[-1].push(action))
+    value, undone = history[-1].pop()
+    print("\nUndid:", value, " stack now:", list(undone), " newest version still:", list(history[-1]))
+
+    # Snapshot cost: copying a list vs keeping a persistent version
+    n = 3000
+    tracemalloc.start()
+    start = time.perf_counter()
+    plain, snapshots = [], []
+    for i in range(n):
+        plain.append(i)
+        snapshots.append(plain.copy())  # O(n) per snapshot
+    copy_time = time.perf_counter() - start
+    copy_bytes = tracemalloc.get_traced_memory()[0]
+    del plain, snapshots
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    stack, versions = PersistentStack(), []
+    for i in range(n):
+        stack = stack.push(i)
+        versions.append(stack)  # O(1) per snapshot
+    persistent_time = time.perf_counter() - start
+    persistent_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"\n{n:,} pushes, snapshot after each one:")
+    print(f"  list.copy():     {copy_time:.3f}s  {copy_bytes / 2**20:8.1f} MiB")
+    print(f"  PersistentStack: {persistent_time:.3f}s  {persistent_bytes / 2**20:8.1f} MiB")
+    print(f"  Every version correct: {all(len(v) == i + 1 for i, v in enumerate(versions))}, "
+          f"node size {sys.getsizeof(stack)} bytes")
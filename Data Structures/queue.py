@@ -75,16 +75,17 @@ class Queue:
         return len(self.queue) == 0
 
 # Test the Queue class
-queue = Queue()  # Create a new queue instance
-queue.enqueue(10)  # Add 10 to the queue
-queue.enqueue(20)  # Add 20 to the queue
-queue.enqueue(30)  # Add 30 to the queue
+if __name__ == "__main__":
+    queue = Queue()  # Create a new queue instance
+    queue.enqueue(10)  # Add 10 to the queue
+    queue.enqueue(20)  # Add 20 to the queue
+    queue.enqueue(30)  # Add 30 to the queue
 
-# Peek to see the front element of the queue
-print("Front element:", queue.front())  # Output: 10
+    # Peek to see the front element of the queue
+    print("Front element:", queue.front())  # Output: 10
 
-# Dequeue the front element from the queue
-print("Dequeued element:", queue.dequeue())  # Output: 10
+    # Dequeue the front element from the queue
+    print("Dequeued element:", queue.dequeue())  # Output: 10
 
-# Print the queue after dequeuing an element
-print("Queue after dequeue:", queue.queue)  # Output: [20, 30]
+    # Print the queue after dequeuing an element
+    print("Queue after dequeue:", queue.queue)  # Output: [20, 30]
@@ -0,0 +1,304 @@
+"""
+Ring buffer (circular buffer) queue for numbers, over one preallocated array.
+
+Queue in queue.py stores a pointer to a Python object for every element:
+about 8 bytes for the pointer plus 24-32 bytes for each int or float
+object. A ring buffer stores the raw numbers in a typed array.array that is
+allocated once, at its full capacity: 8 bytes per element for 'q' or 'd'.
+
+The array is used as if its end joined up with its start. The queue is the
+run of `size` slots starting at `head`, wrapping past the end if needed:
+
+    capacity 8, head 6, size 4:   [ c  d  .  .  .  .  a  b ]
+                                    ^ wraps          ^ head
+
+enqueue writes at (head + size) % capacity and dequeue reads at head, so
+both are O(1) and nothing is ever moved or reallocated.
+
+When the buffer is full, the policy decides what enqueue does:
+    - "reject": raise an error, keeping the data already queued
+    - "overwrite": drop the oldest element to make room (a "last N values" buffer)
+
+Time Complexity: O(1) enqueue/dequeue, O(k) to move k elements in bulk
+Space Complexity: O(capacity), allocated once
+"""
+
+from array import array
+
+POLICIES = ("reject", "overwrite")
+TYPECODES = frozenset("bBhHiIlLqQfd")  # The numeric array typecodes
+
+
+def _kind(format_code):
+    """Return 'signed', 'unsigned' or 'float' for a struct/array format code."""
+    code = format_code.lstrip("@=<")
+    if code in ("b", "h", "i", "l", "q"):
+        return "signed"
+    if code in ("B", "H", "I", "L", "Q"):
+        return "unsigned"
+    return "float" if code in ("f", "d") else None
+
+
+class RingBufferQueue:
+    """
+    A fixed-capacity FIFO queue of numbers stored in a circular array.
+
+    Time Complexity:
+        - enqueue / dequeue / front: O(1)
+        - enqueue_many / dequeue_many: O(k) for k elements
+        - views: O(1), no copying
+
+    Space Complexity: O(capacity)
+    """
+
+    def __init__(self, capacity, typecode="d", policy="reject"):
+        """
+        Initialize an empty ring buffer.
+
+        Args:
+            capacity (int): Maximum number of elements
+            typecode (str): array module typecode of the elements, e.g. 'd'
+                for floats or 'q' for 64-bit integers (default: 'd')
+            policy (str): What enqueue does when full: "reject" or "overwrite"
+                (default: "reject")
+
+        Raises:
+            ValueError: If capacity is less than 1 or policy is unknown
+            TypeError: If typecode is not a numeric array typecode
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        if policy not in POLICIES:
+            raise ValueError(f"Policy must be one of {POLICIES}")
+
+        if typecode not in TYPECODES:
+            raise TypeError("Typecode must be a numeric array typecode")
+
+        self.capacity = capacity
+        self.policy = policy
+        self._data = array(typecode, bytes(array(typecode).itemsize * capacity))  # Allocated once
+        self._view = memoryview(self._data)  # Used for copies in and out without temporaries
+        self._head = 0  # Slot of the oldest element
+        self._size = 0
+
+    @property
+    def typecode(self):
+        """The array typecode of the elements."""
+        return self._data.typecode
+
+    def __len__(self):
+        """Return the number of elements. Time Complexity: O(1)"""
+        return self._size
+
+    def is_empty(self):
+        """Return True if there are no elements. Time Complexity: O(1)"""
+        return self._size == 0
+
+    def is_full(self):
+        """Return True if size equals capacity. Time Complexity: O(1)"""
+        return self._size == self.capacity
+
+    def enqueue(self, value):
+        """
+        Add a number to the back of the queue.
+
+        Args:
+            value: The number to add
+
+        Raises:
+            IndexError: If the queue is full and the policy is "reject"
+
+        Time Complexity: O(1)
+        """
+        if self._size == self.capacity:
+            if self.policy == "reject":
+                raise IndexError("Cannot enqueue into a full queue!")
+            # Overwrite: the oldest slot becomes the newest
+            self._data[self._head] = value
+            self._head = (self._head + 1) % self.capacity
+            return
+
+        self._data[(self._head + self._size) % self.capacity] = value
+        self._size += 1
+
+    def dequeue(self):
+        """
+        Remove and return the number at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty
+
+        Time Complexity: O(1)
+        """
+        if self._size == 0:
+            raise IndexError("Cannot dequeue from an empty queue!")
+        value = self._data[self._head]
+        self._head = (self._head + 1) % self.capacity
+        self._size -= 1
+        return value
+
+    def front(self):
+        """
+        Return the number at the front without removing it.
+
+        Raises:
+            IndexError: If the queue is empty
+
+        Time Complexity: O(1)
+        """
+        if self._size == 0:
+            raise IndexError("Cannot access front of an empty queue!")
+        return self._data[self._head]
+
+    def enqueue_many(self, values):
+        """
+        Add many numbers at once, copying them in at most two slices.
+
+        Args:
+            values: An array.array or any buffer (NumPy array, memoryview) of
+                the same typecode, copied without temporaries; or any
+                iterable of numbers
+
+        Raises:
+            IndexError: If the values do not fit and the policy is "reject"
+                (nothing is added in that case)
+            TypeError: If a buffer's element format differs from the queue's
+
+        Time Complexity: O(k) for k values
+        """
+        try:
+            source = memoryview(values)
+        except TypeError:
+            source = memoryview(array(self.typecode, values))  # A plain iterable
+        if source.ndim != 1 or source.format != self.typecode:
+            # Same kind and size under another code (NumPy's int64 is 'l' on Linux) is fine
+            if (source.ndim != 1 or not source.c_contiguous or _kind(source.format) is None
+                    or _kind(source.format) != _kind(self.typecode)
+                    or source.itemsize != self._data.itemsize):
+                raise TypeError(f"Buffer must hold '{self.typecode}' elements")
+            source = source.cast("B").cast(self.typecode)
+
+        count = len(source)
+        capacity = self.capacity
+        free = capacity - self._size
+        if count > free:
+            if self.policy == "reject":
+                raise IndexError("Not enough room in the queue!")
+            if count >= capacity:
+                # Only the newest capacity values survive: the buffer is replaced
+                self._view[:] = source[count - capacity:]
+                self._head, self._size = 0, capacity
+                return
+            # Drop just enough of the oldest elements to make room
+            dropped = count - free
+            self._head = (self._head + dropped) % capacity
+            self._size -= dropped
+
+        start = (self._head + self._size) % capacity
+        first = min(count, capacity - start)  # Part that fits before the end of the array
+        self._view[start:start + first] = source[:first]
+        self._view[:count - first] = source[first:]  # The rest wraps to the start
+        self._size += count
+
+    def views(self):
+        """
+        Return the queued elements as zero-copy memoryviews, oldest first.
+
+        The elements are either one run of the array or two (when they wrap
+        past the end), so this returns a tuple of one or two memoryviews.
+        They show live data: enqueuing afterwards may overwrite them.
+        np.frombuffer(view) turns each into a NumPy array without copying.
+
+        Time Complexity: O(1)
+        """
+        end = self._head + self._size
+        if end <= self.capacity:
+            return (self._view[self._head:end],)
+        return (self._view[self._head:], self._view[:end - self.capacity])
+
+    def dequeue_many(self, count):
+        """
+        Remove up to count numbers from the front and return them as an array.
+
+        Raises:
+            ValueError: If count is negative
+
+        Time Complexity: O(k) for k numbers returned
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        count = min(count, self._size)
+        result = array(self.typecode)
+        taken = 0
+        for view in self.views():
+            part = view[:count - taken]
+            result.frombytes(part.cast("B"))
+            taken += len(part)
+        self.discard(count)
+        return result
+
+    def discard(self, count):
+        """
+        Drop up to count numbers from the front without reading them.
+
+        Use it after processing the data returned by views().
+
+        Raises:
+            ValueError: If count is negative
+
+        Time Complexity: O(1)
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        count = min(count, self._size)
+        self._head = (self._head + count) % self.capacity
+        self._size -= count
+
+    def __iter__(self):
+        """Yield the elements, oldest first. Time Complexity: O(n)"""
+        for view in self.views():
+            yield from view
+
+
+# Test
+if __name__ == "__main__":
+    import sys
+    import time
+    from collections import deque
+
+    ring = RingBufferQueue(4, "q")
+    ring.enqueue_many([1, 2, 3])
+    print("Dequeued:", ring.dequeue(), " contents:", list(ring))
+    ring.enqueue_many(array("q", [4, 5]))
+    print("After wrapping:", list(ring), " views:", [v.tolist() for v in ring.views()])
+    try:
+        ring.enqueue(6)
+    except IndexError as e:
+        print("Reject policy:", e)
+
+    latest = RingBufferQueue(3, "d", policy="overwrite")
+    for reading in [20.5, 21.0, 21.7, 22.1, 22.4]:
+        latest.enqueue(reading)
+    print("Last 3 readings:", list(latest))
+
+    # Memory per element against a deque of floats
+    n = 1000000
+    values = [i * 0.5 for i in range(n)]
+    as_deque = deque(values)
+    per_deque = (sys.getsizeof(as_deque) + sum(sys.getsizeof(v) for v in values)) / n
+    ring = RingBufferQueue(n, "d")
+    ring.enqueue_many(values)
+    print(f"\nMemory per element: deque {per_deque:.1f} bytes, RingBufferQueue {ring._data.itemsize} bytes")
+
+    # Streaming in blocks: bulk enqueue and zero-copy reads
+    block = array("d", range(1000))
+    ring = RingBufferQueue(10000, "d", policy="overwrite")
+    start = time.perf_counter()
+    total = 0.0
+    for _ in range(10000):
+        ring.enqueue_many(block)
+        for view in ring.views():
+            total += view[0]  # Read in place; nothing is copied
+        ring.discard(500)
+    print(f"10,000 bulk enqueues of 1,000 values: {time.perf_counter() - start:.3f}s")
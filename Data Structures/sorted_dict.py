@@ -0,0 +1,441 @@
+"""
+Sorted dictionary: a map that keeps its keys in order (sorted list of blocks).
+
+A dict finds a key in O(1), but it has no idea which keys are "between" two
+others: answering "all keys from a to b" means scanning every key and
+sorting the matches. A sorted dictionary keeps its keys in sorted order, so
+range queries, the nearest key below or above a value (floor/ceil), and
+"the i-th smallest key" (select) are all fast.
+
+This one stores the keys in a list of sorted Python lists ("blocks") of at
+most 2 * block_size keys each, with the values in parallel blocks:
+
+    maxes:  [  9,            27,             40 ]
+    blocks: [[1, 4, 9], [12, 20, 27], [31, 40]]
+
+To find a key, bisect the list of block maximums to pick the block, then
+bisect inside it. Inserting shifts at most 2 * block_size keys (a fast
+memmove inside list.insert); a block that grows too big is split in two,
+and one that shrinks too small is merged with a neighbour.
+
+For rank and select, a Fenwick tree (binary indexed tree) over the block
+lengths gives the number of keys before any block in O(log(number of blocks)).
+
+Time Complexity: O(log n) comparisons for lookup, insert, delete, floor,
+    ceil, rank and select (plus an O(block_size) list shift on insert/delete)
+Space Complexity: O(n)
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class SortedDict:
+    """
+    A dictionary whose keys are kept in sorted order.
+
+    Keys must be comparable with each other (all numbers, all strings, ...).
+
+    Time Complexity:
+        - get / set / delete / in: O(log n)
+        - floor / ceil / rank / select: O(log n)
+        - irange: O(log n + k) for k keys in the range
+        - from_sorted: O(n)
+
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, items=None, block_size=512):
+        """
+        Initialize a sorted dictionary, optionally from a dict or (key, value) pairs.
+
+        Args:
+            items: A dict or iterable of (key, value) pairs (default: None);
+                for duplicate keys the last value wins, as with dict()
+            block_size (int): Target number of keys per block (default: 512)
+
+        Raises:
+            ValueError: If block_size is less than 4
+            TypeError: If the keys cannot be compared with each other
+        """
+        if block_size < 4:
+            raise ValueError("Block size must be at least 4")
+
+        self.block_size = block_size
+        self._keys = []  # Sorted blocks of keys
+        self._values = []  # Values, in blocks parallel to _keys
+        self._maxes = []  # Last (largest) key of each block
+        self._tree = [0]  # Fenwick tree over block lengths (index 0 unused)
+        self._size = 0
+
+        if items:
+            pairs = dict(items)  # Keeps the last value for each key
+            self._load(sorted(pairs.items(), key=lambda pair: pair[0]))
+
+    @classmethod
+    def from_sorted(cls, pairs, block_size=512):
+        """
+        Build a sorted dictionary from (key, value) pairs already in key order.
+
+        No sorting is done: the pairs are cut into blocks directly.
+
+        Args:
+            pairs (iterable): (key, value) pairs with strictly increasing keys
+            block_size (int): Target number of keys per block (default: 512)
+
+        Raises:
+            ValueError: If the keys are not strictly increasing
+
+        Time Complexity: O(n)
+        """
+        pairs = pairs if isinstance(pairs, list) else list(pairs)
+        for i in range(1, len(pairs)):
+            if not pairs[i - 1][0] < pairs[i][0]:
+                raise ValueError("Keys must be strictly increasing")
+        result = cls(block_size=block_size)
+        result._load(pairs)
+        return result
+
+    def _load(self, pairs):
+        """Fill an empty dictionary from sorted, unique (key, value) pairs."""
+        step = self.block_size
+        keys = [key for key, _ in pairs]
+        values = [value for _, value in pairs]
+        self._keys = [keys[i:i + step] for i in range(0, len(keys), step)]
+        self._values = [values[i:i + step] for i in range(0, len(values), step)]
+        self._maxes = [block[-1] for block in self._keys]
+        self._size = len(keys)
+        self._build_tree()
+
+    # ---- Fenwick tree over block lengths ----
+
+    def _build_tree(self):
+        """Rebuild the Fenwick tree after blocks were added or removed. O(blocks)"""
+        tree = [0] + [len(block) for block in self._keys]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)  # Next node whose range covers node i
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, block_index, delta):
+        """Add delta to the length of one block in the Fenwick tree."""
+        tree = self._tree
+        i = block_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _keys_before(self, block_index):
+        """Return the number of keys in the blocks before block_index."""
+        tree = self._tree
+        total = 0
+        i = block_index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    # ---- Finding keys ----
+
+    def _find(self, key):
+        """Return (block index, position in block) where key is or would go."""
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            b -= 1  # Larger than every key: belongs at the end of the last block
+            return b, len(self._keys[b])
+        return b, bisect_left(self._keys[b], key)
+
+    def __len__(self):
+        """Return the number of keys. Time Complexity: O(1)"""
+        return self._size
+
+    def __contains__(self, key):
+        """Return True if key is in the dictionary. Time Complexity: O(log n)"""
+        if not self._size:
+            return False
+        b, i = self._find(key)
+        block = self._keys[b]
+        return i < len(block) and block[i] == key
+
+    def __getitem__(self, key):
+        """
+        Return the value for key.
+
+        Raises:
+            KeyError: If key is not in the dictionary
+
+        Time Complexity: O(log n)
+        """
+        if self._size:
+            b, i = self._find(key)
+            block = self._keys[b]
+            if i < len(block) and block[i] == key:
+                return self._values[b][i]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is missing. Time Complexity: O(log n)"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    # ---- Changing the dictionary ----
+
+    def __setitem__(self, key, value):
+        """
+        Set the value for key, inserting the key in order if it is new.
+
+        Time Complexity: O(log n) comparisons plus an O(block_size) shift
+        """
+        if not self._size:
+            self._keys, self._values, self._maxes = [[key]], [[value]], [key]
+            self._size = 1
+            self._build_tree()
+            return
+
+        b, i = self._find(key)
+        keys, values = self._keys[b], self._values[b]
+        if i < len(keys) and keys[i] == key:
+            values[i] = value  # Existing key: just replace the value
+            return
+
+        keys.insert(i, key)
+        values.insert(i, value)
+        self._maxes[b] = keys[-1]
+        self._size += 1
+
+        if len(keys) > 2 * self.block_size:
+            # Split the block in half
+            half = len(keys) // 2
+            self._keys.insert(b + 1, keys[half:])
+            self._values.insert(b + 1, values[half:])
+            del keys[half:], values[half:]
+            self._maxes[b] = keys[-1]
+            self._maxes.insert(b + 1, self._keys[b + 1][-1])
+            self._build_tree()
+        else:
+            self._tree_add(b, 1)
+
+    def __delitem__(self, key):
+        """
+        Remove key and its value.
+
+        Raises:
+            KeyError: If key is not in the dictionary
+
+        Time Complexity: O(log n) comparisons plus an O(block_size) shift
+        """
+        self.pop(key)
+
+    def pop(self, key, *default):
+        """
+        Remove key and return its value (or default, if given and key is missing).
+
+        Raises:
+            KeyError: If key is missing and no default was given
+
+        Time Complexity: O(log n) comparisons plus an O(block_size) shift
+        """
+        if self._size:
+            b, i = self._find(key)
+            keys, values = self._keys[b], self._values[b]
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+                value = values.pop(i)
+                self._size -= 1
+                self._shrink(b)
+                return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def _shrink(self, b):
+        """Fix up block b after a deletion: drop it, merge it, or update it."""
+        keys = self._keys[b]
+        if not keys:
+            del self._keys[b], self._values[b], self._maxes[b]
+            self._build_tree()
+        elif len(keys) < self.block_size // 2 and len(self._keys) > 1:
+            # Too small: merge with the next block (or the previous one if last)
+            if b == len(self._keys) - 1:
+                b -= 1
+            merged_keys = self._keys[b] + self._keys[b + 1]
+            merged_values = self._values[b] + self._values[b + 1]
+            if len(merged_keys) > 2 * self.block_size:
+                half = len(merged_keys) // 2  # Too big for one block: rebalance the pair
+                self._keys[b:b + 2] = [merged_keys[:half], merged_keys[half:]]
+                self._values[b:b + 2] = [merged_values[:half], merged_values[half:]]
+                self._maxes[b:b + 2] = [merged_keys[half - 1], merged_keys[-1]]
+            else:
+                self._keys[b:b + 2] = [merged_keys]
+                self._values[b:b + 2] = [merged_values]
+                self._maxes[b:b + 2] = [merged_keys[-1]]
+            self._build_tree()
+        else:
+            self._maxes[b] = keys[-1]
+            self._tree_add(b, -1)
+
+    # ---- Iteration and range queries ----
+
+    def __iter__(self):
+        """Yield the keys in sorted order. Time Complexity: O(n)"""
+        for block in self._keys:
+            yield from block
+
+    def keys(self):
+        """Return a list of the keys in sorted order. Time Complexity: O(n)"""
+        return [key for block in self._keys for key in block]
+
+    def values(self):
+        """Return a list of the values in key order. Time Complexity: O(n)"""
+        return [value for block in self._values for value in block]
+
+    def items(self):
+        """Return a list of (key, value) pairs in key order. Time Complexity: O(n)"""
+        return [pair for keys, values in zip(self._keys, self._values) for pair in zip(keys, values)]
+
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Yield the (key, value) pairs with low <= key <= high, in key order.
+
+        Args:
+            low: Smallest key wanted (default: None, no lower limit)
+            high: Largest key wanted (default: None, no upper limit)
+            inclusive (tuple): Whether low and high themselves are included
+                (default: (True, True))
+
+        Time Complexity: O(log n + k) for k pairs yielded
+        """
+        if not self._size:
+            return
+
+        # Starting point: first key >= low (or > low if low is excluded)
+        if low is None:
+            b, i = 0, 0
+        else:
+            b = (bisect_left if inclusive[0] else bisect_right)(self._maxes, low)
+            if b == len(self._maxes):
+                return
+            i = (bisect_left if inclusive[0] else bisect_right)(self._keys[b], low)
+
+        past_high = bisect_right if inclusive[1] else bisect_left
+        for b in range(b, len(self._keys)):
+            keys, values = self._keys[b], self._values[b]
+            end = len(keys)
+            if high is not None and not keys[-1] < high:
+                # The range ends inside this block
+                end = past_high(keys, high, i)
+                yield from zip(keys[i:end], values[i:end])
+                return
+            yield from zip(keys[i:end], values[i:end])
+            i = 0
+
+    def floor(self, key):
+        """
+        Return the largest key that is <= key.
+
+        Raises:
+            KeyError: If every key is larger
+
+        Time Complexity: O(log n)
+        """
+        rank = self.rank(key)
+        if rank < self._size and self.select(rank) == key:
+            return key
+        if rank == 0:
+            raise KeyError(f"No key <= {key!r}")
+        return self.select(rank - 1)
+
+    def ceil(self, key):
+        """
+        Return the smallest key that is >= key.
+
+        Raises:
+            KeyError: If every key is smaller
+
+        Time Complexity: O(log n)
+        """
+        rank = self.rank(key)
+        if rank == self._size:
+            raise KeyError(f"No key >= {key!r}")
+        return self.select(rank)
+
+    def rank(self, key):
+        """
+        Return the number of keys smaller than key (key need not be present).
+
+        Time Complexity: O(log n)
+        """
+        if not self._size:
+            return 0
+        b, i = self._find(key)
+        return self._keys_before(b) + i
+
+    def select(self, index):
+        """
+        Return the key at position index in sorted order (0 is the smallest).
+
+        Negative indices count from the end.
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(log n)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
+
+        # Walk down the Fenwick tree to the block holding the index-th key
+        tree = self._tree
+        b = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if b + step < len(tree) and tree[b + step] <= index:
+                b += step
+                index -= tree[b]
+            step >>= 1
+        return self._keys[b][index]
+
+    def __repr__(self):
+        return f"SortedDict({dict(self.items())!r})"
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    prices = SortedDict({"pear": 3, "apple": 5, "fig": 7, "banana": 2, "kiwi": 4})
+    print("Keys in order:", list(prices))
+    print("From 'b' to 'k':", list(prices.irange("b", "k")))
+    print("floor('grape'):", prices.floor("grape"), " ceil('grape'):", prices.ceil("grape"))
+    print("rank('kiwi'):", prices.rank("kiwi"), " select(0):", prices.select(0))
+
+    # "All keys between a and b": dict scan + sort vs SortedDict.irange
+    n = 200000
+    events = {random.random() * 1000: i for i in range(n)}
+    table = SortedDict(events)
+    queries = [(x, x + 1.0) for x in (random.random() * 999 for _ in range(200))]
+
+    start = time.perf_counter()
+    by_scan = [sorted(k for k in events if a <= k <= b) for a, b in queries]
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    by_range = [[k for k, _ in table.irange(a, b)] for a, b in queries]
+    range_time = time.perf_counter() - start
+    print(f"\n{len(queries)} range queries over {n:,} keys: dict scan + sort {scan_time:.3f}s, "
+          f"irange {range_time:.4f}s, same: {by_scan == by_range}")
+
+    # Bulk load from sorted input
+    pairs = sorted(events.items())
+    start = time.perf_counter()
+    loaded = SortedDict.from_sorted(pairs)
+    print(f"from_sorted of {n:,} pairs: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    one_by_one = SortedDict()
+    for key, value in pairs:
+        one_by_one[key] = value
+    print(f"{n:,} single inserts:     {time.perf_counter() - start:.3f}s, same: {loaded.items() == one_by_one.items()}")
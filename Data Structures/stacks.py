@@ -1,3 +1,9 @@
+from array import array
+from itertools import accumulate
+
+from ring_buffer import TYPECODES, _kind
+
+
 class Stack:
     """
     A Stack implementation using Python list.
@@ -72,17 +78,264 @@ class Stack:
         """
         return len(self.stack) == 0
 
+
+class TypedStack:
+    """
+    A Stack of numbers stored in a typed array.array instead of a list.
+
+    A list holds a pointer to a separate Python int or float object for
+    every element (8 + 24-32 bytes). A typed array stores the raw numbers
+    back to back: 8 bytes each for 'q' (64-bit ints) or 'd' (floats).
+
+    With track_min_max=True, two more arrays remember the smallest and
+    largest value at every height of the stack, so current_min() and
+    current_max() are O(1) even after pops.
+
+    Time Complexity:
+        - push / pop / peek / current_min / current_max: O(1) (push amortized)
+        - push_many / pop_many: O(k) for k elements
+        - snapshot: O(1)
+
+    Space Complexity: O(n), 8 bytes per element for 'q' or 'd'
+        (24 with min/max tracking)
+    """
+
+    def __init__(self, typecode="q", track_min_max=False):
+        """
+        Initialize an empty typed stack.
+
+        Args:
+            typecode (str): array module typecode, e.g. 'q' for 64-bit ints
+                or 'd' for floats (default: 'q')
+            track_min_max (bool): Keep the running min and max (default: False)
+
+        Raises:
+            TypeError: If typecode is not a numeric array typecode
+        """
+        if typecode not in TYPECODES:
+            raise TypeError("Typecode must be a numeric array typecode")
+
+        self.stack = array(typecode)
+        self.track_min_max = track_min_max
+        self._mins = array(typecode)  # _mins[i] is the smallest of stack[0..i]
+        self._maxs = array(typecode)  # _maxs[i] is the largest of stack[0..i]
+
+    def __len__(self):
+        """Return the number of elements. Time Complexity: O(1)"""
+        return len(self.stack)
+
+    def is_empty(self):
+        """Return True if the stack is empty. Time Complexity: O(1)"""
+        return not self.stack
+
+    def push(self, data):
+        """
+        Add a number to the top of the stack.
+
+        Raises:
+            TypeError / OverflowError: If data does not fit the typecode
+
+        Time Complexity: O(1) amortized
+        """
+        self.stack.append(data)
+        if self.track_min_max:
+            if self._mins:
+                self._mins.append(min(self._mins[-1], data))
+                self._maxs.append(max(self._maxs[-1], data))
+            else:
+                self._mins.append(data)
+                self._maxs.append(data)
+
+    def pop(self):
+        """
+        Remove and return the top number.
+
+        Raises:
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        # No separate is_empty() call: an empty array raises IndexError itself
+        try:
+            value = self.stack.pop()
+        except IndexError:
+            raise IndexError("Cannot pop from an empty stack!") from None
+        if self.track_min_max:
+            self._mins.pop()
+            self._maxs.pop()
+        return value
+
+    def peek(self):
+        """
+        Return the top number without removing it.
+
+        Raises:
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        try:
+            return self.stack[-1]
+        except IndexError:
+            raise IndexError("Cannot peek at an empty stack!") from None
+
+    def push_many(self, values):
+        """
+        Push many numbers at once, in order (the last one ends up on top).
+
+        Args:
+            values: An array.array or other buffer of the same typecode
+                (copied as raw bytes), or any iterable of numbers
+
+        Raises:
+            TypeError: If a buffer holds a different element type, or a
+                value is not a number of that type (nothing is pushed then)
+            OverflowError: If a value does not fit in the typecode (nothing
+                is pushed then)
+
+        Time Complexity: O(k) for k values
+        """
+        start = len(self.stack)
+        if isinstance(values, array) and values.typecode == self.stack.typecode:
+            self.stack.extend(values)
+        else:
+            try:
+                view = memoryview(values)
+            except TypeError:
+                # A plain iterable: convert it first, so a bad value pushes nothing
+                self.stack.extend(array(self.stack.typecode, values))
+            else:
+                # Same kind and size under another code (NumPy's int64 is 'l' on Linux) is fine
+                if (view.ndim != 1 or not view.c_contiguous or view.itemsize != self.stack.itemsize
+                        or _kind(view.format) is None or _kind(view.format) != _kind(self.stack.typecode)):
+                    raise TypeError(f"Buffer must hold '{self.stack.typecode}' elements")
+                self.stack.frombytes(view.cast("B"))
+
+        if self.track_min_max and len(self.stack) > start:
+            added = self.stack[start:]
+            low = self._mins[-1] if start else added[0]
+            high = self._maxs[-1] if start else added[0]
+            # Running min and max after each new element
+            self._mins.extend(accumulate(added, min, initial=low))
+            self._maxs.extend(accumulate(added, max, initial=high))
+            del self._mins[start], self._maxs[start]  # Drop the initial value
+
+    def pop_many(self, k):
+        """
+        Remove the top k numbers (or all, if fewer) and return them as an array.
+
+        The result is in stack order: its last element was the top. Use
+        reversed() on it for the order single pops would give.
+
+        Time Complexity: O(k)
+        """
+        start = max(len(self.stack) - k, 0)
+        popped = self.stack[start:]
+        del self.stack[start:]
+        if self.track_min_max:
+            del self._mins[start:]
+            del self._maxs[start:]
+        return popped
+
+    def snapshot(self):
+        """
+        Return a read-only, zero-copy memoryview of the stack, bottom first.
+
+        The array cannot grow or shrink while a view of it exists, so use
+        it in a with block (or call release()) before pushing or popping:
+
+            with stack.snapshot() as view:
+                total = sum(view)
+
+        Time Complexity: O(1)
+        """
+        return memoryview(self.stack).toreadonly()
+
+    def current_min(self):
+        """
+        Return the smallest number in the stack.
+
+        Raises:
+            ValueError: If the stack was created without track_min_max
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        if not self.track_min_max:
+            raise ValueError("Stack was created without track_min_max=True")
+        if not self._mins:
+            raise IndexError("Cannot take the minimum of an empty stack!")
+        return self._mins[-1]
+
+    def current_max(self):
+        """
+        Return the largest number in the stack.
+
+        Raises:
+            ValueError: If the stack was created without track_min_max
+            IndexError: If the stack is empty
+
+        Time Complexity: O(1)
+        """
+        if not self.track_min_max:
+            raise ValueError("Stack was created without track_min_max=True")
+        if not self._maxs:
+            raise IndexError("Cannot take the maximum of an empty stack!")
+        return self._maxs[-1]
+
+
 # Test the Stack class
-stack = Stack()  # Create a new stack instance
-stack.push(10)  # Push 10 onto the stack
-stack.push(20)  # Push 20 onto the stack
-stack.push(30)  # Push 30 onto the stack
+if __name__ == "__main__":
+    stack = Stack()  # Create a new stack instance
+    stack.push(10)  # Push 10 onto the stack
+    stack.push(20)  # Push 20 onto the stack
+    stack.push(30)  # Push 30 onto the stack
+
+    # Peek to see the top element of the stack
+    print("Top element:", stack.peek())  # Output: 30
+
+    # Pop the top element from the stack
+    print("Popped element:", stack.pop())  # Output: 30
+
+    # Print the stack after popping an element
+    print("Stack after pop:", stack.stack)  # Output: [10, 20]
+
+    # Typed stack with running min/max
+    typed = TypedStack("q", track_min_max=True)
+    typed.push_many([5, 3, 8])
+    typed.push(1)
+    print("\nTyped stack:", typed.stack.tolist(), " min:", typed.current_min(), " max:", typed.current_max())
+    print("Popped:", typed.pop(), " min is now:", typed.current_min())
+    with typed.snapshot() as view:
+        print("Snapshot (no copy):", view.tolist())
+    print("pop_many(2):", typed.pop_many(2).tolist(), " left:", typed.stack.tolist())
+
+    import sys
+    import time
+
+    n = 1000000
+    values = array("q", range(n))
+
+    start = time.perf_counter()
+    boxed = Stack()
+    for v in range(n):
+        boxed.push(v)
+    while not boxed.is_empty():
+        boxed.pop()
+    print(f"\n{n:,} pushes and pops: Stack {time.perf_counter() - start:.3f}s", end="")
 
-# Peek to see the top element of the stack
-print("Top element:", stack.peek())  # Output: 30
+    start = time.perf_counter()
+    typed = TypedStack("q")
+    for v in range(n):
+        typed.push(v)
+    for _ in range(n):
+        typed.pop()
+    print(f", TypedStack {time.perf_counter() - start:.3f}s", end="")
 
-# Pop the top element from the stack
-print("Popped element:", stack.pop())  # Output: 30
+    start = time.perf_counter()
+    typed.push_many(values)
+    typed.pop_many(n)
+    print(f", push_many/pop_many {time.perf_counter() - start:.4f}s")
 
-# Print the stack after popping an element
-print("Stack after pop:", stack.stack)  # Output: [10, 20]
+    boxed_bytes = sys.getsizeof(list(range(n))) + sum(sys.getsizeof(v) for v in range(n))
+    print(f"Memory per element: Stack about {boxed_bytes / n:.0f} bytes, TypedStack {values.itemsize} bytes")
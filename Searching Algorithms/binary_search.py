@@ -1,4 +1,64 @@
-def binary_search(arr, target):
+import math
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; binary_search_many falls back to pure Python
+    np = None
+
+
+def _exact_array(values, dtype=None):
+    """
+    Convert a list of numbers to a NumPy array, but only if no value changes.
+
+    Casting can silently change numbers: 2.5 becomes 2 in an int64 array,
+    and 2**53 + 1 becomes 2**53 in a float64 array. Searching with changed
+    numbers would report false hits, so callers fall back to plain Python
+    whenever this returns None.
+
+    Args:
+        values (list): The numbers to convert
+        dtype: NumPy dtype to convert to (default: None, let NumPy choose)
+
+    Returns:
+        numpy.ndarray or None: The array, or None if NumPy is missing, a
+            value is not a number, or any value would change
+    """
+    if np is None:
+        return None
+    try:
+        result = np.asarray(values, dtype=dtype)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    if result.ndim != 1 or result.dtype.kind not in "iuf":
+        return None
+    # Python compares int and float exactly, so this catches every rounding
+    if result.tolist() != values:
+        return None
+    return result
+
+
+def _interpolate(low, high, low_value, high_value, target):
+    """
+    Estimate the index of target from the values at both ends of [low, high].
+
+    Falls back to the midpoint when the estimate cannot be trusted: the
+    difference of two unequal values can round to 0.0 (float(2**53) and
+    2**53 + 1), and huge floats can overflow to inf or nan. The result is
+    always clamped to [low, high].
+    """
+    midpoint = low + (high - low) // 2
+    try:
+        offset = (target - low_value) * (high - low) // (high_value - low_value)
+    except (ZeroDivisionError, OverflowError):
+        return midpoint
+    if isinstance(offset, float) and not math.isfinite(offset):
+        return midpoint
+    return min(max(low + int(offset), low), high)
+
+
+def binary_search(arr, target, return_probes=False):
     """
     Perform binary search on a sorted array.
 
@@ -8,9 +68,11 @@ def binary_search(arr, target):
     Args:
         arr (list): A sorted array to search in (must be sorted in ascending order)
         target: The element to search for
+        return_probes (bool): Also return how many elements were examined (default: False)
 
     Returns:
         int: Index of the target element if found, -1 otherwise
+            (or a tuple (index, probes) if return_probes is True)
 
     Raises:
         TypeError: If arr is not a list
@@ -39,15 +101,17 @@ def binary_search(arr, target):
 
     low = 0  # Set the low index to 0, which is the start of the array
     high = len(arr) - 1  # Set the high index to the last element in the array
+    probes = 0  # Number of elements examined
 
     while low <= high:  # Continue as long as the low index is less than or equal to the high index
         # Use low + (high - low) // 2 to avoid potential integer overflow
         # This is safer than (low + high) // 2 for very large arrays
         mid = low + (high - low) // 2
+        probes += 1
 
         try:
             if arr[mid] == target:  # If the middle element is equal to the target, return the index
-                return mid
+                return (mid, probes) if return_probes else mid
             elif arr[mid] < target:  # If the middle element is less than the target, discard the left half
                 low = mid + 1  # Move the low index to mid + 1
             else:  # If the middle element is greater than the target, discard the right half
@@ -55,7 +119,325 @@ def binary_search(arr, target):
         except TypeError as e:
             raise ValueError(f"Array contains non-comparable elements or target is not comparable: {e}")
 
-    return -1  # Return -1 if the target is not found in the array
+    return (-1, probes) if return_probes else -1  # Return -1 if the target is not found in the array
+
+
+def interpolation_search(arr, target, return_probes=False):
+    """
+    Search a sorted array of numbers by estimating where target should be.
+
+    When values are spread evenly (like sequential IDs), the position of a
+    value can be estimated the way you open a dictionary near "M" for
+    "Mango": pos = low + (target - arr[low]) * (high - low) / (arr[high] - arr[low]).
+    On uniform data this needs only O(log log n) probes.
+
+    On skewed data the estimates can be poor and shrink the range by only
+    one element at a time. To stay safe, whenever an interpolation probe
+    fails to at least halve the search range, the next probe is a plain
+    bisection, so the worst case is about twice binary search's probes.
+
+    Args:
+        arr (list): A sorted array of numbers (ascending order)
+        target: The number to search for
+        return_probes (bool): Also return how many elements were examined (default: False)
+
+    Returns:
+        int: Index of target if found, -1 otherwise
+            (or a tuple (index, probes) if return_probes is True)
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If arr is empty or holds values that are not numbers
+
+    Time Complexity: O(log log n) on uniform data, O(log n) worst case
+    Space Complexity: O(1)
+
+    Examples:
+        >>> interpolation_search([10, 20, 30, 40, 50], 40)
+        3
+        >>> interpolation_search([10, 20, 30, 40, 50], 40, return_probes=True)
+        (3, 1)
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Array must be a list")
+
+    if not arr:
+        raise ValueError("Cannot search in an empty array")
+
+    low, high = 0, len(arr) - 1
+    probes = 0
+    bisect_next = False
+
+    try:
+        while low <= high and arr[low] <= target <= arr[high]:
+            size = high - low
+            if bisect_next or arr[high] == arr[low]:
+                pos = low + size // 2
+            else:
+                # Estimate the position from the values at both ends of the range
+                pos = _interpolate(low, high, arr[low], arr[high], target)
+
+            probes += 1
+            if arr[pos] == target:
+                return (pos, probes) if return_probes else pos
+            elif arr[pos] < target:
+                low = pos + 1
+            else:
+                high = pos - 1
+
+            # Fall back to bisection if this probe did not at least halve the range
+            bisect_next = not bisect_next and high - low > size // 2
+    except TypeError as e:
+        raise ValueError(f"Interpolation search needs numbers: {e}")
+
+    return (-1, probes) if return_probes else -1
+
+
+def exponential_search(arr, target, hint=0, return_probes=False):
+    """
+    Search a sorted array starting from a position where target is likely to be.
+
+    From the hint, the search "gallops" outwards, checking 1, 2, 4, 8, ...
+    places away until it passes target, then binary searches that last gap.
+    If target is d places from the hint, this takes O(log d) probes instead
+    of O(log n), so queries that land near the front (hint=0) or near a
+    previous answer are very cheap.
+
+    Args:
+        arr (list): A sorted array (ascending order)
+        target: The element to search for
+        hint (int): Index to start from (default: 0, the front of the array)
+        return_probes (bool): Also return how many elements were examined (default: False)
+
+    Returns:
+        int: Index of target if found, -1 otherwise
+            (or a tuple (index, probes) if return_probes is True)
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If arr is empty, hint is out of range, or elements are not comparable
+
+    Time Complexity: O(log d) where d is the distance from hint to target
+    Space Complexity: O(1)
+
+    Examples:
+        >>> exponential_search([2, 3, 4, 10, 40], 4)
+        2
+        >>> exponential_search([2, 3, 4, 10, 40], 3, hint=4)
+        1
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Array must be a list")
+
+    if not arr:
+        raise ValueError("Cannot search in an empty array")
+
+    n = len(arr)
+    if not 0 <= hint < n:
+        raise ValueError("Hint must be a valid index")
+
+    probes = 1
+    try:
+        if arr[hint] == target:
+            return (hint, probes) if return_probes else hint
+
+        if arr[hint] < target:
+            # Gallop right: target is after hint, find a bound past it
+            low, step = hint + 1, 1
+            while hint + step < n:
+                probes += 1
+                if not arr[hint + step] < target:
+                    break
+                low = hint + step + 1
+                step *= 2
+            high = min(hint + step, n - 1)
+        else:
+            # Gallop left: target is before hint
+            high, step = hint - 1, 1
+            while hint - step >= 0:
+                probes += 1
+                if not target < arr[hint - step]:
+                    break
+                high = hint - step - 1
+                step *= 2
+            low = max(hint - step, 0)
+
+        # Binary search the gap found by galloping
+        while low <= high:
+            mid = low + (high - low) // 2
+            probes += 1
+            if arr[mid] == target:
+                return (mid, probes) if return_probes else mid
+            elif arr[mid] < target:
+                low = mid + 1
+            else:
+                high = mid - 1
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements or target is not comparable: {e}")
+
+    return (-1, probes) if return_probes else -1
+
+
+def lower_bound(arr, target, low=0, high=None):
+    """
+    Find the first position whose element is not less than target.
+
+    This is where target would be inserted to keep arr sorted, before any
+    equal elements. If target is present, it is the index of its first
+    occurrence.
+
+    Args:
+        arr (list): A sorted array (ascending order)
+        target: The value to look for
+        low (int): Only search from this index (default: 0)
+        high (int): Only search before this index (default: len(arr))
+
+    Returns:
+        int: Index in range [low, high]
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If arr contains elements not comparable with target
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+
+    Examples:
+        >>> lower_bound([1, 2, 2, 2, 5], 2)
+        1
+        >>> lower_bound([1, 2, 2, 2, 5], 3)
+        4
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Array must be a list")
+
+    if high is None:
+        high = len(arr)  # The answer is always in [low, high]
+    try:
+        while low < high:
+            mid = low + (high - low) // 2
+            if arr[mid] < target:
+                low = mid + 1  # arr[mid] is too small, answer is to the right
+            else:
+                high = mid  # arr[mid] could be the answer
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements or target is not comparable: {e}")
+
+    return low
+
+
+def upper_bound(arr, target, low=0, high=None):
+    """
+    Find the first position whose element is greater than target.
+
+    This is where target would be inserted to keep arr sorted, after any
+    equal elements. upper_bound - lower_bound is the number of occurrences.
+
+    Args:
+        arr (list): A sorted array (ascending order)
+        target: The value to look for
+        low (int): Only search from this index (default: 0)
+        high (int): Only search before this index (default: len(arr))
+
+    Returns:
+        int: Index in range [low, high]
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If arr contains elements not comparable with target
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+
+    Examples:
+        >>> upper_bound([1, 2, 2, 2, 5], 2)
+        4
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Array must be a list")
+
+    if high is None:
+        high = len(arr)  # The answer is always in [low, high]
+    try:
+        while low < high:
+            mid = low + (high - low) // 2
+            if target < arr[mid]:
+                high = mid  # arr[mid] could be the answer
+            else:
+                low = mid + 1  # arr[mid] <= target, answer is to the right
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements or target is not comparable: {e}")
+
+    return low
+
+
+def binary_search_many(arr, targets):
+    """
+    Look up many targets in one sorted array with a single call.
+
+    The array is validated once for the whole batch. With NumPy installed
+    and numbers that convert to one array type without rounding, all lookups
+    run as one vectorised searchsorted call (converting the list to an array
+    costs O(n), so pass large batches).
+    Otherwise the targets are sorted and the array is swept once from left
+    to right: each lookup starts where the previous one ended and gallops
+    forward (steps of 1, 2, 4, 8, ...) before a final binary search, so a
+    batch of m targets costs O(m log(n / m)) comparisons instead of
+    O(m log n).
+
+    Args:
+        arr (list): A sorted array (ascending order)
+        targets (iterable): The values to look for
+
+    Returns:
+        numpy.ndarray or array.array: For each target (in the order given),
+            the index of its first occurrence in arr, or -1 if absent.
+            A NumPy int64 array when NumPy was used, otherwise array('q').
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If arr contains elements not comparable with a target
+
+    Time Complexity: O(m log m + m log(n / m)) for m targets
+    Space Complexity: O(m)
+
+    Examples:
+        >>> binary_search_many([2, 3, 4, 10, 40], [10, 5, 2]).tolist()
+        [3, -1, 0]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Array must be a list")
+
+    targets = targets if isinstance(targets, list) else list(targets)
+    n, m = len(arr), len(targets)
+
+    values = _exact_array(arr) if n and m else None
+    wanted = _exact_array(targets, values.dtype) if values is not None else None
+    if wanted is not None:  # Numbers only, and both convert without rounding
+        positions = np.searchsorted(values, wanted, side="left")
+        clipped = np.minimum(positions, n - 1)
+        found = (positions < n) & (values[clipped] == wanted)
+        return np.where(found, positions, -1).astype(np.int64)
+
+    result = array("q", [-1]) * m
+
+    try:
+        order = sorted(range(m), key=targets.__getitem__)  # Targets in ascending order
+        low = 0
+        for index in order:
+            target = targets[index]
+            # Gallop from the previous answer: find a window [low, low + step) holding the answer
+            step = 1
+            while low + step < n and arr[low + step - 1] < target:
+                low += step
+                step *= 2
+            low = bisect_left(arr, target, low, min(low + step, n))
+            if low < n and arr[low] == target:
+                result[index] = low
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements or target is not comparable: {e}")
+
+    return result
 
 
 # Test
@@ -82,3 +464,44 @@ if __name__ == "__main__":
     target = 100
     result = binary_search(arr, target)
     print(f"Searching for {target}: Element found at index {result}" if result != -1 else f"Searching for {target}: Element not found")
+
+    # Batched lookups: validate once, answer many targets
+    print("\nbinary_search_many:", binary_search_many(arr, [10, 100, 2, 40]).tolist())
+
+    dupes = [1, 2, 2, 2, 5]
+    print("Array:", dupes)
+    print("lower_bound(2):", lower_bound(dupes, 2), " upper_bound(2):", upper_bound(dupes, 2))
+
+    import random
+    import time
+
+    big = list(range(0, 2000000, 2))
+    queries = [random.randrange(2000000) for _ in range(200000)]
+    start = time.perf_counter()
+    one_by_one = [binary_search(big, q) for q in queries]
+    single_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = binary_search_many(big, queries)
+    batch_time = time.perf_counter() - start
+    print(f"\n{len(queries):,} lookups: binary_search {single_time:.3f}s, binary_search_many {batch_time:.3f}s")
+    print("Same answers:", batched.tolist() == one_by_one)
+
+    # Probe counts of each mode on uniformly spread IDs
+    ids = sorted(random.sample(range(10 ** 9), 1000000))
+    modes = {
+        "binary": lambda t: binary_search(ids, t, return_probes=True),
+        "interpolation": lambda t: interpolation_search(ids, t, return_probes=True),
+        "exponential (hint=0)": lambda t: exponential_search(ids, t, return_probes=True),
+    }
+    uniform = [random.choice(ids) for _ in range(10000)]
+    recent = [ids[random.randrange(100)] for _ in range(10000)]  # Queries near the front
+    print("\nAverage probes per lookup:")
+    for name, search in modes.items():
+        on_uniform = sum(search(t)[1] for t in uniform) / len(uniform)
+        on_recent = sum(search(t)[1] for t in recent) / len(recent)
+        print(f"  {name:<21} uniform: {on_uniform:5.1f}   near front: {on_recent:5.1f}")
+
+    # Skewed data: interpolation falls back to bisection instead of crawling
+    skewed = [2 ** i for i in range(60)] + list(range(2 ** 60, 2 ** 60 + 100000))
+    _, probes = interpolation_search(skewed, 2 ** 30, return_probes=True)
+    print(f"Interpolation probes on skewed data: {probes} (binary: {binary_search(skewed, 2 ** 30, return_probes=True)[1]})")
@@ -0,0 +1,296 @@
+"""
+Learned index: a piecewise linear model of where each key sits.
+
+In a sorted array, position grows with key value. For real data that
+relationship is close to a straight line over long stretches, so a few
+line segments can predict the position of any key to within a small error
+epsilon. A lookup then:
+
+    1. finds the segment covering the target (binary search over a short
+       array of segment start keys),
+    2. predicts a position with position = start + slope * (target - key),
+    3. runs a lower_bound binary search only inside
+       [prediction - epsilon, prediction + epsilon].
+
+This is the idea behind the PGM-index and RMI. The model holds one segment
+per stretch of "straight" data instead of one entry per key, so it is
+usually thousands of times smaller than the keys themselves.
+
+The segments are fitted in one streaming pass with the "shrinking cone"
+method: each segment starts at a key and keeps the range of slopes that
+still predicts every key seen so far within epsilon. When a new key
+narrows that range to nothing, the segment is closed and a new one starts.
+
+Time Complexity: O(n) to build, O(log s + log epsilon) per lookup for s segments
+Space Complexity: O(s) for the model (the keys are not copied)
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+
+from binary_search import lower_bound
+
+# File header: magic, key typecode, epsilon, number of keys, number of segments.
+# The header and the arrays after it are little-endian on every machine.
+_HEADER = struct.Struct("<4s1sqqq")
+_MAGIC = b"PLA1"
+
+
+class LearnedIndex:
+    """
+    A piecewise linear learned index over a sorted list of numbers.
+
+    Time Complexity:
+        - build: O(n), one pass over the keys
+        - lower_bound / find / in: O(log s + log epsilon)
+
+    Space Complexity: O(s) where s is the number of segments
+    """
+
+    def __init__(self, keys, epsilon=64, typecode="q"):
+        """
+        Fit the model to a sorted list of numbers.
+
+        Args:
+            keys (list): Numbers sorted in ascending order (kept by reference, not copied)
+            epsilon (int): Maximum prediction error in positions (default: 64)
+            typecode (str): 'q' for 64-bit integer keys or 'd' for floats (default: 'q')
+
+        Raises:
+            TypeError: If keys is not a list, epsilon is not an int, or
+                typecode is not 'q' or 'd'
+            ValueError: If epsilon is negative or keys are not sorted
+        """
+        if not isinstance(keys, list):
+            raise TypeError("Keys must be a list")
+
+        if typecode not in ("q", "d"):
+            raise TypeError("Typecode must be 'q' (integers) or 'd' (floats)")
+
+        # Epsilon becomes slice bounds in lower_bound, so it must be a whole number
+        if not isinstance(epsilon, int) or isinstance(epsilon, bool):
+            raise TypeError("Epsilon must be an int")
+
+        if epsilon < 0:
+            raise ValueError("Epsilon must not be negative")
+
+        self.keys = keys
+        self.epsilon = epsilon
+        self._start_keys = array(typecode)  # First key of each segment
+        self._start_positions = array("q")  # Position of that key
+        self._slopes = array("d")  # Positions per unit of key
+
+        if not keys:
+            return
+
+        # Shrinking cone: the slopes still allowed for the current segment
+        start_key, start_position = keys[0], 0
+        slope_low, slope_high = 0.0, float("inf")
+        previous = keys[0]
+
+        for position in range(1, len(keys)):
+            key = keys[position]
+            if key < previous:
+                raise ValueError("Keys must be sorted in ascending order")
+            if key == previous:
+                continue  # Only the first of equal keys matters to lower_bound
+            previous = key
+
+            # Slopes that put this key within epsilon of its real position
+            distance = key - start_key
+            low = (position - epsilon - start_position) / distance
+            high = (position + epsilon - start_position) / distance
+
+            if max(slope_low, low) > min(slope_high, high):
+                # No line fits every key: close this segment and start a new one here
+                self._add_segment(start_key, start_position, slope_low, slope_high)
+                start_key, start_position = key, position
+                slope_low, slope_high = 0.0, float("inf")
+            else:
+                slope_low, slope_high = max(slope_low, low), min(slope_high, high)
+
+        self._add_segment(start_key, start_position, slope_low, slope_high)
+
+    def _add_segment(self, start_key, start_position, slope_low, slope_high):
+        """Store a segment using the middle of its allowed slope range."""
+        slope = slope_low if slope_high == float("inf") else (slope_low + slope_high) / 2
+        self._start_keys.append(start_key)
+        self._start_positions.append(start_position)
+        self._slopes.append(slope)
+
+    def __len__(self):
+        """Return the number of keys. Time Complexity: O(1)"""
+        return len(self.keys)
+
+    @property
+    def segment_count(self):
+        """Number of line segments in the model."""
+        return len(self._slopes)
+
+    def size_in_bytes(self):
+        """
+        Return the memory used by the model's segment arrays.
+
+        Each segment costs 24 bytes (start key, start position, slope).
+
+        Time Complexity: O(1)
+        """
+        return sum(part.itemsize * len(part)
+                   for part in (self._start_keys, self._start_positions, self._slopes))
+
+    def predict(self, target):
+        """
+        Return the model's predicted position for target, clamped to [0, n].
+
+        Time Complexity: O(log s)
+        """
+        segment = bisect_right(self._start_keys, target) - 1
+        if segment < 0:
+            return 0  # Smaller than every key
+        guess = (self._start_positions[segment]
+                 + self._slopes[segment] * (target - self._start_keys[segment]))
+        return min(max(int(guess), 0), len(self.keys))
+
+    def lower_bound(self, target):
+        """
+        Return the position of the first key that is >= target.
+
+        The binary search only covers the error window around the
+        prediction. Between two keys the model can be off by a little more
+        than epsilon (for example after a long run of duplicates), so the
+        window is widened in the rare case its answer lies on an edge.
+
+        Returns:
+            int: Index in range [0, n]
+
+        Time Complexity: O(log s + log epsilon)
+        """
+        keys = self.keys
+        n = len(keys)
+        guess = self.predict(target)
+        low = max(guess - self.epsilon - 1, 0)
+        high = min(guess + self.epsilon + 2, n)
+
+        width = self.epsilon + 2
+        while low > 0 and not keys[low - 1] < target:  # Answer is further left
+            low = max(low - width, 0)
+            width *= 2
+        width = self.epsilon + 2
+        while high < n and keys[high - 1] < target:  # Answer is further right
+            high = min(high + width, n)
+            width *= 2
+
+        return lower_bound(keys, target, low, high)
+
+    def find(self, target):
+        """
+        Return the position of target, or -1 if it is not a key.
+
+        With duplicate keys, the position of the first one is returned.
+
+        Time Complexity: O(log s + log epsilon)
+        """
+        position = self.lower_bound(target)
+        if position < len(self.keys) and self.keys[position] == target:
+            return position
+        return -1
+
+    def __contains__(self, target):
+        """Return True if target is one of the keys. Time Complexity: O(log s + log epsilon)"""
+        return self.find(target) != -1
+
+    def save(self, path):
+        """
+        Write the model (not the keys) to a binary file.
+
+        Everything is written little-endian, so the file can be loaded on
+        any machine.
+
+        Args:
+            path (str): File to write
+
+        Time Complexity: O(s)
+        """
+        typecode = self._start_keys.typecode
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, typecode.encode(), self.epsilon,
+                                 len(self.keys), self.segment_count))
+            for part in (self._start_keys, self._start_positions, self._slopes):
+                if sys.byteorder != "little":
+                    part = array(part.typecode, part)  # Swap a copy, not the live model
+                    part.byteswap()
+                part.tofile(f)
+
+    @classmethod
+    def load(cls, path, keys):
+        """
+        Read a model written by save and attach it to the same sorted keys.
+
+        Args:
+            path (str): File written by save
+            keys (list): The sorted keys the model was built from
+
+        Returns:
+            LearnedIndex: The loaded index
+
+        Raises:
+            ValueError: If the file is not a saved model or keys has a different length
+
+        Time Complexity: O(s)
+        """
+        with open(path, "rb") as f:
+            magic, typecode, epsilon, n, segments = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError("Not a saved LearnedIndex file")
+            if n != len(keys):
+                raise ValueError(f"Model was built for {n} keys, got {len(keys)}")
+
+            index = cls([], epsilon, typecode.decode())
+            index.keys = keys
+            for part in (index._start_keys, index._start_positions, index._slopes):
+                part.fromfile(f, segments)
+                if sys.byteorder != "little":
+                    part.byteswap()
+        return index
+
+
+# Test
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from binary_search import binary_search
+
+    keys = [3, 5, 7, 9, 100, 200, 300, 400, 401, 402]
+    index = LearnedIndex(keys, epsilon=1)
+    print("Keys:", keys)
+    print("Segments:", index.segment_count)
+    print("find(300):", index.find(300), " find(6):", index.find(6), " lower_bound(6):", index.lower_bound(6))
+
+    # A million sorted IDs with gaps
+    n = 1000000
+    ids = sorted(random.sample(range(50 * n), n))
+    start = time.perf_counter()
+    index = LearnedIndex(ids, epsilon=64)
+    print(f"\nBuilt over {n:,} keys in {time.perf_counter() - start:.2f}s: "
+          f"{index.segment_count:,} segments, {index.size_in_bytes():,} bytes "
+          f"(the key list itself: {sys.getsizeof(ids):,} bytes of pointers alone)")
+
+    queries = [random.choice(ids) for _ in range(100000)]
+    start = time.perf_counter()
+    expected = [binary_search(ids, q) for q in queries]
+    print(f"binary_search: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    answers = [index.find(q) for q in queries]
+    print(f"LearnedIndex:  {time.perf_counter() - start:.3f}s  same: {answers == expected}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "ids.pla")
+        index.save(path)
+        loaded = LearnedIndex.load(path, ids)
+        print(f"Saved model: {os.path.getsize(path):,} bytes, reloaded answers match: "
+              f"{[loaded.find(q) for q in queries[:1000]] == expected[:1000]}")
@@ -0,0 +1,393 @@
+"""
+Searching sorted key files on disk without loading them (memory-mapped search).
+
+binary_search needs a Python list, so a file of a billion sorted keys
+would first have to be read completely and turned into a billion Python
+ints. A binary search only looks at about 30 of them.
+
+mmap maps the file into memory instead: the operating system reads a page
+(usually 4 KiB) from disk the first time it is touched and never reads the
+rest. Searching through the mapping with a memoryview costs O(log n) page
+reads, so the first lookup in a 50 GB file takes milliseconds rather than
+the minutes a full load would.
+
+The file holds fixed-width little-endian numbers back to back (the format
+written by external_merge_sort), or fixed-width records whose key sits at
+a fixed byte offset inside each record:
+
+    keys only (record_size=8):     | key0 | key1 | key2 | ...
+    records (record_size=16, key_offset=8):
+                                   | id0  key0 | id1  key1 | ...
+
+The keys must already be sorted; checking would mean reading the whole file.
+
+Time Complexity: O(1) to open, O(log n) page reads per lookup
+Space Complexity: O(1) - pages are cached by the operating system, not Python
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from binary_search import _exact_array, _interpolate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; find_many falls back to pure Python
+    np = None
+
+# Typecodes with the same size in array (native) and struct ('<', standard)
+KEY_TYPECODES = frozenset("bBhHiIqQfd")
+
+
+class SortedKeyFile:
+    """
+    Read-only search over a memory-mapped file of sorted fixed-width keys.
+
+    Use it as a context manager so the mapping is closed afterwards:
+
+        with SortedKeyFile("ids.bin") as keys:
+            keys.find(123456789)
+
+    Time Complexity:
+        - open: O(1), nothing is read
+        - find / lower_bound: O(log n)
+        - interpolation_find: O(log log n) on evenly spread keys
+        - find_many: O(m log m + m log(n / m)) for m targets
+
+    Space Complexity: O(1)
+    """
+
+    def __init__(self, path, typecode="q", record_size=None, key_offset=0):
+        """
+        Map a file of sorted records.
+
+        Args:
+            path (str): The file to search
+            typecode (str): array module typecode of the key, e.g. 'q' for
+                8-byte signed integers or 'd' for 8-byte floats (default: 'q')
+            record_size (int): Bytes per record (default: the key size, a file of keys only)
+            key_offset (int): Byte offset of the key inside each record (default: 0)
+
+        Raises:
+            TypeError: If typecode is not a supported numeric typecode
+            ValueError: If the key does not fit inside a record, or the file
+                size is not a whole number of records
+        """
+        if typecode not in KEY_TYPECODES:
+            raise TypeError(f"Typecode must be one of {' '.join(sorted(KEY_TYPECODES))}")
+
+        key_format = struct.Struct("<" + typecode)
+        if record_size is None:
+            record_size = key_format.size
+        if key_offset < 0 or key_offset + key_format.size > record_size:
+            raise ValueError("Key must fit inside a record")
+
+        self.typecode = typecode
+        self.record_size = record_size
+        self.key_offset = key_offset
+        self._view = None
+
+        with open(path, "rb") as f:
+            size = f.seek(0, 2)
+            if size % record_size:
+                raise ValueError(f"File size is not a multiple of the {record_size}-byte record size")
+            self._size = size // record_size
+            # mmap cannot map an empty file; an empty file simply has no keys
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        if self._map is None:
+            self._key = None
+        elif record_size == key_format.size and sys.byteorder == "little":
+            # A plain key file in this machine's byte order: index the mapping directly
+            self._view = memoryview(self._map).cast(typecode)
+            self._key = self._view.__getitem__
+        else:
+            # Records (or a big-endian machine): decode each key where it sits
+            unpack_from = key_format.unpack_from
+            mapping = self._map
+
+            def key_at(i):
+                return unpack_from(mapping, i * record_size + key_offset)[0]
+
+            self._key = key_at
+
+    def close(self):
+        """Unmap the file. Lookups after close raise ValueError."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._key = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_open(self):
+        """Raise ValueError if the file was closed."""
+        if self._key is None and self._size:
+            raise ValueError("File is closed")
+
+    def __len__(self):
+        """Return the number of records. Time Complexity: O(1)"""
+        return self._size
+
+    def __getitem__(self, index):
+        """
+        Return the key of record index (negative indices count from the end).
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(1), at most one page read
+        """
+        self._check_open()
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Record index out of range")
+        return self._key(index)
+
+    def record(self, index):
+        """
+        Return the bytes of record index as a read-only memoryview (no copy).
+
+        Negative indices count from the end, as in __getitem__. The view
+        points into the mapping, so drop it (or copy it with bytes()) before
+        closing the file.
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time Complexity: O(1)
+        """
+        self._check_open()
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Record index out of range")
+        start = index * self.record_size
+        return memoryview(self._map)[start:start + self.record_size]
+
+    def lower_bound(self, target, low=0, high=None):
+        """
+        Return the position of the first key that is >= target.
+
+        Args:
+            target: The number to look for
+            low (int): Only search from this index (default: 0)
+            high (int): Only search before this index (default: number of records)
+
+        Returns:
+            int: Index in range [low, high]
+
+        Time Complexity: O(log n)
+        """
+        self._check_open()
+        key = self._key
+        if high is None:
+            high = self._size
+        while low < high:
+            mid = low + (high - low) // 2
+            if key(mid) < target:
+                low = mid + 1  # Answer is to the right of mid
+            else:
+                high = mid  # key(mid) could be the answer
+        return low
+
+    def find(self, target, return_probes=False):
+        """
+        Binary search for target.
+
+        Args:
+            target: The number to look for
+            return_probes (bool): Also return how many keys were read (default: False)
+
+        Returns:
+            int: Index of the first record with this key, or -1 if absent
+                (or a tuple (index, probes) if return_probes is True)
+
+        Time Complexity: O(log n)
+        """
+        self._check_open()
+        key = self._key
+        low, high = 0, self._size
+        probes = 0
+        while low < high:
+            mid = low + (high - low) // 2
+            probes += 1
+            if key(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+
+        position = -1
+        if low < self._size:
+            probes += 1
+            if key(low) == target:
+                position = low
+        return (position, probes) if return_probes else position
+
+    def interpolation_find(self, target, return_probes=False):
+        """
+        Search for target by estimating its position from the key values.
+
+        Works like interpolation_search in binary_search.py, including the
+        bisection step whenever an estimate fails to halve the range (or
+        cannot be computed, e.g. when huge float keys overflow). On
+        evenly spread keys this reads O(log log n) keys, so far fewer pages
+        are touched on a cold file.
+
+        Args:
+            target: The number to look for
+            return_probes (bool): Also return how many keys were read (default: False)
+
+        Returns:
+            int: Index of a record with this key, or -1 if absent
+                (or a tuple (index, probes) if return_probes is True)
+
+        Time Complexity: O(log log n) on evenly spread keys, O(log n) worst case
+        """
+        self._check_open()
+        key = self._key
+        low, high = 0, self._size - 1
+        probes = 0
+        bisect_next = False
+
+        if high >= 0:
+            low_key, high_key = key(low), key(high)
+            probes += 2
+            while low <= high and low_key <= target <= high_key:
+                size = high - low
+                if bisect_next or high_key == low_key:
+                    pos = low + size // 2
+                else:
+                    # Estimate the position from the keys at both ends of the range
+                    pos = _interpolate(low, high, low_key, high_key, target)
+
+                probes += 1
+                value = key(pos)
+                if value == target:
+                    return (pos, probes) if return_probes else pos
+                elif value < target:
+                    low = pos + 1
+                    if low <= high:
+                        low_key = key(low)
+                        probes += 1
+                else:
+                    high = pos - 1
+                    if low <= high:
+                        high_key = key(high)
+                        probes += 1
+
+                # Fall back to bisection if this probe did not at least halve the range
+                bisect_next = not bisect_next and high - low > size // 2
+
+        return (-1, probes) if return_probes else -1
+
+    def find_many(self, targets):
+        """
+        Look up many targets at once.
+
+        With NumPy and a plain key file in little-endian order, the mapping is
+        viewed as a NumPy array without copying and searched with one
+        searchsorted call, as long as no target would change in the file's
+        number type (2.5 in a file of integers). Otherwise the targets are
+        sorted and the file is swept once from left to right, galloping
+        forward from each answer as binary_search_many does, so nearby
+        targets share the pages they read.
+
+        Args:
+            targets (iterable): Numbers to look up
+
+        Returns:
+            numpy.ndarray or array.array: For each target (in the order
+                given), the index of its first record, or -1 if absent
+
+        Time Complexity: O(m log m + m log(n / m)) for m targets
+        """
+        self._check_open()
+        targets = targets if isinstance(targets, list) else list(targets)
+        n, m = self._size, len(targets)
+
+        if np is not None and self._view is not None and m:
+            keys = np.frombuffer(self._view, dtype=np.dtype(self.typecode))
+            wanted = _exact_array(targets, keys.dtype)
+            if wanted is not None:  # None: a target would change in the file's type (2.5 -> 2)
+                positions = np.searchsorted(keys, wanted, side="left")
+                clipped = np.minimum(positions, n - 1)
+                found = (positions < n) & (keys[clipped] == wanted)
+                result = np.where(found, positions, -1).astype(np.int64)
+                del keys, clipped  # Let go of the mapping so close() can unmap it
+                return result
+            del keys
+
+        result = array("q", [-1]) * m
+        key = self._key
+        low = 0
+        for index in sorted(range(m), key=targets.__getitem__):  # Targets in ascending order
+            target = targets[index]
+            # Gallop from the previous answer: find a window [low, low + step) holding the answer
+            step = 1
+            while low + step < n and key(low + step - 1) < target:
+                low += step
+                step *= 2
+            low = self.lower_bound(target, low, min(low + step, n))
+            if low < n and key(low) == target:
+                result[index] = low
+        return result
+
+
+# Test
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from binary_search import binary_search
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # A file of 8-byte keys, written in little-endian order
+        path = os.path.join(workdir, "ids.bin")
+        ids = sorted(random.sample(range(10 ** 12), 2000000))
+        with open(path, "wb") as f:
+            f.write(struct.pack(f"<{len(ids)}q", *ids))
+
+        start = time.perf_counter()
+        with SortedKeyFile(path) as keys:
+            opened = time.perf_counter() - start
+            target = ids[1234567]
+            index, probes = keys.find(target, return_probes=True)
+            print(f"Opened {os.path.getsize(path):,} bytes in {opened * 1000:.2f} ms")
+            print(f"find({target}) -> {index}, {probes} keys read")
+            print("interpolation_find probes:", keys.interpolation_find(target, return_probes=True)[1])
+            print("Missing key:", keys.find(-1))
+
+            queries = [random.choice(ids) for _ in range(100000)] + [random.randrange(10 ** 12) for _ in range(100000)]
+            expected = [binary_search(ids, q) for q in queries]
+            start = time.perf_counter()
+            answers = [keys.find(q) for q in queries]
+            print(f"\n{len(queries):,} lookups: find {time.perf_counter() - start:.3f}s, same: {answers == expected}")
+            start = time.perf_counter()
+            batched = keys.find_many(queries)
+            print(f"  find_many {time.perf_counter() - start:.3f}s, same: {list(map(int, batched)) == expected}")
+
+        # Records of (8-byte id, 8-byte float score), sorted by score
+        path = os.path.join(workdir, "scores.bin")
+        scores = sorted(random.random() for _ in range(1000))
+        with open(path, "wb") as f:
+            for i, score in enumerate(scores):
+                f.write(struct.pack("<qd", 1000 + i, score))
+
+        with SortedKeyFile(path, typecode="d", record_size=16, key_offset=8) as records:
+            index = records.find(scores[500])
+            record_id, score = struct.unpack("<qd", records.record(index))
+            print(f"\nRecord file: score {score:.4f} found at {index}, id {record_id}")
+            print("find_many on records:", records.find_many([scores[0], 2.0, scores[-1]]).tolist())
@@ -0,0 +1,263 @@
+"""
+Rabin-Karp substring search using a polynomial rolling hash.
+
+The hash of a window of text is the same base-31 polynomial used by
+simple_hash in Data Structures/hash.py:
+
+    hash(c1 c2 ... cL) = c1 * 31^(L-1) + c2 * 31^(L-2) + ... + cL
+
+taken modulo 2^64. Sliding the window one character to the right only
+needs to remove the leftmost term and append one new character, so every
+window of length L gets its hash in O(1) after the first.
+
+To search for many patterns at once, patterns are grouped by length. One
+rolling pass per distinct length checks every window against all patterns
+of that length with a single dictionary lookup, so adding more patterns of
+the same length costs almost nothing. A matching hash is always confirmed
+by comparing the actual characters, so collisions never cause false hits.
+
+Time Complexity: O(n * d + matches * L) on average, where n is the text
+    length and d the number of distinct pattern lengths
+Space Complexity: O(total pattern length), plus one chunk when streaming
+"""
+
+BASE = 31  # Same multiplier as simple_hash
+MODULUS = 2 ** 64  # Hashes wrap around like unsigned 64-bit integers
+_MASK = MODULUS - 1
+
+
+def polynomial_hash(text):
+    """
+    Compute the base-31 polynomial hash of a string or bytes object modulo 2^64.
+
+    For strings this equals simple_hash(text, 2 ** 64).
+
+    Args:
+        text (str or bytes): The characters to hash
+
+    Returns:
+        int: Hash value in range [0, 2^64 - 1]
+
+    Time Complexity: O(L) where L is the length of text
+    Space Complexity: O(1)
+    """
+    codes = text if isinstance(text, bytes) else map(ord, text)
+    hash_value = 0
+    for code in codes:
+        hash_value = (hash_value * BASE + code) & _MASK
+    return hash_value
+
+
+def _group_patterns(patterns, text_type):
+    """
+    Validate patterns and group them as {length: {hash: [patterns]}}.
+
+    Raises:
+        TypeError: If a pattern is not the same type as the text (str or bytes)
+        ValueError: If there are no patterns or a pattern is empty
+    """
+    groups = {}
+    for pattern in patterns:
+        if not isinstance(pattern, text_type):
+            raise TypeError(f"Patterns must be {text_type.__name__}, like the text")
+        if not pattern:
+            raise ValueError("Patterns cannot be empty")
+        by_hash = groups.setdefault(len(pattern), {})
+        matches = by_hash.setdefault(polynomial_hash(pattern), [])
+        if pattern not in matches:  # Ignore duplicate patterns
+            matches.append(pattern)
+
+    if not groups:
+        raise ValueError("At least one pattern is required")
+
+    return groups
+
+
+def _scan(buffer, groups, min_end=0):
+    """
+    Find every pattern occurrence in buffer, as (start index, pattern) pairs.
+
+    Only matches that end after index min_end are reported; the streaming
+    search uses this to skip matches already reported in the previous chunk.
+    """
+    codes = buffer if isinstance(buffer, bytes) else list(map(ord, buffer))
+    n = len(codes)
+    found = []
+
+    for length, by_hash in groups.items():
+        if length > n:
+            continue
+
+        # 31^(L-1) is the weight of the character leaving the window
+        high = pow(BASE, length - 1, MODULUS)
+
+        window_hash = 0
+        for i in range(length):
+            window_hash = (window_hash * BASE + codes[i]) & _MASK
+
+        start = 0
+        while True:
+            candidates = by_hash.get(window_hash)
+            if candidates is not None and start + length > min_end:
+                window = buffer[start:start + length]
+                for pattern in candidates:
+                    if window == pattern:  # Confirm, since different text can share a hash
+                        found.append((start, pattern))
+                        break
+
+            end = start + length
+            if end >= n:
+                break
+            # Roll: drop codes[start], shift everything one place, add codes[end]
+            window_hash = ((window_hash - codes[start] * high) * BASE + codes[end]) & _MASK
+            start += 1
+
+    found.sort(key=lambda match: match[0])
+    return found
+
+
+def rabin_karp_search(text, pattern):
+    """
+    Find every occurrence of pattern in text using Rabin-Karp.
+
+    Args:
+        text (str or bytes): The text to search in
+        pattern (str or bytes): The non-empty pattern to find (same type as text)
+
+    Returns:
+        list: Start indices of all occurrences, in increasing order (overlaps included)
+
+    Raises:
+        TypeError: If text is not str or bytes, or pattern is not the same type
+        ValueError: If pattern is empty
+
+    Time Complexity: O(n + m * L) average, where m is the number of matches
+    Space Complexity: O(n) for str text (its character codes), O(1) extra for bytes
+
+    Examples:
+        >>> rabin_karp_search("abracadabra", "abra")
+        [0, 7]
+        >>> rabin_karp_search("aaaa", "aa")
+        [0, 1, 2]
+    """
+    return rabin_karp_search_many(text, [pattern])[pattern]
+
+
+def rabin_karp_search_many(text, patterns):
+    """
+    Find every occurrence of each of several patterns in text.
+
+    Args:
+        text (str or bytes): The text to search in
+        patterns (iterable): Non-empty patterns of the same type as text
+
+    Returns:
+        dict: Maps each pattern to the sorted list of its start indices
+              (an empty list if it does not occur)
+
+    Raises:
+        TypeError: If text is not str or bytes, or a pattern is not the same type
+        ValueError: If there are no patterns or a pattern is empty
+
+    Time Complexity: O(n * d + m * L) average, where d is the number of distinct pattern lengths
+    Space Complexity: O(n + total pattern length)
+
+    Examples:
+        >>> rabin_karp_search_many("the cat sat on the mat", ["at", "the"])
+        {'at': [5, 9, 20], 'the': [0, 15]}
+    """
+    if not isinstance(text, (str, bytes)):
+        raise TypeError("Text must be a str or bytes")
+
+    patterns = list(patterns)
+    groups = _group_patterns(patterns, type(text))
+
+    results = {pattern: [] for pattern in patterns}
+    for start, pattern in _scan(text, groups):
+        results[pattern].append(start)
+    return results
+
+
+def rabin_karp_search_stream(stream, patterns, chunk_size=1 << 20):
+    """
+    Search a file-like object for several patterns, one chunk at a time.
+
+    Only one chunk (plus the last longest-pattern-length - 1 characters of
+    the previous chunk, so matches across a chunk boundary are not lost) is
+    held in memory at once, so files far larger than RAM can be scanned.
+    Works with files opened in text mode (str patterns) or binary mode
+    (bytes patterns); binary mode is faster for large logs.
+
+    Args:
+        stream: An object with a read(size) method, such as an open file
+        patterns (iterable): Non-empty patterns of the same type the stream returns
+        chunk_size (int): Number of characters or bytes to read at a time (default: 1 MiB)
+
+    Yields:
+        tuple: (offset, pattern) for each occurrence, where offset counts
+               characters (text mode) or bytes (binary mode) from the start
+               of the stream. Matches are sorted by offset within each chunk.
+
+    Raises:
+        TypeError: If a pattern is not the same type as the stream's data
+        ValueError: If chunk_size is not positive, there are no patterns, or a pattern is empty
+
+    Time Complexity: O(n * d + m * L) average
+    Space Complexity: O(chunk_size + total pattern length)
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    patterns = list(patterns)
+    groups = None
+    overlap = 0
+    tail = None
+    offset = 0  # Stream position of the first character of tail
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        if groups is None:  # The first chunk tells us whether we are reading str or bytes
+            groups = _group_patterns(patterns, type(chunk))
+            overlap = max(groups) - 1
+            tail = chunk[:0]
+
+        buffer = tail + chunk
+        # Matches lying entirely inside tail were already reported last time
+        for start, pattern in _scan(buffer, groups, min_end=len(tail)):
+            yield offset + start, pattern
+
+        # Keep just enough of the end to catch a match that crosses into the next chunk
+        keep = min(overlap, len(buffer))
+        offset += len(buffer) - keep
+        tail = buffer[len(buffer) - keep:]
+
+
+# Test
+if __name__ == "__main__":
+    import io
+
+    text = "the cat sat on the mat with another cat"
+    print("Text:", text)
+    print("Occurrences of 'cat':", rabin_karp_search(text, "cat"))
+    print("Many patterns:", rabin_karp_search_many(text, ["at", "the", "cat", "dog"]))
+
+    # The same value as simple_hash("Alice", 2 ** 64). Taken mod 100 it only
+    # matches simple_hash("Alice") for short keys: longer ones wrap past 2^64
+    print("64-bit hash of 'Alice':", polynomial_hash("Alice"))
+
+    # Streaming with a tiny chunk size, so matches cross chunk boundaries
+    log = b"GET /index ERROR timeout\nGET /api WARN slow\nPOST /api ERROR refused\n" * 3
+    matches = list(rabin_karp_search_stream(io.BytesIO(log), [b"ERROR", b"WARN"], chunk_size=7))
+    print("\nStreamed matches:", matches)
+
+    # Compare with a naive str.find loop per pattern
+    naive = []
+    for token in (b"ERROR", b"WARN"):
+        position = log.find(token)
+        while position != -1:
+            naive.append((position, token))
+            position = log.find(token, position + 1)
+    print("Same as naive search:", sorted(matches) == sorted(naive))
@@ -0,0 +1,215 @@
+"""
+Static sorted index using the Eytzinger (breadth-first) layout.
+
+A plain binary search jumps across the whole array: the first probes land
+n/2, n/4, n/8 ... elements apart, so on a large array nearly every probe is
+a cache miss. The Eytzinger layout stores the same sorted keys in the order
+of a breadth-first walk of the implicit binary search tree:
+
+    sorted:     [10, 20, 30, 40, 50, 60, 70]
+    eytzinger:  [_, 40, 20, 60, 10, 30, 50, 70]    (index 0 unused)
+
+The root is at index 1 and the children of index k are at 2k and 2k + 1.
+The first few levels of the tree (the probes every search makes) sit next
+to each other at the front of the array and stay in cache, and the two
+children of a node are neighbours, so one cache line often holds both
+possible next probes.
+
+The search loop has no if/else on the comparison result: it computes the
+next index arithmetically as k = 2k + (key < target), the same
+"branchless" step used by fast C implementations.
+
+Keys are stored in a typed array.array (8 bytes each, no Python objects),
+and batched lookups walk the tree level by level with NumPy when available.
+
+Time Complexity: O(n) to build, O(log n) per lookup
+Space Complexity: O(n) - the keys plus one rank per key
+"""
+
+from array import array
+
+from binary_search import _exact_array, binary_search
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; search_many falls back to pure Python
+    np = None
+
+
+class StaticSortedIndex:
+    """
+    An immutable search index over sorted numeric keys in Eytzinger layout.
+
+    Lookups return positions in the original sorted list, so the index can
+    stand in for binary_search on data that never changes.
+
+    Time Complexity:
+        - build: O(n)
+        - lower_bound / find / in: O(log n)
+        - search_many: O(m log n) for m targets
+
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, keys, typecode="q"):
+        """
+        Build the index from a sorted list of numbers.
+
+        Args:
+            keys (list): Numbers sorted in ascending order
+            typecode (str): 'q' for 64-bit integers or 'd' for floats (default: 'q')
+
+        Raises:
+            TypeError: If keys is not a list or typecode is not 'q' or 'd'
+            ValueError: If keys are not sorted
+        """
+        if not isinstance(keys, list):
+            raise TypeError("Keys must be a list")
+
+        if typecode not in ("q", "d"):
+            raise TypeError("Typecode must be 'q' (integers) or 'd' (floats)")
+
+        if any(keys[i + 1] < keys[i] for i in range(len(keys) - 1)):
+            raise ValueError("Keys must be sorted in ascending order")
+
+        n = len(keys)
+        self._size = n
+        self._tree = array(typecode, bytes(8 * (n + 1)))  # Eytzinger order, index 0 unused
+        self._rank = array("q", bytes(8 * (n + 1)))  # Sorted position of each tree slot
+        self._rank[0] = n  # Slot 0 means "no key is >= target": the position is n
+
+        # An in-order walk of the implicit tree visits slots in sorted order,
+        # so handing out the sorted keys during that walk builds the layout
+        next_key = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:  # Go as far left as possible
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._tree[k] = keys[next_key]
+            self._rank[k] = next_key
+            next_key += 1
+            k = 2 * k + 1  # Then visit the right subtree
+
+    def __len__(self):
+        """Return the number of keys. Time Complexity: O(1)"""
+        return self._size
+
+    def _slot(self, target):
+        """Return the tree slot of the first key >= target, or 0 if there is none."""
+        tree = self._tree
+        n = self._size
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < target)  # Left child if tree[k] >= target, else right
+        # The path went right (bit 1) and left (bit 0) at each level. The answer
+        # is the last node where it went left: drop the trailing 1s and that 0.
+        return k >> ((~k & (k + 1)).bit_length())
+
+    def lower_bound(self, target):
+        """
+        Return the sorted position of the first key that is >= target.
+
+        Returns:
+            int: Index in range [0, n]; n means every key is smaller than target
+
+        Time Complexity: O(log n)
+        """
+        return self._rank[self._slot(target)]
+
+    def find(self, target):
+        """
+        Return the sorted position of target, or -1 if it is not a key.
+
+        With duplicate keys, the position of the first one is returned.
+
+        Time Complexity: O(log n)
+        """
+        slot = self._slot(target)
+        if slot and self._tree[slot] == target:
+            return self._rank[slot]
+        return -1
+
+    def __contains__(self, target):
+        """Return True if target is one of the keys. Time Complexity: O(log n)"""
+        return self.find(target) != -1
+
+    def search_many(self, targets):
+        """
+        Look up many targets at once, returning sorted positions or -1.
+
+        With NumPy, all targets walk down the tree together: each loop step
+        moves every target one level deeper with a few array operations.
+        If a target would change in the tree's number type (2.5 in an index
+        of integers), the batch is looked up with find instead.
+
+        Args:
+            targets (iterable): Numbers to look up
+
+        Returns:
+            numpy.ndarray or array.array: Position of each target, or -1 if absent
+
+        Time Complexity: O(m log n) for m targets
+        """
+        targets = targets if isinstance(targets, list) else list(targets)
+
+        if np is None or not targets or not self._size:
+            return array("q", (self.find(t) for t in targets))
+
+        tree = np.frombuffer(self._tree, dtype=np.int64 if self._tree.typecode == "q" else np.float64)
+        wanted = _exact_array(targets, tree.dtype)
+        if wanted is None:  # A target would change in the tree's type (e.g. 2.5 -> 2)
+            return array("q", (self.find(t) for t in targets))
+
+        n = self._size
+        depth = n.bit_length()  # After this many steps every path has left the tree
+        rank = np.frombuffer(self._rank, dtype=np.int64)
+        # Pad so indices past the last slot can still be read; those steps go right
+        padded = np.zeros(1 << (depth + 1), dtype=tree.dtype)
+        padded[:n + 1] = tree
+
+        k = np.ones(len(wanted), dtype=np.int64)
+        for _ in range(depth):
+            k = 2 * k + ((k > n) | (padded[k] < wanted))
+        # Drop the trailing 1s and the last 0, exactly as in _slot
+        lowest_zero = ~k & (k + 1)
+        slots = k >> (np.log2(lowest_zero).astype(np.int64) + 1)
+
+        found = (slots > 0) & (padded[slots] == wanted)
+        return np.where(found, rank[slots], -1)
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    keys = [10, 20, 30, 40, 50, 60, 70]
+    index = StaticSortedIndex(keys)
+    print("Keys:", keys)
+    print("Eytzinger layout:", index._tree.tolist()[1:])
+    print("find(50):", index.find(50), " find(35):", index.find(35))
+    print("lower_bound(35):", index.lower_bound(35), " lower_bound(99):", index.lower_bound(99))
+    print("search_many:", list(map(int, index.search_many([70, 10, 15]))))
+
+    # Latency against binary_search (use n = 10_000_000 or more for the full effect)
+    n = 1000000
+    big = list(range(0, 3 * n, 3))
+    index = StaticSortedIndex(big)
+    queries = [random.randrange(3 * n) for _ in range(100000)]
+
+    start = time.perf_counter()
+    expected = [binary_search(big, q) for q in queries]
+    print(f"\n{len(queries):,} lookups in {n:,} keys")
+    print(f"  binary_search:                 {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    answers = [index.find(q) for q in queries]
+    print(f"  StaticSortedIndex.find:        {time.perf_counter() - start:.3f}s  same: {answers == expected}")
+
+    start = time.perf_counter()
+    batched = index.search_many(queries)
+    print(f"  StaticSortedIndex.search_many: {time.perf_counter() - start:.3f}s  "
+          f"same: {list(map(int, batched)) == expected}")
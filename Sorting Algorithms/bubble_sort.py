@@ -1,4 +1,21 @@
-def bubble_sort(arr):
+def _bubble_sort_pairs(keys, items, n):
+    """
+    Bubble sort keys ascending, swapping items[j] along with keys[j].
+
+    Only strictly out-of-order neighbours are swapped, so the sort is stable.
+    """
+    for i in range(n):
+        swapped = False
+        for j in range(0, n-i-1):
+            if keys[j] > keys[j+1]:
+                keys[j], keys[j+1] = keys[j+1], keys[j]
+                items[j], items[j+1] = items[j+1], items[j]
+                swapped = True
+        if not swapped:
+            break
+
+
+def bubble_sort(arr, key=None, reverse=False):
     """
     Sort an array using the Bubble Sort algorithm.
 
@@ -6,8 +23,15 @@ def bubble_sort(arr):
     and swaps them if they're in the wrong order. This process is repeated
     until the list is sorted.
 
+    Only neighbours that are strictly out of order are swapped, so the sort
+    is stable: equal elements keep their original order.
+
     Args:
         arr (list): The array to sort (modified in-place)
+        key (callable): Function computing the sort key of an element, called
+            once per element (decorate-sort-undecorate) (default: None, sort
+            the elements themselves)
+        reverse (bool): Sort in descending order, still stable (default: False)
 
     Returns:
         list: The sorted array
@@ -17,13 +41,15 @@ def bubble_sort(arr):
         ValueError: If array contains non-comparable elements
 
     Time Complexity: O(n^2) - due to nested loops
-    Space Complexity: O(1) - sorts in-place
+    Space Complexity: O(1) - sorts in-place; O(n) with key or reverse (the list of keys)
 
     Examples:
         >>> bubble_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
         >>> bubble_sort([5, 2, 8, 1, 9])
         [1, 2, 5, 8, 9]
+        >>> bubble_sort(["bb", "a", "ccc"], key=len)
+        ['a', 'bb', 'ccc']
     """
     if not isinstance(arr, list):
         raise TypeError("Input must be a list")
@@ -33,6 +59,23 @@ def bubble_sort(arr):
 
     n = len(arr)  # Get the length of the array
 
+    if key is not None or reverse:
+        # Decorate: compute every key exactly once
+        keys = list(arr) if key is None else [key(x) for x in arr]
+
+        # Sorting the reversed list stably and reversing the result is a
+        # stable descending sort: equal keys end up in their original order
+        if reverse:
+            keys.reverse()
+            arr.reverse()
+        try:
+            _bubble_sort_pairs(keys, arr, n)
+        except TypeError as e:
+            raise ValueError(f"Array contains non-comparable elements: {e}")
+        if reverse:
+            arr.reverse()
+        return arr
+
     # Outer loop for n iterations (n elements in the array)
     for i in range(n):
         swapped = False  # Optimization: track if any swaps occurred
@@ -66,3 +109,8 @@ if __name__ == "__main__":
 
     # Test with empty array
     print("Empty array:", bubble_sort([]))
+
+    # Sorting records by a key
+    people = [("Alice", 30), ("Bob", 25), ("Dave", 30), ("Charlie", 25)]
+    print("\nBy age:", bubble_sort(people.copy(), key=lambda p: p[1]))
+    print("By age, oldest first:", bubble_sort(people.copy(), key=lambda p: p[1], reverse=True))
@@ -0,0 +1,175 @@
+"""
+Counting Sort: a non-comparison sort for integers in a small range.
+
+Instead of comparing elements, counting sort counts how many times each
+value occurs, then writes the values back out in order. When the values lie
+in a range of k possible values, this takes O(n + k) time, which beats any
+comparison sort's O(n log n) when k is not much larger than n.
+
+Negative numbers are handled by shifting every value down by the minimum,
+so the counts array only covers [minimum, maximum].
+
+NumPy is used when it is installed; otherwise the counts live in a compact
+array('q') buffer (8 bytes per slot instead of a list of Python ints).
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain Python is used instead
+    np = None
+
+# Keys must fit in a signed 64-bit integer to use the NumPy backend
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _check_integers(values):
+    """
+    Return (minimum, maximum) of values, checking they are all integers.
+
+    Raises:
+        TypeError: If any value is not an int
+    """
+    if not all(type(v) is int for v in values):
+        raise TypeError("Values must be integers")
+    return min(values), max(values)
+
+
+def _use_numpy(minimum, maximum):
+    """Return True if NumPy is available and the values fit in int64."""
+    return np is not None and minimum >= _INT64_MIN and maximum <= _INT64_MAX
+
+
+def counting_argsort(keys):
+    """
+    Return the stable sorting permutation of a list of integer keys.
+
+    order[i] is the index (into keys) of the element that belongs at
+    position i, and equal keys keep their original relative order. Use it to
+    sort any records by an integer key: [records[i] for i in order].
+
+    Args:
+        keys (list): Integer keys (negative values allowed)
+
+    Returns:
+        array.array or numpy.ndarray: The permutation as 64-bit indices
+            (a NumPy int64 array when NumPy is available)
+
+    Raises:
+        TypeError: If keys is not a list or holds non-integers
+
+    Time Complexity: O(n + k) where k = max(keys) - min(keys) + 1
+    Space Complexity: O(n + k)
+
+    Examples:
+        >>> counting_argsort([3, -1, 3, 0]).tolist()
+        [1, 3, 0, 2]
+    """
+    if not isinstance(keys, list):
+        raise TypeError("Keys must be a list")
+
+    n = len(keys)
+    if n == 0:
+        return np.empty(0, dtype=np.int64) if np is not None else array("q")
+
+    minimum, maximum = _check_integers(keys)
+
+    if _use_numpy(minimum, maximum):
+        shifted = np.array(keys, dtype=np.int64) - minimum
+        # With kind="stable", NumPy sorts 8- and 16-bit integers with a
+        # counting-based radix sort, so narrow the dtype when the range allows
+        if maximum - minimum < 2 ** 16:
+            shifted = shifted.astype(np.uint16)
+        return np.argsort(shifted, kind="stable")
+
+    # Count each key, then turn the counts into each key's first output slot
+    counts = array("q", bytes(8 * (maximum - minimum + 1)))
+    for k in keys:
+        counts[k - minimum] += 1
+
+    total = 0
+    for value, count in enumerate(counts):
+        counts[value] = total
+        total += count
+
+    # Place indices in input order, so equal keys stay in order (stable)
+    order = array("q", bytes(8 * n))
+    for index, k in enumerate(keys):
+        slot = counts[k - minimum]
+        order[slot] = index
+        counts[k - minimum] = slot + 1
+
+    return order
+
+
+def counting_sort(arr, key=None):
+    """
+    Sort integers (or records by an integer key) using Counting Sort.
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+        key (callable): Function returning an integer key for each element,
+            called once per element (default: None, sort the integers themselves)
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list, or the values/keys are not integers
+
+    Time Complexity: O(n + k) where k = max - min + 1
+    Space Complexity: O(n + k)
+
+    Examples:
+        >>> counting_sort([4, -2, 7, 4, 0])
+        [-2, 0, 4, 4, 7]
+        >>> counting_sort(["ccc", "a", "bb"], key=len)
+        ['a', 'bb', 'ccc']
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    if len(arr) < 2:
+        return arr
+
+    if key is not None:
+        # Sort a permutation by the keys, then apply it to the records
+        order = counting_argsort([key(x) for x in arr])
+        arr[:] = [arr[i] for i in order.tolist()]
+        return arr
+
+    minimum, maximum = _check_integers(arr)
+
+    if _use_numpy(minimum, maximum):
+        counts = np.bincount(np.array(arr, dtype=np.int64) - minimum)
+        arr[:] = np.repeat(np.arange(minimum, maximum + 1), counts).tolist()
+        return arr
+
+    counts = array("q", bytes(8 * (maximum - minimum + 1)))
+    for value in arr:
+        counts[value - minimum] += 1
+
+    # Write each value back out as many times as it was counted
+    position = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[position:position + count] = [minimum + offset] * count
+            position += count
+
+    return arr
+
+
+# Test
+if __name__ == "__main__":
+    arr = [4, -2, 7, 4, 0, -2, 9]
+    print("Original array:", arr.copy())
+    print("Sorted array:", counting_sort(arr))
+
+    # Sorting records by an integer key (stable: Bob stays before Dave)
+    people = [("Alice", 30), ("Bob", 25), ("Charlie", 35), ("Dave", 25)]
+    print("By age:", counting_sort(people, key=lambda p: p[1]))
+    print("Permutation:", counting_argsort([30, 25, 35, 25]).tolist())
+
+    print("Empty array:", counting_sort([]))
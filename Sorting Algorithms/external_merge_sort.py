@@ -0,0 +1,219 @@
+"""
+External (out-of-core) Merge Sort for files larger than memory.
+
+When the data does not fit in RAM, merge sort still works because merging
+only ever needs the front of each sorted run. The sort has two phases:
+
+    1. Run generation: read a memory-sized chunk of records, sort it in
+       memory (with merge_sort_bottom_up), and write it to a temporary file
+       as a sorted "run". Repeat until the input is used up.
+    2. Merging: repeatedly k-way merge up to fan_in runs into one longer
+       run, reading each run through a small buffer, until a single merge
+       can write the final output file.
+
+Records are fixed-width numbers stored back to back in little-endian byte
+order (e.g. 8-byte signed integers), the same compact format used for the
+temporary runs, so no parsing or text conversion is ever needed.
+
+Time Complexity: O(n log n) comparisons, plus
+    O(n * (1 + ceil(log_fan_in(runs)))) records read and written
+Space Complexity: O(memory_limit) in memory, O(n) on disk for the runs
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+
+from merge_sort import merge_sort_bottom_up
+
+# Typecodes of the array module that hold numbers (no 'u' unicode chars)
+NUMERIC_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+# Rough in-memory cost of one record while a run is being sorted: the
+# packed record, a pointer in a Python list, and the boxed int/float object
+_BYTES_PER_SORTED_RECORD = 48
+
+# Files are little-endian; swap bytes when this machine is not
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+
+def _read_records(file, typecode, count):
+    """Read up to count records from an open binary file as an array."""
+    records = array(typecode)
+    try:
+        records.fromfile(file, count)
+    except EOFError:
+        pass  # Fewer than count records were left; they were still read
+    if _NEEDS_BYTESWAP:
+        records.byteswap()
+    return records
+
+
+def _write_records(file, records):
+    """Write an array of records to an open binary file in little-endian order."""
+    if _NEEDS_BYTESWAP:
+        records = array(records.typecode, records)
+        records.byteswap()
+    records.tofile(file)
+
+
+def _run_reader(path, typecode, buffer_records):
+    """Yield the records of a run file one at a time, reading buffer_records at once."""
+    with open(path, "rb") as file:
+        while True:
+            block = _read_records(file, typecode, buffer_records)
+            if not block:
+                return
+            yield from block
+
+
+def _merge_files(paths, output_path, typecode, buffer_records, progress, total, done=0):
+    """
+    K-way merge the sorted run files into output_path using a heap.
+
+    done is the number of records already merged earlier in this pass, so
+    progress reports count up across all the merges of one pass.
+    Returns the updated count.
+    """
+    readers = [_run_reader(path, typecode, buffer_records) for path in paths]
+    written = done
+    with open(output_path, "wb") as output:
+        block = array(typecode)
+        # heapq.merge keeps a heap holding the current front record of each run
+        for value in heapq.merge(*readers):
+            block.append(value)
+            if len(block) >= buffer_records:
+                _write_records(output, block)
+                written += len(block)
+                block = array(typecode)
+                if progress is not None:
+                    progress("merge", written, total)
+        _write_records(output, block)
+        written += len(block)
+    if progress is not None:
+        progress("merge", written, total)
+    return written
+
+
+def external_merge_sort(input_path, output_path, typecode="q",
+                        memory_limit=64 * 1024 * 1024, fan_in=16,
+                        temp_dir=None, progress=None):
+    """
+    Sort a binary file of fixed-width little-endian numbers that may not fit in memory.
+
+    Args:
+        input_path (str): File of records to sort
+        output_path (str): Where to write the sorted records (same format)
+        typecode (str): array module typecode of one record, e.g. 'q' for
+            8-byte signed integers or 'd' for 8-byte floats (default: 'q')
+        memory_limit (int): Approximate memory budget in bytes (default: 64 MiB)
+        fan_in (int): Maximum number of runs merged at once (default: 16)
+        temp_dir (str): Directory for temporary run files (default: system temp dir)
+        progress (callable): Called as progress(phase, records_done, total_records)
+            with phase "run" while sorting chunks and "merge" while merging
+
+    Returns:
+        int: Number of records sorted
+
+    Raises:
+        TypeError: If typecode is not a numeric array typecode
+        ValueError: If memory_limit or fan_in is too small, or the input
+            size is not a whole number of records
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(memory_limit) memory, O(n) temporary disk space
+
+    Examples:
+        >>> external_merge_sort("numbers.bin", "sorted.bin", memory_limit=1 << 20)  # doctest: +SKIP
+        1000000
+    """
+    if typecode not in NUMERIC_TYPECODES:
+        raise TypeError(f"Typecode must be one of {' '.join(sorted(NUMERIC_TYPECODES))}")
+
+    if fan_in < 2:
+        raise ValueError("Fan-in must be at least 2")
+
+    itemsize = array(typecode).itemsize
+    file_size = os.path.getsize(input_path)
+    if file_size % itemsize:
+        raise ValueError(f"Input size is not a multiple of the {itemsize}-byte record size")
+    total = file_size // itemsize
+
+    run_records = memory_limit // _BYTES_PER_SORTED_RECORD
+    # During a merge, memory is split between one buffer per run and the output buffer
+    buffer_records = memory_limit // ((fan_in + 1) * itemsize)
+    if run_records < 1 or buffer_records < 1:
+        raise ValueError("Memory limit is too small")
+
+    runs = []
+    temp_files = []  # Every run file created, so all of them are removed even on error
+    try:
+        # Phase 1: sorted runs of at most run_records records each
+        done = 0
+        with open(input_path, "rb") as source:
+            while True:
+                chunk = _read_records(source, typecode, run_records)
+                if not chunk:
+                    break
+                values = chunk.tolist()
+                merge_sort_bottom_up(values)
+
+                handle, path = tempfile.mkstemp(prefix="run-", suffix=".bin", dir=temp_dir)
+                temp_files.append(path)
+                runs.append(path)
+                with os.fdopen(handle, "wb") as run_file:
+                    _write_records(run_file, array(typecode, values))
+
+                done += len(values)
+                if progress is not None:
+                    progress("run", done, total)
+
+        # Phase 2: merge fan_in runs at a time until one merge can finish the job
+        while len(runs) > fan_in:
+            merged_runs = []
+            done = 0
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                handle, path = tempfile.mkstemp(prefix="run-", suffix=".bin", dir=temp_dir)
+                os.close(handle)
+                temp_files.append(path)
+                merged_runs.append(path)
+                done = _merge_files(group, path, typecode, buffer_records, progress, total, done)
+                for old in group:
+                    os.remove(old)
+            runs = merged_runs
+
+        _merge_files(runs, output_path, typecode, buffer_records, progress, total)
+    finally:
+        for path in temp_files:
+            if os.path.exists(path):
+                os.remove(path)
+
+    return total
+
+
+# Test
+if __name__ == "__main__":
+    import random
+
+    with tempfile.TemporaryDirectory() as workdir:
+        input_path = os.path.join(workdir, "numbers.bin")
+        output_path = os.path.join(workdir, "sorted.bin")
+
+        data = array("q", (random.randint(-10**12, 10**12) for _ in range(200000)))
+        with open(input_path, "wb") as f:
+            _write_records(f, data)
+
+        def report(phase, done, total):
+            if done == total:  # Only show the end of each phase or pass
+                print(f"  {phase:<5} finished: {done:,} / {total:,} records")
+
+        # A tiny memory limit forces many runs and more than one merge pass
+        count = external_merge_sort(input_path, output_path, memory_limit=256 * 1024,
+                                    fan_in=4, progress=report)
+
+        with open(output_path, "rb") as f:
+            result = _read_records(f, "q", count)
+        print(f"Sorted {count:,} records, correct: {result.tolist() == sorted(data)}")
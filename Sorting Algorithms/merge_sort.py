@@ -1,12 +1,54 @@
-def merge_sort(arr):
+from bisect import bisect_left, bisect_right
+
+
+def _merge_sort_pairs(keys, items):
+    """
+    Stable merge sort of keys, moving items[i] along with keys[i].
+
+    Used by merge_sort when a key function is given, so each key is
+    computed once up front instead of on every comparison.
+    """
+    if len(keys) > 1:
+        mid = len(keys) // 2
+        left_keys, right_keys = keys[:mid], keys[mid:]
+        left_items, right_items = items[:mid], items[mid:]
+
+        _merge_sort_pairs(left_keys, left_items)
+        _merge_sort_pairs(right_keys, right_items)
+
+        i = j = k = 0
+        while i < len(left_keys) and j < len(right_keys):
+            if right_keys[j] < left_keys[i]:  # Take from the right only if strictly smaller (stable)
+                keys[k] = right_keys[j]
+                items[k] = right_items[j]
+                j += 1
+            else:
+                keys[k] = left_keys[i]
+                items[k] = left_items[i]
+                i += 1
+            k += 1
+
+        # At most one of these has anything left
+        keys[k:] = left_keys[i:] + right_keys[j:]
+        items[k:] = left_items[i:] + right_items[j:]
+
+
+def merge_sort(arr, key=None, reverse=False):
     """
     Sort an array using the Merge Sort algorithm.
 
     Merge Sort is a divide-and-conquer algorithm that divides the input array
     into two halves, recursively sorts them, and then merges the sorted halves.
 
+    The sort is stable: elements that compare equal keep their original order,
+    so sorting by one field and then by another gives a multi-field order.
+
     Args:
         arr (list): The array to sort (modified in-place)
+        key (callable): Function computing the sort key of an element, called
+            once per element (decorate-sort-undecorate) (default: None, sort
+            the elements themselves)
+        reverse (bool): Sort in descending order, still stable (default: False)
 
     Returns:
         list: The sorted array
@@ -23,10 +65,29 @@ def merge_sort(arr):
         [3, 9, 10, 27, 38, 43, 82]
         >>> merge_sort([5, 2, 8, 1, 9])
         [1, 2, 5, 8, 9]
+        >>> merge_sort(["bb", "a", "ccc", "dd"], key=len, reverse=True)
+        ['ccc', 'bb', 'dd', 'a']
     """
     if not isinstance(arr, list):
         raise TypeError("Input must be a list")
 
+    if key is not None or reverse:
+        # Decorate: compute every key exactly once
+        keys = list(arr) if key is None else [key(x) for x in arr]
+
+        # Sorting the reversed list stably and reversing the result is a
+        # stable descending sort: equal keys end up in their original order
+        if reverse:
+            keys.reverse()
+            arr.reverse()
+        try:
+            _merge_sort_pairs(keys, arr)  # Sort: moves the elements along with their keys
+        except TypeError as e:
+            raise ValueError(f"Array contains non-comparable elements: {e}")
+        if reverse:
+            arr.reverse()
+        return arr
+
     if len(arr) > 1:  # Only proceed if the array has more than 1 element
         mid = len(arr) // 2  # Find the middle index of the array
         left_half = arr[:mid]  # Split the array into the left half
@@ -40,7 +101,7 @@ def merge_sort(arr):
         # Merge the sorted left and right halves
         try:
             while i < len(left_half) and j < len(right_half):  # Compare elements in both halves
-                if left_half[i] < right_half[j]:  # If element in left_half is smaller
+                if left_half[i] <= right_half[j]:  # If element in left_half is smaller or equal (keeps the sort stable)
                     arr[k] = left_half[i]  # Place it in the correct position of the original array
                     i += 1  # Move to the next element in left_half
                 else:  # If element in right_half is smaller
@@ -65,6 +126,346 @@ def merge_sort(arr):
     return arr  # Return the sorted array
 
 
+def _insertion_sort(arr, low, high):
+    """
+    Sort arr[low:high] in place with insertion sort (stable).
+
+    Insertion sort does very little work per element, so on short runs it
+    beats merge sort's bookkeeping.
+
+    Time Complexity: O(k^2) for k = high - low, O(k) if already sorted
+    Space Complexity: O(1)
+    """
+    for i in range(low + 1, high):
+        current = arr[i]
+        j = i - 1
+        # Shift larger elements one place right to open a gap for current
+        while j >= low and arr[j] > current:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = current
+
+
+def merge_sort_bottom_up(arr, run_size=32):
+    """
+    Sort an array using an iterative (bottom-up) hybrid Merge Sort.
+
+    Instead of splitting recursively, this version starts from the bottom:
+    it sorts small runs of run_size elements with insertion sort, then
+    merges neighbouring runs into runs twice as long, pass after pass,
+    until one run covers the whole array.
+
+    Compared with merge_sort it:
+        - uses no recursion
+        - allocates one scratch buffer up front instead of two new lists
+          at every level of recursion
+        - skips a merge entirely when the two runs are already in order
+          (the last element of the left run <= the first of the right run)
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+        run_size (int): Length of the runs sorted by insertion sort (default: 32)
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If array contains non-comparable elements or run_size is not positive
+
+    Time Complexity: O(n log n), O(n) when the input is already sorted
+    Space Complexity: O(n) - one scratch buffer
+
+    Examples:
+        >>> merge_sort_bottom_up([38, 27, 43, 3, 9, 82, 10])
+        [3, 9, 10, 27, 38, 43, 82]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    if run_size <= 0:
+        raise ValueError("Run size must be positive")
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    try:
+        # Step 1: sort each small run in place
+        for low in range(0, n, run_size):
+            _insertion_sort(arr, low, min(low + run_size, n))
+
+        # Step 2: merge pairs of runs, doubling the run width each pass.
+        # Only the left run is copied out; the merge writes back into arr
+        # from the left, never overtaking the unread part of the right run.
+        scratch = [None] * n
+        width = run_size
+        while width < n:
+            for low in range(0, n - width, 2 * width):
+                mid = low + width
+                high = min(low + 2 * width, n)
+
+                if not arr[mid] < arr[mid - 1]:
+                    continue  # Runs already in order: nothing to merge
+
+                left_length = mid - low
+                scratch[:left_length] = arr[low:mid]
+
+                i, j, k = 0, mid, low  # Indices into scratch, right run, and output
+                while i < left_length and j < high:
+                    if arr[j] < scratch[i]:  # Take from the right only if strictly smaller (stable)
+                        arr[k] = arr[j]
+                        j += 1
+                    else:
+                        arr[k] = scratch[i]
+                        i += 1
+                    k += 1
+
+                # Leftover left elements go at the end; leftover right ones are already in place
+                arr[k:k + left_length - i] = scratch[i:left_length]
+            width *= 2
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements: {e}")
+
+    return arr
+
+
+# Consecutive wins by one side that switch a merge into galloping mode
+MIN_GALLOP = 7
+
+
+def _min_run_length(n):
+    """
+    Choose the minimum run length for adaptive_merge_sort (between 32 and 64).
+
+    The value is picked so that n / minrun is a power of two or a little
+    less, which keeps the final merges balanced.
+    """
+    remainder = 0
+    while n >= 64:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def _count_run(arr, low, n):
+    """
+    Find the run starting at low and return its length.
+
+    A run is either non-descending (a[i] <= a[i+1]) or strictly descending
+    (a[i] > a[i+1]). Descending runs are reversed in place; they must be
+    strict so reversing them never reorders equal elements (stability).
+    """
+    high = low + 1
+    if high == n:
+        return 1
+
+    if arr[high] < arr[low]:  # Strictly descending
+        while high + 1 < n and arr[high + 1] < arr[high]:
+            high += 1
+        arr[low:high + 1] = arr[low:high + 1][::-1]
+    else:  # Non-descending
+        while high + 1 < n and not arr[high + 1] < arr[high]:
+            high += 1
+
+    return high + 1 - low
+
+
+def _binary_insertion_sort(arr, low, high, start):
+    """
+    Sort arr[low:high] in place, given that arr[low:start] is already sorted.
+
+    Binary search finds each insertion point with O(log k) comparisons, and
+    the slice assignment shifts the elements in one C-level move.
+    """
+    for i in range(start, high):
+        current = arr[i]
+        position = bisect_right(arr, current, low, i)  # After equal elements (stable)
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = current
+
+
+def _gallop_right(key, a, start, end):
+    """
+    Return the first index in a[start:end] whose element is greater than key.
+
+    Galloping checks positions start+1, +2, +4, +8, ... until it overshoots,
+    then binary searches only the last gap. Finding a position k steps away
+    costs O(log k) comparisons instead of O(log n).
+    """
+    if start == end or key < a[start]:
+        return start
+    low, step = start, 1  # Invariant: a[low] <= key
+    while low + step < end and not key < a[low + step]:
+        low += step
+        step *= 2
+    return bisect_right(a, key, low + 1, min(low + step, end))
+
+
+def _gallop_left(key, a, start, end):
+    """
+    Return the first index in a[start:end] whose element is not less than key.
+
+    Same galloping search as _gallop_right, but equal elements stop it.
+    """
+    if start == end or not a[start] < key:
+        return start
+    low, step = start, 1  # Invariant: a[low] < key
+    while low + step < end and a[low + step] < key:
+        low += step
+        step *= 2
+    return bisect_left(a, key, low + 1, min(low + step, end))
+
+
+def _merge_runs(arr, low, mid, high):
+    """
+    Merge the sorted neighbouring runs arr[low:mid] and arr[mid:high] in place.
+
+    Elements already in their final place at either end are skipped first.
+    During the merge, once one side wins MIN_GALLOP comparisons in a row the
+    merge switches to galloping: it searches for how far that side keeps
+    winning and moves the whole stretch with one slice copy.
+    """
+    # Left elements <= the first right element are already in place
+    low = _gallop_right(arr[mid], arr, low, mid)
+    if low == mid:
+        return
+    # Right elements >= the last left element are already in place
+    high = _gallop_left(arr[mid - 1], arr, mid, high)
+
+    left = arr[low:mid]
+    left_length = len(left)
+    i, j, k = 0, mid, low  # Indices into left, the right run, and the output
+
+    while i < left_length and j < high:
+        # Linear mode: one comparison per element, counting each side's winning streak
+        left_wins = right_wins = 0
+        while i < left_length and j < high:
+            if arr[j] < left[i]:  # Take from the right only if strictly smaller (stable)
+                arr[k] = arr[j]
+                j += 1
+                right_wins += 1
+                left_wins = 0
+            else:
+                arr[k] = left[i]
+                i += 1
+                left_wins += 1
+                right_wins = 0
+            k += 1
+            if left_wins >= MIN_GALLOP or right_wins >= MIN_GALLOP:
+                break
+
+        # Galloping mode: move whole stretches while they stay long
+        while i < left_length and j < high:
+            end = _gallop_right(arr[j], left, i, left_length)
+            left_count = end - i
+            arr[k:k + left_count] = left[i:end]
+            k += left_count
+            i = end
+            if i == left_length:
+                break
+
+            end = _gallop_left(left[i], arr, j, high)
+            right_count = end - j
+            arr[k:k + right_count] = arr[j:end]
+            k += right_count
+            j = end
+
+            if left_count < MIN_GALLOP and right_count < MIN_GALLOP:
+                break  # Streaks got short again: galloping no longer pays off
+
+    # Leftover left elements fill the gap; leftover right ones are already in place
+    arr[k:k + left_length - i] = left[i:]
+
+
+def _merge_at(arr, runs, index):
+    """Merge runs[index] with runs[index + 1] and replace them on the stack."""
+    start, length = runs[index]
+    next_start, next_length = runs[index + 1]
+    _merge_runs(arr, start, next_start, next_start + next_length)
+    runs[index] = (start, length + next_length)
+    del runs[index + 1]
+
+
+def adaptive_merge_sort(arr):
+    """
+    Sort an array using an adaptive, natural-run Merge Sort (TimSort-style).
+
+    Real data often arrives partly sorted. Instead of blindly splitting the
+    array in half, this version:
+        1. Scans for runs that are already sorted (ascending, or strictly
+           descending, which are reversed in place).
+        2. Extends runs shorter than a minimum length (32-64) with binary
+           insertion sort.
+        3. Pushes runs on a stack and merges neighbours whenever the run
+           lengths stop shrinking fast enough (each run longer than the sum
+           of the two above it), which keeps merges balanced.
+        4. Gallops through a merge when one side keeps winning.
+
+    Already-sorted or reverse-sorted input is a single run, so it costs one
+    O(n) scan and no merging. Mostly-sorted input has a few long runs and
+    gets close to that.
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If array contains non-comparable elements
+
+    Time Complexity: O(n log n) worst case, O(n) for sorted or reversed input
+    Space Complexity: O(n) - temporary copy of the left run during a merge
+
+    Examples:
+        >>> adaptive_merge_sort([1, 2, 3, 10, 9, 8, 4, 5, 6])
+        [1, 2, 3, 4, 5, 6, 8, 9, 10]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    min_run = _min_run_length(n)
+    runs = []  # Stack of (start index, length) of pending sorted runs
+
+    try:
+        low = 0
+        while low < n:
+            length = _count_run(arr, low, n)
+            if length < min_run:
+                forced = min(min_run, n - low)
+                _binary_insertion_sort(arr, low, low + forced, low + length)
+                length = forced
+            runs.append((low, length))
+            low += length
+
+            # Restore the invariants: for the top runs X, Y, Z (Z on top),
+            # X > Y + Z and Y > Z. Checking one level deeper too avoids a
+            # known corner case where the invariant breaks further down.
+            while len(runs) > 1:
+                top = len(runs) - 2  # Merge runs[top] with runs[top + 1] by default
+                if ((top > 0 and runs[top - 1][1] <= runs[top][1] + runs[top + 1][1]) or
+                        (top > 1 and runs[top - 2][1] <= runs[top - 1][1] + runs[top][1])):
+                    if runs[top - 1][1] < runs[top + 1][1]:
+                        top -= 1  # Merge the smaller neighbour first
+                elif runs[top][1] > runs[top + 1][1]:
+                    break
+                _merge_at(arr, runs, top)
+
+        # Merge whatever is left on the stack, top down
+        while len(runs) > 1:
+            _merge_at(arr, runs, len(runs) - 2)
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements: {e}")
+
+    return arr
+
+
 # Test
 if __name__ == "__main__":
     arr = [38, 27, 43, 3, 9, 82, 10]
@@ -82,3 +483,37 @@ if __name__ == "__main__":
     # Test with empty and single element
     print("Empty array:", merge_sort([]))
     print("Single element:", merge_sort([42]))
+
+    # Sorting records by a key, and by several fields using stability
+    people = [("Alice", 30), ("Bob", 25), ("Dave", 30), ("Charlie", 25)]
+    print("\nBy age:", merge_sort(people.copy(), key=lambda p: p[1]))
+    print("By age, oldest first:", merge_sort(people.copy(), key=lambda p: p[1], reverse=True))
+    by_name = merge_sort(people.copy(), key=lambda p: p[0])
+    print("By age, then name:", merge_sort(by_name, key=lambda p: p[1]))
+
+    # Bottom-up hybrid version
+    print("\nBottom-up:", merge_sort_bottom_up([38, 27, 43, 3, 9, 82, 10]))
+
+    import random
+    import time
+
+    data = [random.randint(0, 10**6) for _ in range(200000)]
+    for sorter in (merge_sort, merge_sort_bottom_up):
+        copy = data.copy()
+        start = time.perf_counter()
+        sorter(copy)
+        elapsed = time.perf_counter() - start
+        print(f"{sorter.__name__:<22} {elapsed:.3f}s  correct: {copy == sorted(data)}")
+
+    # Adaptive version on nearly sorted input (an appended stream with small disorder)
+    print("\nAdaptive:", adaptive_merge_sort([1, 2, 3, 10, 9, 8, 4, 5, 6]))
+    nearly_sorted = list(range(200000))
+    for _ in range(200):
+        i, j = random.randrange(len(nearly_sorted)), random.randrange(len(nearly_sorted))
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    for sorter in (merge_sort, merge_sort_bottom_up, adaptive_merge_sort):
+        copy = nearly_sorted.copy()
+        start = time.perf_counter()
+        sorter(copy)
+        elapsed = time.perf_counter() - start
+        print(f"{sorter.__name__:<22} {elapsed:.3f}s  correct: {copy == sorted(nearly_sorted)}")
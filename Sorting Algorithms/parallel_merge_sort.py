@@ -0,0 +1,214 @@
+"""
+Parallel Merge Sort using several processes and shared memory.
+
+Python threads cannot sort in parallel (the GIL lets only one run Python
+code at a time), so this version uses worker processes. Copying (pickling)
+millions of numbers to each worker would cost more than the sort itself,
+so the numbers are written once into a block of shared memory that every
+worker can read and write directly.
+
+The sort runs in two parallel phases:
+    1. Each worker sorts one contiguous chunk of the shared buffer in place.
+    2. The value range is cut into one slice per worker using "splitter"
+       values. Each worker does a k-way heap merge of its value slice from
+       every sorted chunk and writes the result straight into its final
+       position in a shared output buffer.
+
+Because the merge itself is split between the workers, no single process
+has to touch all n elements after the chunks are sorted.
+
+Time Complexity: O((n log n) / p + n) with p workers (the final copy back is O(n))
+Space Complexity: O(n) - two shared buffers of 8 bytes per element
+"""
+
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from merge_sort import merge_sort_bottom_up
+
+# Below this many elements, starting processes costs more than it saves
+PARALLEL_THRESHOLD = 50000
+
+# Largest and smallest values that fit in a signed 64-bit integer ('q')
+_INT64_MAX = 2 ** 63 - 1
+_INT64_MIN = -2 ** 63
+
+
+def _typecode_for(arr):
+    """
+    Pick the array typecode for arr: 'q' for 64-bit ints, 'd' for floats.
+
+    Raises:
+        TypeError: If arr mixes types or holds anything but ints or floats
+        ValueError: If an int does not fit in 64 bits
+    """
+    if all(type(x) is int for x in arr):
+        if min(arr) < _INT64_MIN or max(arr) > _INT64_MAX:
+            raise ValueError("Integers must fit in 64 bits")
+        return "q"
+    if all(type(x) is float for x in arr):
+        return "d"
+    raise TypeError("parallel_merge_sort sorts lists of only ints or only floats")
+
+
+def _sort_chunk(shm_name, typecode, start, end):
+    """Worker: sort buffer[start:end] of the named shared memory block in place."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        chunk = view[start:end]
+        values = chunk.tolist()
+        merge_sort_bottom_up(values)
+        chunk[:] = array(typecode, values)
+        chunk.release()
+        view.release()
+    finally:
+        shm.close()
+
+
+def _merge_partition(in_name, out_name, typecode, ranges, out_start):
+    """
+    Worker: k-way merge the given (start, end) slices of the sorted chunks
+    in the input block, writing the result to the output block at out_start.
+    """
+    source = shared_memory.SharedMemory(name=in_name)
+    target = shared_memory.SharedMemory(name=out_name)
+    try:
+        in_view = source.buf.cast(typecode)
+        out_view = target.buf.cast(typecode)
+        slices = [in_view[start:end] for start, end in ranges if start < end]
+        # heapq.merge keeps a heap with the current head of each slice
+        merged = array(typecode, heapq.merge(*slices))
+        out_view[out_start:out_start + len(merged)] = merged
+        for piece in slices:
+            piece.release()
+        in_view.release()
+        out_view.release()
+    finally:
+        source.close()
+        target.close()
+
+
+def parallel_merge_sort(arr, workers=None):
+    """
+    Sort a list of ints or floats using several processes.
+
+    Args:
+        arr (list): The array to sort (modified in-place). All elements must
+            be ints that fit in 64 bits, or all must be floats.
+        workers (int): Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list or holds values other than ints/floats
+        ValueError: If workers is not positive or an int does not fit in 64 bits
+
+    Time Complexity: O((n log n) / p + n) with p workers
+    Space Complexity: O(n)
+
+    Examples:
+        >>> parallel_merge_sort([38, 27, 43, 3, 9, 82, 10], workers=2)
+        [3, 9, 10, 27, 38, 43, 82]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive")
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    typecode = _typecode_for(arr)
+
+    # Small inputs (or one worker) are faster to sort right here
+    if workers == 1 or n < PARALLEL_THRESHOLD:
+        return merge_sort_bottom_up(arr)
+
+    itemsize = array(typecode).itemsize
+    source = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    target = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    in_view = out_view = None
+    try:
+        in_view = source.buf.cast(typecode)
+        out_view = target.buf.cast(typecode)
+        in_view[:] = array(typecode, arr)
+
+        # Equal-sized contiguous chunks, one per worker
+        bounds = [n * i // workers for i in range(workers + 1)]
+        chunks = list(zip(bounds, bounds[1:]))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Phase 1: sort every chunk in place
+            futures = [pool.submit(_sort_chunk, source.name, typecode, start, end)
+                       for start, end in chunks]
+            for future in futures:
+                future.result()  # Re-raise any worker error
+
+            # Choose workers - 1 splitters from evenly spaced samples of the sorted chunks
+            samples = []
+            for start, end in chunks:
+                step = max(1, (end - start) // workers)
+                samples.extend(in_view[i] for i in range(start, end, step))
+            samples.sort()
+            splitters = [samples[len(samples) * i // workers] for i in range(1, workers)]
+
+            # Phase 2: partition p takes values in [splitter p-1, splitter p) from every chunk
+            cuts = [[start] + [bisect_left(in_view, s, start, end) for s in splitters] + [end]
+                    for start, end in chunks]
+            futures = []
+            out_start = 0
+            for p in range(workers):
+                ranges = [(cut[p], cut[p + 1]) for cut in cuts]
+                futures.append(pool.submit(_merge_partition, source.name, target.name,
+                                           typecode, ranges, out_start))
+                out_start += sum(end - start for start, end in ranges)
+            for future in futures:
+                future.result()
+
+        arr[:] = out_view.tolist()
+    finally:
+        # Views must be released before the shared memory can be closed
+        for view in (in_view, out_view):
+            if view is not None:
+                view.release()
+        source.close()
+        source.unlink()
+        target.close()
+        target.unlink()
+
+    return arr
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("Small:", parallel_merge_sort([38, 27, 43, 3, 9, 82, 10], workers=2))
+    print("Floats:", parallel_merge_sort([2.5, -1.0, 3.25, 0.0], workers=2))
+
+    data = [random.randint(-10**9, 10**9) for _ in range(500000)]
+    expected = sorted(data)
+
+    copy = data.copy()
+    start = time.perf_counter()
+    merge_sort_bottom_up(copy)
+    print(f"\nmerge_sort_bottom_up (1 process): {time.perf_counter() - start:.3f}s")
+
+    for workers in sorted({2, 4, os.cpu_count() or 1}):
+        copy = data.copy()
+        start = time.perf_counter()
+        parallel_merge_sort(copy, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"parallel_merge_sort ({workers} workers): {elapsed:.3f}s  correct: {copy == expected}")
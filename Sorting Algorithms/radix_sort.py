@@ -0,0 +1,227 @@
+"""
+LSD Radix Sort, plus integer_sort, which picks the best integer sort.
+
+Radix sort never compares two elements. It looks at the keys one digit at a
+time, starting from the least significant digit (LSD), and stably
+distributes the elements into one bucket per digit value. After the pass
+for the most significant digit, the elements are fully sorted: every pass
+orders by its digit and, being stable, keeps the order set by the lower
+digits for elements that tie.
+
+Here a "digit" is 8 bits (256 buckets) in plain Python, or 16 bits when
+NumPy is available. Negative keys are handled by subtracting the minimum,
+so every shifted key is >= 0.
+
+integer_sort chooses between counting sort (best when the range of values
+is small compared to n) and radix sort (best when the range is large).
+
+Time Complexity: O(d * (n + b)) for d digits of base b
+Space Complexity: O(n + b)
+"""
+
+from array import array
+from itertools import chain
+
+from counting_sort import _check_integers, _use_numpy, counting_argsort, counting_sort
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain Python is used instead
+    np = None
+
+RADIX_BITS = 8  # Digit size of the pure Python version (256 buckets)
+_NUMPY_RADIX_BITS = 16  # Digit size of the NumPy version (65536 buckets)
+
+
+def radix_argsort(keys):
+    """
+    Return the stable sorting permutation of a list of integer keys.
+
+    Args:
+        keys (list): Integer keys (negative values allowed)
+
+    Returns:
+        array.array or numpy.ndarray: order, where order[i] is the index of
+            the key that belongs at position i (a NumPy int64 array when
+            NumPy is available)
+
+    Raises:
+        TypeError: If keys is not a list or holds non-integers
+
+    Time Complexity: O(d * (n + 256)) where d = bytes needed for max - min
+    Space Complexity: O(n)
+
+    Examples:
+        >>> radix_argsort([300, -5, 300, 7]).tolist()
+        [1, 3, 0, 2]
+    """
+    if not isinstance(keys, list):
+        raise TypeError("Keys must be a list")
+
+    n = len(keys)
+    if n == 0:
+        return np.empty(0, dtype=np.int64) if np is not None else array("q")
+
+    minimum, maximum = _check_integers(keys)
+
+    if _use_numpy(minimum, maximum):
+        # Shifting by the minimum can exceed int64, so use unsigned 64-bit
+        shifted = (np.array(keys, dtype=np.int64).astype(np.uint64) - np.uint64(minimum % 2 ** 64))
+        order = np.arange(n)
+        for shift in range(0, (maximum - minimum).bit_length(), _NUMPY_RADIX_BITS):
+            digits = ((shifted[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+            # A stable sort of 16-bit values is a counting (radix) pass in NumPy
+            order = order[np.argsort(digits, kind="stable")]
+        return order
+
+    shifted = [k - minimum for k in keys]
+    order = range(n)
+    mask = (1 << RADIX_BITS) - 1
+    for shift in range(0, (maximum - minimum).bit_length(), RADIX_BITS):
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for index in order:  # Visiting in the current order keeps every pass stable
+            buckets[(shifted[index] >> shift) & mask].append(index)
+        order = list(chain.from_iterable(buckets))
+
+    return array("q", order)
+
+
+def radix_sort(arr, key=None):
+    """
+    Sort integers (or records by an integer key) using LSD Radix Sort.
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+        key (callable): Function returning an integer key for each element,
+            called once per element (default: None, sort the integers themselves)
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list, or the values/keys are not integers
+
+    Time Complexity: O(d * (n + 256)) where d = bytes needed for max - min
+    Space Complexity: O(n)
+
+    Examples:
+        >>> radix_sort([170, -45, 75, 90, 802, 24, 2, 66])
+        [-45, 2, 24, 66, 75, 90, 170, 802]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    if len(arr) < 2:
+        return arr
+
+    if key is not None:
+        # Sort a permutation by the keys, then apply it to the records
+        order = radix_argsort([key(x) for x in arr])
+        arr[:] = [arr[i] for i in order.tolist()]
+        return arr
+
+    minimum, maximum = _check_integers(arr)
+
+    if _use_numpy(minimum, maximum):
+        order = radix_argsort(arr)
+        arr[:] = [arr[i] for i in order.tolist()]
+        return arr
+
+    # Plain Python: distribute the values themselves, no index needed
+    values = [v - minimum for v in arr]
+    mask = (1 << RADIX_BITS) - 1
+    for shift in range(0, (maximum - minimum).bit_length(), RADIX_BITS):
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for v in values:
+            buckets[(v >> shift) & mask].append(v)
+        values = list(chain.from_iterable(buckets))
+
+    arr[:] = [v + minimum for v in values]
+    return arr
+
+
+def integer_sort(arr, key=None):
+    """
+    Sort integers (or records by an integer key), picking the best algorithm.
+
+    With n values spanning a range of k = max - min + 1:
+        - counting sort costs O(n + k), so it wins when k is at most a few times n
+        - radix sort costs O(n) per 8-bit digit of k, so it wins for wide ranges
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+        key (callable): Function returning an integer key for each element (default: None)
+
+    Returns:
+        list: The sorted array
+
+    Raises:
+        TypeError: If arr is not a list, or the values/keys are not integers
+
+    Time Complexity: O(n + min(k, n * log_256(k)))
+    Space Complexity: O(n + min(k, 256))
+
+    Examples:
+        >>> integer_sort([5, 3, 5, 1])
+        [1, 3, 5, 5]
+        >>> integer_sort([10**12, -7, 42])
+        [-7, 42, 1000000000000]
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    if len(arr) < 2:
+        return arr
+
+    keys = arr if key is None else [key(x) for x in arr]
+    minimum, maximum = _check_integers(keys)
+    value_range = maximum - minimum + 1
+
+    if value_range <= 2 * len(arr) + 256:
+        if key is None:
+            return counting_sort(arr)
+        order = counting_argsort(keys)
+    else:
+        if key is None:
+            return radix_sort(arr)
+        order = radix_argsort(keys)
+
+    # Apply the permutation to the records
+    arr[:] = [arr[i] for i in order.tolist()]
+    return arr
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    from merge_sort import merge_sort
+
+    arr = [170, -45, 75, 90, 802, 24, 2, 66]
+    print("Original array:", arr.copy())
+    print("Radix sorted:", radix_sort(arr))
+
+    people = [("Alice", 1700000300), ("Bob", 1700000100), ("Charlie", 1700000200)]
+    print("By timestamp:", integer_sort(people, key=lambda p: p[1]))
+
+    # Benchmarks against merge_sort
+    n = 200000
+    cases = {
+        "small range (0..1000)": [random.randint(0, 1000) for _ in range(n)],
+        "timestamps (2^31 range)": [random.randint(0, 2**31) for _ in range(n)],
+        "signed 64-bit": [random.randint(-2**63, 2**63 - 1) for _ in range(n)],
+    }
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"\n{n:,} integers ({backend} backend):")
+    for name, data in cases.items():
+        expected = sorted(data)
+        print(f"  {name}")
+        for sorter in (merge_sort, counting_sort, radix_sort, integer_sort):
+            if sorter is counting_sort and max(data) - min(data) > 10 * n:
+                continue  # Counting sort would need a count for every possible value
+            copy = data.copy()
+            start = time.perf_counter()
+            sorter(copy)
+            elapsed = time.perf_counter() - start
+            print(f"    {sorter.__name__:<14} {elapsed:.3f}s  correct: {copy == expected}")
@@ -0,0 +1,107 @@
+# Ciura's experimentally best gap sequence (for up to a few thousand elements)
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+
+
+def _gaps_for(n):
+    """
+    Return the Ciura gaps to use for n elements, largest first.
+
+    Beyond the published sequence, each further gap is 2.25 times the last.
+    """
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < n] or [1]
+
+
+def shell_sort(arr, return_stats=False):
+    """
+    Sort an array using the Shell Sort algorithm with Ciura's gap sequence.
+
+    Shell Sort is insertion sort over gapped sub-lists. For each gap g
+    (largest first), every element is insertion-sorted into the chain of
+    elements g, 2g, 3g, ... places before it. Large gaps move elements long
+    distances cheaply; the final gap of 1 is plain insertion sort, which is
+    fast because by then the array is almost sorted.
+
+    Like bubble sort it sorts in place with O(1) extra space, but runs in
+    sub-quadratic time in practice.
+
+    Args:
+        arr (list): The array to sort (modified in-place)
+        return_stats (bool): Also return the work counters (default: False)
+
+    Returns:
+        list: The sorted array, or (sorted array, stats) if return_stats is
+            True, where stats is a dict with the number of "comparisons",
+            "swaps" (elements shifted) and "passes" (one per gap)
+
+    Raises:
+        TypeError: If arr is not a list
+        ValueError: If array contains non-comparable elements
+
+    Time Complexity: about O(n^1.3) in practice with Ciura gaps (no proven bound)
+    Space Complexity: O(1) - sorts in-place
+
+    Examples:
+        >>> shell_sort([64, 34, 25, 12, 22, 11, 90])
+        [11, 12, 22, 25, 34, 64, 90]
+        >>> shell_sort([3, 1, 2], return_stats=True)
+        ([1, 2, 3], {'comparisons': 3, 'swaps': 2, 'passes': 1})
+    """
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    n = len(arr)
+    comparisons = swaps = passes = 0
+
+    # A single try around the whole sort costs nothing per comparison
+    try:
+        for gap in _gaps_for(n):
+            passes += 1
+            for i in range(gap, n):
+                current = arr[i]
+                j = i
+                # Shift larger elements of this gap chain right to open a slot for current
+                while j >= gap and arr[j - gap] > current:
+                    arr[j] = arr[j - gap]
+                    j -= gap
+                arr[j] = current
+                if return_stats:
+                    # Counted from where current landed, outside the inner loop
+                    shifted = (i - j) // gap
+                    swaps += shifted
+                    comparisons += shifted + (j >= gap)  # Plus the comparison that stopped it
+    except TypeError as e:
+        raise ValueError(f"Array contains non-comparable elements: {e}")
+
+    if return_stats:
+        return arr, {"comparisons": comparisons, "swaps": swaps, "passes": passes}
+    return arr
+
+
+# Test
+if __name__ == "__main__":
+    import random
+    import time
+
+    from bubble_sort import bubble_sort
+    from comb_sort import comb_sort
+
+    arr = [64, 34, 25, 12, 22, 11, 90]
+    print("Original array:", arr)
+    print("Sorted array:", shell_sort(arr.copy()))
+    print("Empty array:", shell_sort([]))
+
+    # Work counters and timings of the three in-place O(1)-space sorts
+    data = [random.randint(0, 10**6) for _ in range(3000)]
+    for sorter in (bubble_sort, comb_sort, shell_sort):
+        copy = data.copy()
+        start = time.perf_counter()
+        if sorter is bubble_sort:
+            sorter(copy)
+            stats = ""
+        else:
+            _, stats = sorter(copy, return_stats=True)
+        elapsed = time.perf_counter() - start
+        print(f"{sorter.__name__:<12} {elapsed:.3f}s  correct: {copy == sorted(data)}  {stats}")
@@ -0,0 +1,120 @@
+"""
+Regression tests for the modules outside exercises/.
+
+These cover bugs found in review, so they pass on a fresh copy of the repo
+and are not part of the practice exercises.
+"""
+
+import asyncio
+import os
+import sys
+from array import array
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Appended, not prepended: "Data Structures/queue.py" must not hide the standard library's queue
+for folder in ("Data Structures", "Searching Algorithms", "Sorting Algorithms"):
+    sys.path.append(os.path.join(ROOT, folder))
+
+from binary_search import interpolation_search  # noqa: E402
+from concurrent_queue import AsyncQueue, ConcurrentQueue  # noqa: E402
+from learned_index import LearnedIndex  # noqa: E402
+from external_merge_sort import external_merge_sort  # noqa: E402
+from mmap_search import SortedKeyFile  # noqa: E402
+from stacks import TypedStack  # noqa: E402
+
+
+# Data structures ------------------------------------------------------------
+@pytest.mark.parametrize("bad_batch", [[1, 2, "x"], [1, 2, 2 ** 70]])
+def test_typed_stack_push_many_bad_batch_changes_nothing(bad_batch):
+    s = TypedStack("q", track_min_max=True)
+    s.push(5)
+    with pytest.raises((TypeError, OverflowError)):
+        s.push_many(bad_batch)
+    assert list(s.stack) == [5]
+    assert s.current_min() == 5 and s.current_max() == 5
+    s.push_many(iter([7, 3]))
+    assert [s.pop(), s.pop(), s.pop()] == [3, 7, 5]
+
+
+@pytest.mark.parametrize("max_items", [0, -1])
+def test_concurrent_queues_reject_non_positive_max_items(max_items):
+    q = ConcurrentQueue(capacity=4)
+    q.put(1)
+    with pytest.raises(ValueError):
+        q.get_many(max_items)
+    assert q.get_many(5) == [1]
+
+    async def drain():
+        aq = AsyncQueue(capacity=4)
+        await aq.put(1)
+        with pytest.raises(ValueError):
+            await aq.get_many(max_items)
+        return await aq.get_many(5)
+
+    assert asyncio.run(drain()) == [1]
+
+
+# Searching ------------------------------------------------------------------
+def test_interpolation_search_values_whose_difference_rounds_to_zero():
+    # The two keys differ, but their float difference is 0.0
+    assert interpolation_search([float(2 ** 53), 2 ** 53 + 1], 2 ** 53 + 1) == 1
+    assert interpolation_search([float(2 ** 53), 2 ** 53 + 1], float(2 ** 53)) == 0
+
+
+def test_interpolation_search_huge_floats():
+    # 1e308 - (-1e308) overflows to inf, which made the estimate nan
+    arr = [-1e308, 0.0, 1e308]
+    assert interpolation_search(arr, 0.0) == 1
+    assert interpolation_search(arr, 1e308) == 2
+    assert interpolation_search(arr, 5.0) == -1
+
+
+def test_interpolation_find_huge_floats(tmp_path):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(array("d", [-1e308, 0.0, 1e308]).tobytes())
+    with SortedKeyFile(str(path), typecode="d") as keys:
+        assert keys.interpolation_find(0.0) == 1
+        assert keys.interpolation_find(1e308) == 2
+        assert keys.interpolation_find(5.0) == -1
+
+
+@pytest.mark.parametrize("typecode", ["", "bB", "qd", "l"])
+def test_sorted_key_file_rejects_bad_typecodes(tmp_path, typecode):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(array("q", [1, 2, 3]).tobytes())
+    with pytest.raises(TypeError):
+        SortedKeyFile(str(path), typecode=typecode)
+
+
+def test_sorted_key_file_record_accepts_negative_indices(tmp_path):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(array("q", [1, 2, 3]).tobytes())
+    with SortedKeyFile(str(path)) as keys:
+        assert bytes(keys.record(-1)) == bytes(keys.record(2))
+        assert keys[-1] == 3
+        with pytest.raises(IndexError):
+            keys.record(-4)
+
+
+@pytest.mark.parametrize("epsilon", [2.5, 2.0, "8", True])
+def test_learned_index_rejects_non_int_epsilon(epsilon):
+    with pytest.raises(TypeError):
+        LearnedIndex([1, 2, 3], epsilon=epsilon)
+
+
+# Sorting --------------------------------------------------------------------
+@pytest.mark.parametrize("typecode", ["", "fd", "u"])
+def test_external_merge_sort_rejects_bad_typecodes(tmp_path, typecode):
+    source = tmp_path / "in.bin"
+    source.write_bytes(array("q", [3, 1, 2]).tobytes())
+    with pytest.raises(TypeError, match="Typecode"):
+        external_merge_sort(str(source), str(tmp_path / "out.bin"), typecode=typecode)
+
+
+def test_external_merge_sort_sorts(tmp_path):
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(array("q", [3, -1, 2, 2]).tobytes())
+    assert external_merge_sort(str(source), str(target)) == 4
+    assert array("q", target.read_bytes()).tolist() == [-1, 2, 2, 3]